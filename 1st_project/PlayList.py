@@ -1,26 +1,46 @@
 """Playlist"""
 
+import io
+import os
+
 import pygame
-from linked_list import LinkedList
+from concurrent_linked_list import ConcurrentLinkedList
+from edit_journal import EditJournal
 from music_track import MusicTrack
+from play_order import PlayOrder
+from track_index import TrackSearchIndex
+from track_prefetcher import TrackPrefetcher
 
-class Playlist(LinkedList):
-    """Class representing a music playlist. Inherits from a doubly linked list, 
-    allowing for navigation through the tracks."""
+class Playlist(ConcurrentLinkedList):
+    """Class representing a music playlist. Inherits from a thread-safe 
+    doubly linked list, allowing for navigation through the tracks while 
+    the playlist is being edited."""
 
-    def __init__(self, data=None):
+    def __init__(self, data=None, metadata=None):
         """Initializes the playlist with optional data.
         
         Args:
             data: Optional initial data for the playlist, 
             can be None or a MusicTrack.
+            metadata (MetadataCache): Optional cache the search index 
+            takes track titles from.
         """
-        super().__init__(data)
+        # Tracks are hashable by path, so lookups by track are O(1)
+        super().__init__(data, indexed=True)
         self._current = None
+        self.prefetcher = TrackPrefetcher()
+        self.order = PlayOrder(self)
+        self.search_index = TrackSearchIndex(self, metadata)
+        self.journal = EditJournal(self)
 
     def play_all(self, track) -> MusicTrack:
         """Plays all tracks starting from the provided track.
         
+        The track is taken from the prefetch cache when it has already 
+        been read. The track the play order picks next is read ahead in 
+        the background, and outside shuffle mode so are the tracks around 
+        it in the playlist.
+        
         Args:
             track (MusicTrack): The track from which to start playing.
         
@@ -28,20 +48,30 @@ class Playlist(LinkedList):
             MusicTrack: The track that is currently playing.
         """
         self._current = track
-        pygame.mixer.music.load(self.current.path)
+        path = self.current.path
+        data = self.prefetcher.get(path)
+        pygame.mixer.music.load(io.BytesIO(data), os.path.splitext(path)[1][1:])
         pygame.mixer.music.play()
+        upcoming = self.order.peek(track)
+        if upcoming is not None:
+            self.prefetcher.schedule(upcoming.data.path)
+        if not self.order.shuffle:
+            self.prefetcher.prefetch_around(self, track)
 
     def next_track(self) -> MusicTrack:
         """Plays the next track in the playlist.
         
         If there is a next track in the list, 
-        it moves to that track and starts playing.
+        it moves to that track and starts playing. 
+        Queued tracks go first, then the ring or shuffle order.
         
         Returns:
             MusicTrack: The next track that is being played.
         """
         if self._current:
-            self.play_all(self._current.next)
+            track = self.order.next(self._current)
+            if track:
+                self.play_all(track)
 
     def previous_track(self) -> MusicTrack:
         """Plays the previous track in the playlist.
@@ -53,7 +83,9 @@ class Playlist(LinkedList):
             MusicTrack: The previous track that is being played.
         """
         if self._current:
-            self.play_all(self._current.prev)
+            track = self.order.previous(self._current)
+            if track:
+                self.play_all(track)
 
     @property
     def current(self):
@@ -0,0 +1,392 @@
+"""Array-backed Linked Ring List, used to compare storages in bench_storage"""
+
+from array import array
+
+
+class ArrayLinkedListItem:
+    """Lightweight handle to a slot of an `ArrayLinkedList`.
+
+    Handles are created on demand and only remember the owning list and
+    the slot index, so they cost nothing while the list is idle. A handle
+    becomes stale once its item is removed, as the slot may be reused.
+    """
+
+    __slots__ = ('_owner', 'index')
+
+    def __init__(self, owner, index: int):
+        """Initializes a handle to a slot.
+
+        Args:
+            owner (ArrayLinkedList): The list that holds the slot.
+            index (int): The index of the slot.
+        """
+        self._owner = owner
+        self.index = index
+
+    @property
+    def data(self):
+        """Gets the data stored in the slot.
+
+        Returns:
+            data: The data stored in the slot.
+        """
+        return self._owner._data[self.index]
+
+    @property
+    def next(self):
+        """Gets the next item in the list.
+
+        Returns:
+            ArrayLinkedListItem: The next item in the list.
+        """
+        return ArrayLinkedListItem(self._owner, self._owner._next[self.index])
+
+    @property
+    def prev(self):
+        """Gets the previous item in the list.
+
+        Returns:
+            ArrayLinkedListItem: The previous item in the list.
+        """
+        return ArrayLinkedListItem(self._owner, self._owner._prev[self.index])
+
+    def __eq__(self, other) -> bool:
+        """Checks if two handles point to the same slot of the same list.
+
+        Args:
+            other: Another handle.
+
+        Returns:
+            bool: True if both handles point to the same slot.
+        """
+        if isinstance(other, ArrayLinkedListItem):
+            return self._owner is other._owner and self.index == other.index
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Returns a hash consistent with `__eq__`.
+
+        Returns:
+            int: The hash of the slot.
+        """
+        return hash((id(self._owner), self.index))
+
+    def __repr__(self):
+        """Returns a string representation of the item.
+
+        Returns:
+            str: A string showing the item's data.
+        """
+        return f"Linked List Item, data: {self.data}"
+
+
+class ArrayLinkedList:
+    """Class representing a circular doubly linked list stored in arrays.
+
+    Items live in slots: `_data[i]` holds the data of slot `i`, while
+    `_next[i]` and `_prev[i]` hold the indices of its neighbours as
+    machine integers. Slots freed by removals are chained through `_next`
+    into a free list and reused by later insertions. There is one Python
+    object per item (the data itself) instead of a node object with
+    three references.
+
+    This is a storage experiment for `bench_storage.py`, not a drop-in
+    replacement for `LinkedList`: it only has the basic operations and
+    the node-handle ones the benchmark uses. There is no `splice`,
+    `extend`, `extend_left`, `from_iterable`, `node_at`, hash index or
+    change listeners, and handles are created on demand, so they cannot
+    be told apart by identity the way nodes are by `PlayOrder` and
+    `EditJournal`.
+    """
+
+    def __init__(self, data=None):
+        """Initializes the list with optional data.
+
+        Args:
+            data: Optional iterable of items to append.
+        """
+        self._data = []
+        self._next = array('q')
+        self._prev = array('q')
+        self._head = -1
+        self._free = -1
+        self._size = 0
+        if data is not None:
+            for item in data:
+                self.append_right(item)
+
+    def _allocate(self, item) -> int:
+        """Takes a slot from the free list or grows the arrays.
+
+        Args:
+            item: The data to store in the slot.
+
+        Returns:
+            int: The index of the slot.
+        """
+        if self._free != -1:
+            slot = self._free
+            self._free = self._next[slot]
+            self._data[slot] = item
+            return slot
+
+        self._data.append(item)
+        self._next.append(-1)
+        self._prev.append(-1)
+        return len(self._data) - 1
+
+    def _link_after(self, slot: int, previous: int):
+        """Links a slot into the ring right after `previous`.
+
+        Args:
+            slot (int): The slot to link.
+            previous (int): The slot after which to link, or -1
+            if the list is empty.
+        """
+        nxt, prv = self._next, self._prev
+        if previous == -1:
+            nxt[slot] = prv[slot] = slot
+            self._head = slot
+        else:
+            following = nxt[previous]
+            prv[slot] = previous
+            nxt[slot] = following
+            nxt[previous] = slot
+            prv[following] = slot
+        self._size += 1
+
+    def _unlink(self, slot: int):
+        """Unlinks a slot from the ring and puts it on the free list.
+
+        Args:
+            slot (int): The slot to unlink.
+        """
+        nxt, prv = self._next, self._prev
+        if self._size == 1:
+            self._head = -1
+        else:
+            previous, following = prv[slot], nxt[slot]
+            nxt[previous] = following
+            prv[following] = previous
+            if slot == self._head:
+                self._head = following
+        self._size -= 1
+        self._data[slot] = None
+        nxt[slot] = self._free
+        self._free = slot
+
+    def _find_slot(self, data) -> int:
+        """Finds the first slot, in list order, that holds the data.
+
+        Args:
+            data: The data to look for.
+
+        Returns:
+            int: The slot found, or -1 if there is none.
+        """
+        slot = self._head
+        for _ in range(self._size):
+            if self._data[slot] == data:
+                return slot
+            slot = self._next[slot]
+        return -1
+
+    def _handle(self, slot: int) -> ArrayLinkedListItem:
+        """Wraps a slot into a handle.
+
+        Args:
+            slot (int): The slot, or -1.
+
+        Returns:
+            ArrayLinkedListItem: The handle, or None for -1.
+        """
+        if slot == -1:
+            return None
+        return ArrayLinkedListItem(self, slot)
+
+    @property
+    def first_node(self) -> ArrayLinkedListItem:
+        """Gets the first item in the list.
+
+        Returns:
+            ArrayLinkedListItem: The first item, or None if the list is empty.
+        """
+        return self._handle(self._head)
+
+    @property
+    def last(self) -> ArrayLinkedListItem:
+        """Gets the last item in the list.
+
+        Returns:
+            ArrayLinkedListItem: The last item, or None if the list is empty.
+        """
+        if self._size == 0:
+            return None
+        return self._handle(self._prev[self._head])
+
+    def append(self, item):
+        """Appends an item to the right of the list.
+
+        Args:
+            item: The data to be stored in the new item.
+        """
+        return self.append_right(item)
+
+    def append_left(self, item):
+        """Appends an item to the left (beginning) of the list.
+
+        Args:
+            item: The data to be stored in the new item.
+        """
+        slot = self._allocate(item)
+        self._link_after(slot, self._prev[self._head] if self._size else -1)
+        self._head = slot
+
+    def append_right(self, item):
+        """Appends an item to the right (end) of the list.
+
+        Args:
+            item: The data to be stored in the new item.
+        """
+        slot = self._allocate(item)
+        self._link_after(slot, self._prev[self._head] if self._size else -1)
+
+    def remove(self, item):
+        """Removes an item by its data from the list.
+
+        Args:
+            item: The data to be removed from the list.
+
+        Raises:
+            ValueError: If the item is not found in the list.
+        """
+        slot = self._find_slot(item)
+        if slot == -1:
+            raise ValueError("Item not found")
+        self._unlink(slot)
+
+    def insert(self, previous_data, item):
+        """Inserts a new item after the item with the specified data.
+
+        Args:
+            previous_data: The data of the item after which to insert the new item.
+            item: The data to be stored in the new item.
+
+        Raises:
+            ValueError: If the item with `previous_data` is not found.
+        """
+        previous = self._find_slot(previous_data)
+        if previous == -1:
+            raise ValueError(f"Item {previous_data} not found in the list")
+        self._link_after(self._allocate(item), previous)
+
+    def remove_node(self, node: ArrayLinkedListItem):
+        """Removes the given item from the list in O(1).
+
+        Args:
+            node (ArrayLinkedListItem): A handle to an item of this list.
+        """
+        self._unlink(node.index)
+
+    def insert_after(self, node: ArrayLinkedListItem, item) -> ArrayLinkedListItem:
+        """Inserts a new item right after the given one in O(1).
+
+        Args:
+            node (ArrayLinkedListItem): A handle to an item of this list,
+            or None to insert at the beginning of the list.
+            item: The data to be stored in the new item.
+
+        Returns:
+            ArrayLinkedListItem: A handle to the new item.
+        """
+        slot = self._allocate(item)
+        if node is None:
+            self._link_after(slot, self._prev[self._head] if self._size else -1)
+            self._head = slot
+        else:
+            self._link_after(slot, node.index)
+        return ArrayLinkedListItem(self, slot)
+
+    def move_node(self, node: ArrayLinkedListItem, after: ArrayLinkedListItem = None):
+        """Moves an item so that it follows another item, in O(1).
+
+        Args:
+            node (ArrayLinkedListItem): The item to move.
+            after (ArrayLinkedListItem): The item after which to place
+            `node`, or None to make `node` the first item.
+        """
+        if after == node:
+            return
+        item = node.data
+        self._unlink(node.index)
+        # The freed slot is on top of the free list, so the item keeps it
+        self.insert_after(after, item)
+
+    def __len__(self):
+        """Returns the number of items in the list.
+
+        Returns:
+            int: The length of the list.
+        """
+        return self._size
+
+    def __iter__(self):
+        """Iterates over handles to the items of the list.
+
+        Yields:
+            ArrayLinkedListItem: The next item in the list.
+        """
+        slot = self._head
+        for _ in range(self._size):
+            yield ArrayLinkedListItem(self, slot)
+            slot = self._next[slot]
+
+    def __getitem__(self, index):
+        """Gets the item by its index.
+
+        Args:
+            index (int): The index of the item to retrieve.
+
+        Returns:
+            data: The data stored in the item at the specified index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index = self._size + index
+        if index < 0 or index >= self._size:
+            raise IndexError("Linked List index out of range")
+        slot = self._head
+        if index <= self._size // 2:
+            for _ in range(index):
+                slot = self._next[slot]
+        else:
+            slot = self._prev[slot]
+            for _ in range(self._size - 1 - index):
+                slot = self._prev[slot]
+        return self._data[slot]
+
+    def __contains__(self, item):
+        """Checks if the list contains the specified item by data.
+
+        Args:
+            item: The data to check for in the list.
+
+        Returns:
+            bool: True if the item is in the list, False otherwise.
+        """
+        return self._find_slot(item) != -1
+
+    def __reversed__(self):
+        """Iterates over the data of the list in reverse order.
+
+        Yields:
+            data: The data of the next item from the end.
+        """
+        if self._size == 0:
+            return
+        slot = self._prev[self._head]
+        for _ in range(self._size):
+            yield self._data[slot]
+            slot = self._prev[slot]
@@ -0,0 +1,261 @@
+"""Scaling benchmark of the linked list operations with baseline comparison"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from concurrent_linked_list import ConcurrentLinkedList
+from linked_list import LinkedList
+from music_track import MusicTrack
+
+# Each implementation is a factory of an empty list and a factory of the
+# stored item for a number. 'playlist' mirrors the storage of `Playlist`
+# (an indexed concurrent list of tracks) without starting its players.
+IMPLEMENTATIONS = {
+    'list': (LinkedList, int),
+    'indexed': (lambda: LinkedList(indexed=True), int),
+    'playlist': (lambda: ConcurrentLinkedList(indexed=True),
+                 lambda number: MusicTrack(f'/music/{number}.mp3')),
+}
+
+OPERATIONS = ('append', 'iterate', 'reversed', 'getitem', 'insert', 'remove')
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+def _timed_batches(step, arguments, budget: float) -> float:
+    """Runs `step` on the arguments in doubling batches until the time
+    budget or the arguments run out.
+
+    Only the calls are timed, not the preparation of the batches, so
+    operations whose cost grows with the list still finish quickly.
+
+    Args:
+        step: A callable taking one argument.
+        arguments: An iterator of arguments.
+        budget (float): The time in seconds to spend at most (roughly).
+
+    Returns:
+        float: The number of calls per second.
+    """
+    done = 0
+    elapsed = 0.0
+    batch_size = 1
+    while elapsed < budget:
+        batch = [argument for _, argument in zip(range(batch_size), arguments)]
+        if not batch:
+            break
+        start = time.perf_counter()
+        for argument in batch:
+            step(argument)
+        elapsed += time.perf_counter() - start
+        done += len(batch)
+        batch_size *= 2
+    return done / elapsed if elapsed else 0.0
+
+
+def _best_rate(run_once, count: int, budget: float, repeat: int = 3) -> float:
+    """Repeats a whole-list pass and returns its best speed.
+
+    The pass is run at least `repeat` times and then until the time
+    budget is spent, which keeps small sizes from being all noise.
+
+    Args:
+        run_once: A callable doing `count` operations.
+        count (int): The number of operations in one pass.
+        budget (float): The time in seconds to spend at most (roughly).
+        repeat (int): The minimal number of passes.
+
+    Returns:
+        float: The best number of operations per second.
+    """
+    best = 0.0
+    spent = 0.0
+    runs = 0
+    while runs < repeat or spent < budget:
+        start = time.perf_counter()
+        run_once()
+        elapsed = time.perf_counter() - start
+        if elapsed:
+            best = max(best, count / elapsed)
+        spent += elapsed
+        runs += 1
+    return best
+
+
+def measure(name: str, size: int, budget: float = 0.5, seed: int = 0) -> dict:
+    """Measures every operation of one implementation at one size.
+
+    Args:
+        name (str): The key of the implementation in `IMPLEMENTATIONS`.
+        size (int): The number of items in the list.
+        budget (float): The time in seconds to spend on each operation
+        (roughly; a whole-list pass is never cut short).
+        seed (int): The seed of the random positions and items.
+
+    Returns:
+        dict: Operations per second for each of `OPERATIONS` and the
+        peak memory of building the list in bytes.
+    """
+    factory, make_item = IMPLEMENTATIONS[name]
+    rng = random.Random(seed)
+    items = [make_item(number) for number in range(size)]
+    result = {}
+
+    tracemalloc.start()
+    linked_list = factory()
+    for item in items:
+        linked_list.append(item)
+    _, result['peak_memory'] = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del linked_list
+
+    def build():
+        built = factory()
+        for item in items:
+            built.append(item)
+        return built
+
+    def walk(iterable):
+        for _ in iterable:
+            pass
+
+    result['append'] = _best_rate(build, size, budget)
+    linked_list = build()
+    result['iterate'] = _best_rate(lambda: walk(linked_list), size, budget)
+    result['reversed'] = _best_rate(lambda: walk(reversed(linked_list)), size, budget)
+
+    result['getitem'] = _timed_batches(
+        linked_list.__getitem__,
+        (rng.randrange(size) for _ in range(size)),
+        budget,
+    )
+
+    fresh = iter(range(size, 2 * size))
+    result['insert'] = _timed_batches(
+        lambda previous: linked_list.insert(previous, make_item(next(fresh))),
+        (items[rng.randrange(size)] for _ in range(size)),
+        budget,
+    )
+
+    # Only the original items are removed, each once, and at most half
+    # of them, so the list does not shrink to nothing while measured.
+    victims = rng.sample(items, size // 2 or 1)
+    result['remove'] = _timed_batches(linked_list.remove, iter(victims), budget)
+    return result
+
+
+def run(names, sizes, budget: float = 0.5, seed: int = 0) -> dict:
+    """Measures the given implementations at the given sizes.
+
+    Returns:
+        dict: The results in the format written by `save`.
+    """
+    results = {}
+    for name in names:
+        results[name] = {}
+        for size in sizes:
+            results[name][str(size)] = measure(name, size, budget, seed)
+    return {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'budget': budget,
+        'results': results,
+    }
+
+
+def save(report: dict, path: str):
+    """Writes a report to a JSON file."""
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+
+
+def load(path: str) -> dict:
+    """Reads a report from a JSON file."""
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def compare(report: dict, baseline: dict, threshold: float = 0.2) -> list:
+    """Finds the measurements that got worse than in the baseline.
+
+    Speeds regress when they drop below `1 - threshold` of the baseline,
+    memory when it grows above `1 + threshold`. Measurements missing
+    from either report are skipped.
+
+    Args:
+        report (dict): The new results.
+        baseline (dict): The saved results to compare against.
+        threshold (float): The tolerated relative change.
+
+    Returns:
+        list: Tuples of the implementation, the size, the measurement,
+        the baseline value and the new value.
+    """
+    regressions = []
+    for name, sizes in report['results'].items():
+        for size, values in sizes.items():
+            old_values = baseline['results'].get(name, {}).get(size, {})
+            for key, new in values.items():
+                old = old_values.get(key)
+                if not old:
+                    continue
+                if key == 'peak_memory':
+                    worse = new > old * (1 + threshold)
+                else:
+                    worse = new < old * (1 - threshold)
+                if worse:
+                    regressions.append((name, size, key, old, new))
+    return regressions
+
+
+def print_report(report: dict, baseline: dict = None):
+    """Prints a report as a table, with ratios to the baseline if given."""
+    header = f"{'impl':<9} {'size':>8}" + ''.join(f" {key:>14}" for key in OPERATIONS)
+    print(header + f" {'peak KiB':>14}")
+    for name, sizes in report['results'].items():
+        for size, values in sizes.items():
+            old_values = (baseline or {'results': {}})['results'].get(name, {}).get(size, {})
+            cells = []
+            for key in OPERATIONS + ('peak_memory',):
+                value = values[key]
+                text = f"{value / 1024:.0f}" if key == 'peak_memory' else f"{value:.3g}"
+                if old_values.get(key):
+                    text += f"/{value / old_values[key]:.2f}"
+                cells.append(f" {text:>14}")
+            print(f"{name:<9} {size:>8}" + ''.join(cells))
+
+
+def parse_args():
+    """Parses command line arguments."""
+    parser = argparse.ArgumentParser(description="Linked list scaling benchmark.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="List sizes to measure.")
+    parser.add_argument('--implementations', nargs='+', default=list(IMPLEMENTATIONS),
+                        choices=list(IMPLEMENTATIONS), help="Lists to measure.")
+    parser.add_argument('--budget', type=float, default=0.5,
+                        help="Seconds spent on each operation.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Write the results to this JSON file.")
+    parser.add_argument('--baseline', help="Compare with the results in this JSON file.")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Tolerated relative change against the baseline.")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    new_report = run(args.implementations, args.sizes, args.budget, args.seed)
+    baseline_report = load(args.baseline) if args.baseline else None
+    print_report(new_report, baseline_report)
+    if args.output:
+        save(new_report, args.output)
+    if baseline_report is not None:
+        found = compare(new_report, baseline_report, args.threshold)
+        for impl, n, measurement, before, after in found:
+            print(f"regression: {impl} size={n} {measurement}: {before:.4g} -> {after:.4g}")
+        sys.exit(1 if found else 0)
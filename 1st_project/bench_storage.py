@@ -0,0 +1,77 @@
+"""Memory and throughput comparison of the linked list storages"""
+
+import argparse
+import time
+import tracemalloc
+
+from array_linked_list import ArrayLinkedList
+from linked_list import LinkedList
+
+IMPLEMENTATIONS = {
+    'nodes': LinkedList,
+    'arrays': ArrayLinkedList,
+}
+
+
+def measure(factory, size: int) -> dict:
+    """Measures one storage on a ring of the given size.
+
+    Args:
+        factory: The list class to measure.
+        size (int): The number of items to append.
+
+    Returns:
+        dict: Memory held by the ring in bytes and timings in seconds.
+    """
+    data = list(range(size))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    linked_list = factory()
+    for item in data:
+        linked_list.append(item)
+    append_time = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in linked_list:
+        pass
+    iterate_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in reversed(linked_list):
+        pass
+    reversed_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    while len(linked_list):
+        linked_list.remove_node(linked_list.first_node)
+    remove_time = time.perf_counter() - start
+
+    return {
+        'memory': memory,
+        'append': append_time,
+        'iterate': iterate_time,
+        'reversed': reversed_time,
+        'remove': remove_time,
+    }
+
+
+def parse_args():
+    """Parses command line arguments."""
+    parser = argparse.ArgumentParser(description="Linked list storage benchmark.")
+    parser.add_argument('--size', type=int, default=1_000_000,
+                        help="Number of items in the ring.")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    print(f"{'storage':<8} {'MiB':>8} {'append':>8} {'iterate':>8} "
+          f"{'reversed':>8} {'remove':>8}")
+    for name, factory in IMPLEMENTATIONS.items():
+        result = measure(factory, args.size)
+        print(f"{name:<8} {result['memory'] / 2 ** 20:>8.1f} "
+              f"{result['append']:>8.3f} {result['iterate']:>8.3f} "
+              f"{result['reversed']:>8.3f} {result['remove']:>8.3f}")
@@ -0,0 +1,230 @@
+"""Thread-safe Linked Ring List"""
+
+import threading
+from functools import wraps
+
+from linked_list import LinkedList
+from linked_list_item import LinkedListItem
+
+
+def _locked(method):
+    """Wraps a method so that it runs under the list's lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class ConcurrentLinkedListItem(LinkedListItem):
+    """Item of a `ConcurrentLinkedList` that knows whether it was removed."""
+
+    __slots__ = ('removed',)
+
+    def __init__(self, data=None):
+        """Initializes the item with optional data.
+
+        Args:
+            data: The value or object to store in the item.
+        """
+        super().__init__(data)
+        self.removed = False
+
+
+class ConcurrentLinkedList(LinkedList):
+    """Circular doubly linked list that may be shared between threads.
+
+    Every operation holds the list lock only for its own O(1) relinking
+    (or, without the hash index, for the scan of a by-value lookup).
+    Traversals take the lock once per step, never for a whole lap, so a
+    playback thread can walk the ring while the UI edits it.
+
+    Removed nodes are flagged and keep their links. A walker standing on
+    a removed node follows those links until it gets back into the ring,
+    so it never ends up on a dangling node. Iteration is weakly
+    consistent: it sees each item at most once per lap and may or may
+    not see changes made after it started.
+    """
+
+    node_class = ConcurrentLinkedListItem
+
+    def __init__(self, first_node: ConcurrentLinkedListItem = None,
+                 indexed: bool = False):
+        """Initializes the list with the first item.
+
+        Args:
+            first_node (ConcurrentLinkedListItem): The first item in the
+            list, or None for an empty list.
+            indexed (bool): Whether to keep a hash index from data to nodes.
+        """
+        self._lock = threading.RLock()
+        super().__init__(first_node, indexed)
+
+    def _link_after(self, node, previous, head=False):
+        """Links a node and marks it as present in the ring."""
+        node.removed = False
+        super()._link_after(node, previous, head)
+
+    def _unlink(self, node):
+        """Unlinks a node and marks it as removed."""
+        super()._unlink(node)
+        node.removed = True
+
+    def _live_after(self, node, step: str):
+        """Finds the closest item in the ring past a node.
+
+        Must be called with the lock held.
+
+        Args:
+            node (ConcurrentLinkedListItem): The node to start from;
+            it may have been removed already.
+            step (str): '_next' or '_prev', the direction to go.
+
+        Returns:
+            ConcurrentLinkedListItem: The item found, or None if the
+            list is empty.
+        """
+        if self._size == 0:
+            return None
+        cur = getattr(node, step)
+        while cur.removed:
+            following = getattr(cur, step)
+            if following is cur:
+                # The node was the last one in a list that has been emptied
+                return self.first_node
+            cur = following
+        return cur
+
+    def successor(self, node: ConcurrentLinkedListItem) -> ConcurrentLinkedListItem:
+        """Returns the item that follows a node in the ring.
+
+        Args:
+            node (ConcurrentLinkedListItem): The node to start from,
+            possibly already removed.
+
+        Returns:
+            ConcurrentLinkedListItem: The next item, or None if the list
+            is empty.
+        """
+        with self._lock:
+            return self._live_after(node, '_next')
+
+    def predecessor(self, node: ConcurrentLinkedListItem) -> ConcurrentLinkedListItem:
+        """Returns the item that precedes a node in the ring.
+
+        Args:
+            node (ConcurrentLinkedListItem): The node to start from,
+            possibly already removed.
+
+        Returns:
+            ConcurrentLinkedListItem: The previous item, or None if the
+            list is empty.
+        """
+        with self._lock:
+            return self._live_after(node, '_prev')
+
+    def _check_live(self, *nodes):
+        """Raises ValueError if any of the given nodes has been removed."""
+        for node in nodes:
+            if node is not None and node.removed:
+                raise ValueError("Item not found")
+
+    @_locked
+    def remove_node(self, node):
+        """Removes the given node; raises ValueError if it is already gone."""
+        self._check_live(node)
+        super().remove_node(node)
+
+    @_locked
+    def insert_after(self, node, item):
+        """Inserts after the given node; raises ValueError if it is gone."""
+        self._check_live(node)
+        return super().insert_after(node, item)
+
+    @_locked
+    def move_node(self, node, after=None):
+        """Moves the given node; raises ValueError if either node is gone."""
+        self._check_live(node, after)
+        super().move_node(node, after)
+
+    @_locked
+    def splice(self, other, after_node=None):
+        """Moves all items of another list, which must not be in use, here."""
+        if not issubclass(other.node_class, self.node_class):
+            raise TypeError("Can only splice lists with compatible nodes")
+        self._check_live(after_node)
+        super().splice(other, after_node)
+
+    @_locked
+    def relink_nodes(self, nodes, after=None):
+        """Links removed nodes back in; raises ValueError if `after` is
+        gone or one of the nodes is still in the list."""
+        self._check_live(after)
+        if not all(node.removed for node in nodes):
+            raise ValueError("Item is already in the list")
+        for node in nodes:
+            node.removed = False
+        super().relink_nodes(nodes, after)
+
+    def extend(self, iterable):
+        """Appends all the data; the nodes are built outside the lock."""
+        first, count = self._build_ring(iterable)
+        if count:
+            with self._lock:
+                self._link_ring(first, count, self.last)
+
+    def extend_left(self, iterable):
+        """Prepends all the data; the nodes are built outside the lock."""
+        first, count = self._build_ring(iterable)
+        if count:
+            with self._lock:
+                self._link_ring(first, count, self.last, head=True)
+
+    append_left = _locked(LinkedList.append_left)
+    append_right = _locked(LinkedList.append_right)
+    remove = _locked(LinkedList.remove)
+    insert = _locked(LinkedList.insert)
+    node_at = _locked(LinkedList.node_at)
+    check_consistency = _locked(LinkedList.check_consistency)
+    __contains__ = _locked(LinkedList.__contains__)
+
+    @property
+    def last(self):
+        """Gets the last item in the list."""
+        with self._lock:
+            return super().last
+
+    def __iter__(self):
+        """Iterates over the nodes of the list, one lap around the ring.
+
+        The lock is taken for each step only. The walk ends when it gets
+        back to the item it started from or to the current first item.
+
+        Yields:
+            ConcurrentLinkedListItem: The next item in the list.
+        """
+        with self._lock:
+            start = cur = self.first_node
+        while cur is not None:
+            yield cur
+            with self._lock:
+                cur = self._live_after(cur, '_next')
+                if cur is start or cur is self.first_node:
+                    return
+
+    def __reversed__(self):
+        """Iterates over the data of the list in reverse order, one lap.
+
+        Yields:
+            data: The data of the next item from the end.
+        """
+        with self._lock:
+            if self._size == 0:
+                return
+            start = cur = self.first_node._prev
+        while cur is not None:
+            yield cur.data
+            with self._lock:
+                cur = self._live_after(cur, '_prev')
+                if cur is start or cur is None or cur is self.first_node._prev:
+                    return
@@ -0,0 +1,130 @@
+"""Undo/redo journal of linked list edits"""
+
+from collections import deque
+
+
+class EditJournal:
+    """Bounded undo/redo history of the edits of a linked list.
+
+    The journal listens to the list and records every change together
+    with the node handles involved and the node each one followed, so
+    undoing or redoing an edit only relinks those nodes: O(1) per node,
+    without searching by value or copying the list. Removed nodes are
+    relinked rather than recreated, so views, indexes and play queues
+    holding them stay valid. A removal directly followed by the insertion
+    of the same node (what `move_node` does) is recorded as one move.
+
+    Entries are tuples: ('insert', nodes, after), ('remove', node, after)
+    and ('move', node, old_after, new_after), where `after` is the node
+    preceding the edited ones, or None when they are at the beginning.
+    Every edit must go through the list while the journal is attached.
+    Splicing counts as removals from the source list and one insertion
+    into the target one, so it is only undone correctly from the target:
+    undoing the removals in the source would relink nodes that now
+    belong to the target, so clear the source's journal after a splice.
+    """
+
+    def __init__(self, linked_list, depth: int = 100):
+        """Initializes an empty journal and subscribes to the list.
+
+        Args:
+            linked_list (LinkedList): The list to record.
+            depth (int): The maximal number of edits kept for undo.
+        """
+        self._list = linked_list
+        self._undo = deque(maxlen=depth)
+        self._redo = deque(maxlen=depth)
+        self._replaying = False
+        linked_list.add_listener(self._on_change)
+
+    @property
+    def can_undo(self) -> bool:
+        """Whether there is an edit to undo."""
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Whether there is an undone edit to redo."""
+        return bool(self._redo)
+
+    def clear(self):
+        """Forgets the whole history."""
+        self._undo.clear()
+        self._redo.clear()
+
+    def peek_undo(self):
+        """Returns the entry `undo` would revert, or None."""
+        return self._undo[-1] if self._undo else None
+
+    def peek_redo(self):
+        """Returns the entry `redo` would repeat, or None."""
+        return self._redo[-1] if self._redo else None
+
+    def _after(self, node):
+        """Returns the node preceding a node, or None if it is the first."""
+        if node is self._list.first_node:
+            return None
+        return node._prev  # pylint: disable=W0212
+
+    def _on_change(self, event: str, node, count: int):
+        """Records a change of the list."""
+        if self._replaying:
+            return
+        self._redo.clear()
+        if event == 'remove':
+            self._undo.append(('remove', node, self._after(node)))
+            return
+
+        last = self._undo[-1] if self._undo else None
+        if count == 1 and last is not None and last[0] == 'remove' and last[1] is node:
+            self._undo[-1] = ('move', node, last[2], self._after(node))
+            return
+        nodes = []
+        for _ in range(count):
+            nodes.append(node)
+            node = node._next  # pylint: disable=W0212
+        self._undo.append(('insert', nodes, self._after(nodes[0])))
+
+    def _apply(self, entry, reverse: bool):
+        """Performs an entry, or its inverse if `reverse` is set."""
+        kind = entry[0]
+        self._replaying = True
+        try:
+            if kind == 'move':
+                _, node, old_after, new_after = entry
+                self._list.move_node(node, old_after if reverse else new_after)
+            elif (kind == 'insert') == reverse:
+                nodes = entry[1] if kind == 'insert' else [entry[1]]
+                for node in reversed(nodes):
+                    self._list.remove_node(node)
+            else:
+                nodes = entry[1] if kind == 'insert' else [entry[1]]
+                self._list.relink_nodes(nodes, entry[2])
+        finally:
+            self._replaying = False
+
+    def undo(self) -> bool:
+        """Reverts the latest recorded edit.
+
+        Returns:
+            bool: Whether there was an edit to undo.
+        """
+        if not self._undo:
+            return False
+        entry = self._undo.pop()
+        self._apply(entry, reverse=True)
+        self._redo.append(entry)
+        return True
+
+    def redo(self) -> bool:
+        """Repeats the latest undone edit.
+
+        Returns:
+            bool: Whether there was an edit to redo.
+        """
+        if not self._redo:
+            return False
+        entry = self._redo.pop()
+        self._apply(entry, reverse=False)
+        self._undo.append(entry)
+        return True
@@ -3,15 +3,243 @@
 from linked_list_item import LinkedListItem
 
 class LinkedList:
-    """Class representing a circular doubly linked list."""
+    """Class representing a circular doubly linked list.
 
-    def __init__(self, first_node: LinkedListItem):
+    The number of items is cached in `_size` and kept up to date by the
+    `_link_after` and `_unlink` helpers, which every mutating method goes
+    through, so `len()` is O(1). Those helpers relink nodes through their
+    raw `_next`/`_prev` slots rather than the `next`/`prev` properties.
+
+    Optionally the list keeps a hash index from data to the nodes holding 
+    it, which makes `in`, `remove` and `insert` O(1) for hashable data.
+
+    Listeners registered with `add_listener` are told about every node 
+    that enters or leaves the ring, so views and indexes built on top of 
+    the list can follow it without rescanning.
+
+    Positional access remembers the last visited node and its index (the
+    "finger") and walks from whichever of the head, the tail or the finger
+    is closest, so sequential indexing is O(1) per step. Any mutation
+    drops the finger.
+    """
+
+    # When enabled, every mutation re-counts the ring and compares the
+    # result with the cached size. Meant to be switched on by tests.
+    debug = False
+
+    # The class of the nodes created by the list; subclasses may extend it
+    node_class = LinkedListItem
+
+    def __init__(self, first_node: LinkedListItem = None, indexed: bool = False):
         """Initializes the doubly linked list with the first item.
         
         Args:
             first_node (LinkedListItem): The first item in the list.
+            Can be None for an empty list or the head of an already 
+            linked ring, in which case the ring is counted once.
+            indexed (bool): Whether to keep a hash index from data to 
+            nodes. All stored data must then be hashable and must not 
+            change its hash while in the list.
         """
         self.first_node = first_node
+        self._size = self._count_nodes()
+        self._finger = None
+        self._listeners = []
+        self._index = None
+        if indexed:
+            self._index = {}
+            cur = self.first_node
+            for _ in range(self._size):
+                self._index.setdefault(cur.data, []).append(cur)
+                cur = cur.next
+
+    def _count_nodes(self) -> int:
+        """Counts the items by walking the ring.
+        
+        Returns:
+            int: The number of items reachable from `first_node`.
+        """
+        if not self.first_node:
+            return 0
+
+        cnt = 0
+        first = cur = self.first_node
+        while True:
+            cnt += 1
+            cur = cur._next
+            if cur is first:
+                break
+
+        return cnt
+
+    def check_consistency(self):
+        """Checks that the cached size matches the actual ring.
+        
+        Raises:
+            AssertionError: If the cached size is out of sync.
+        """
+        actual = self._count_nodes()
+        if actual != self._size:
+            raise AssertionError(
+                f"Cached size {self._size} does not match ring size {actual}"
+            )
+        if self._index is not None:
+            indexed = sum(len(nodes) for nodes in self._index.values())
+            if indexed != self._size:
+                raise AssertionError(
+                    f"Index holds {indexed} nodes, ring holds {self._size}"
+                )
+
+    def _find_node(self, data) -> LinkedListItem:
+        """Finds the first node, in list order, that holds the data.
+        
+        Args:
+            data: The data to look for.
+        
+        Returns:
+            LinkedListItem: The node found, or None if there is none.
+        """
+        if self._index is not None:
+            nodes = self._index.get(data)
+            if not nodes:
+                return None
+            if len(nodes) == 1:
+                return nodes[0]
+            # Several equal items: the earliest one in the ring wins
+            candidates = {id(node) for node in nodes}
+            cur = self.first_node
+            while id(cur) not in candidates:
+                cur = cur.next
+            return cur
+
+        cur = self.first_node
+        for _ in range(self._size):
+            if cur.data == data:
+                return cur
+            cur = cur.next
+        return None
+
+    def add_listener(self, listener):
+        """Subscribes to changes of the list.
+        
+        The listener is called as `listener(event, node, count)`, where 
+        `event` is 'insert' right after `count` consecutive nodes starting 
+        at `node` have been linked into the ring, or 'remove' right before 
+        `node` is unlinked (`count` is then 1). Moving a node produces a 
+        'remove' followed by an 'insert'.
+        
+        Args:
+            listener: The callable to notify.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Unsubscribes a listener added with `add_listener`.
+        
+        Args:
+            listener: The callable to stop notifying.
+        """
+        self._listeners.remove(listener)
+
+    def _notify(self, event: str, node: LinkedListItem, count: int = 1):
+        """Calls every listener with the event."""
+        for listener in self._listeners:
+            listener(event, node, count)
+
+    def _link_after(self, node: LinkedListItem, previous: LinkedListItem,
+                    head: bool = False):
+        """Links a detached node into the ring right after `previous`.
+        
+        Args:
+            node (LinkedListItem): The node to link.
+            previous (LinkedListItem): The node after which to link, 
+            or None if the list is empty.
+            head (bool): Whether the node becomes the first item.
+        """
+        if previous is None:
+            # If the list is empty, the first item points to itself
+            node._next = node._prev = node
+            self.first_node = node
+        else:
+            following = previous._next
+            node._prev = previous
+            node._next = following
+            previous._next = node
+            following._prev = node
+            if head:
+                self.first_node = node
+        self._size += 1
+        self._finger = None
+        if self._index is not None:
+            self._index.setdefault(node.data, []).append(node)
+        if self.debug:
+            self.check_consistency()
+        if self._listeners:
+            self._notify('insert', node)
+
+    def _link_ring(self, first: LinkedListItem, count: int,
+                   previous: LinkedListItem, head: bool = False):
+        """Links a whole detached ring into this one right after `previous`.
+        
+        Only the four boundary pointers change, whatever the ring size.
+        
+        Args:
+            first (LinkedListItem): The first node of the ring to link.
+            count (int): The number of nodes in that ring.
+            previous (LinkedListItem): The node after which to link, 
+            or None if the list is empty.
+            head (bool): Whether `first` becomes the first item.
+        """
+        if previous is None or head:
+            self.first_node = first
+        if previous is not None:
+            last = first._prev
+            following = previous._next
+            previous._next = first
+            first._prev = previous
+            last._next = following
+            following._prev = last
+        self._size += count
+        self._finger = None
+        if self._index is not None:
+            cur = first
+            for _ in range(count):
+                self._index.setdefault(cur.data, []).append(cur)
+                cur = cur._next
+        if self.debug:
+            self.check_consistency()
+        if self._listeners:
+            self._notify('insert', first, count)
+
+    def _unlink(self, node: LinkedListItem):
+        """Unlinks a node from the ring.
+        
+        Args:
+            node (LinkedListItem): The node to unlink.
+        """
+        if self._listeners:
+            self._notify('remove', node)
+        if self._size == 1:
+            # If there's only one item, the list becomes empty
+            self.first_node = None
+        else:
+            # Remove the item by linking its previous and next items.
+            # The node keeps its own links, so it can be relinked later
+            previous, following = node._prev, node._next
+            previous._next = following
+            following._prev = previous
+            if node is self.first_node:
+                self.first_node = following
+        self._size -= 1
+        self._finger = None
+        if self._index is not None:
+            nodes = self._index[node.data]
+            if len(nodes) == 1:
+                del self._index[node.data]
+            else:
+                nodes.remove(node)
+        if self.debug:
+            self.check_consistency()
 
     @property
     def last(self) -> LinkedListItem:
@@ -20,7 +248,7 @@ class LinkedList:
         Returns:
             LinkedListItem: The last item in the list.
         """
-        if len(self) == 0:
+        if self._size == 0:
             return None
         return self.first_node.prev
 
@@ -40,18 +268,9 @@ class LinkedList:
         Args:
             item: The data to be stored in the new item.
         """
-        if len(self) == 0:
-            # If the list is empty, the first item points to itself
-            self.first_node = LinkedListItem(item)
-            self.first_node.next = self.first_node
-            self.first_node.prev = self.first_node
-            return
-
-        # Create a new item and link it to the left of the current first item
-        new_item = LinkedListItem(item)
-        new_item.prev = self.first_node.prev
-        new_item.next = self.first_node
-        self.first_node = new_item
+        # Link a new item after the last one and make it the first
+        new_item = self.node_class(item)
+        self._link_after(new_item, self.last, head=True)
 
     def append_right(self, item):
         """Appends an item to the right (end) of the list.
@@ -59,17 +278,8 @@ class LinkedList:
         Args:
             item: The data to be stored in the new item.
         """
-        if len(self) == 0:
-            # If the list is empty, the first item points to itself
-            self.first_node = LinkedListItem(item)
-            self.first_node.next = self.first_node
-            self.first_node.prev = self.first_node
-            return
-
         # Create a new item and link it to the right of the last item
-        new_item = LinkedListItem(item)
-        self.first_node.prev.next = new_item
-        self.first_node.prev = new_item
+        self._link_after(self.node_class(item), self.last)
 
     def remove(self, item):
         """Removes an item by its data from the list.
@@ -80,24 +290,10 @@ class LinkedList:
         Raises:
             ValueError: If the item is not found in the list.
         """
-        if item not in self:
+        node = self._find_node(item)
+        if node is None:
             raise ValueError("Item not found")
-
-        cur = self.first_node
-        while True:
-            if cur.data == item:
-                if len(self) == 1:
-                    # If there's only one item, the list becomes empty
-                    self.first_node = None
-                    return
-
-                # Remove the item by linking its previous and next items
-                cur.next.prev = cur.prev
-                cur.prev.next = cur.next
-                if cur == self.first_node:
-                    self.first_node = cur.next
-                break
-            cur = cur.next
+        self._unlink(node)
 
     def insert(self, previous_data, item):
         """Inserts a new item after the item with the specified data.
@@ -109,63 +305,242 @@ class LinkedList:
         Raises:
             ValueError: If the item with `previous_data` is not found.
         """
-        new = LinkedListItem(item)
-        cur = self.first_node
-        for _ in range(len(self)):
-            if cur.data == previous_data:
-                # Insert the new item after the current one
-                new.next = cur.next
-                new.prev = cur
-                cur.next = new
-                return
-            cur = cur.next
-        raise ValueError(f"Item {previous_data} not found in the list")
+        cur = self._find_node(previous_data)
+        if cur is None:
+            raise ValueError(f"Item {previous_data} not found in the list")
+        # Insert the new item after the current one
+        self._link_after(self.node_class(item), cur)
 
-    def __len__(self):
-        """Returns the number of items in the list.
+    @classmethod
+    def from_iterable(cls, iterable, *args, **kwargs):
+        """Builds a list from an iterable in a single pass.
+        
+        Args:
+            iterable: The data to store, in order.
+            *args, **kwargs: Passed on to the constructor.
         
         Returns:
-            int: The length of the list.
+            LinkedList: The new list.
         """
-        if not self.first_node:
-            return 0
+        linked_list = cls(*args, **kwargs)
+        linked_list.extend(iterable)
+        return linked_list
 
-        cnt = 0
-        cur = self.first_node
-        while True:
-            cnt += 1
-            cur = cur.next
-            if cur == self.first_node:
-                break
+    def _build_ring(self, iterable):
+        """Links new nodes for the data into a detached ring.
+        
+        Args:
+            iterable: The data to store, in order.
+        
+        Returns:
+            tuple: The first node of the ring (None if there is no data) 
+            and the number of nodes.
+        """
+        first = last = None
+        count = 0
+        for item in iterable:
+            node = self.node_class(item)
+            if last is None:
+                first = node
+            else:
+                last._next = node
+                node._prev = last
+            last = node
+            count += 1
+        if first is not None:
+            last._next = first
+            first._prev = last
+        return first, count
 
-        return cnt
+    def extend(self, iterable):
+        """Appends all the data to the right (end) of the list.
+        
+        Args:
+            iterable: The data to store, in order.
+        """
+        first, count = self._build_ring(iterable)
+        if count:
+            self._link_ring(first, count, self.last)
+
+    def extend_left(self, iterable):
+        """Prepends all the data to the left (beginning) of the list.
+        
+        Unlike `collections.deque.extendleft`, the data keeps its order.
+        
+        Args:
+            iterable: The data to store, in order.
+        """
+        first, count = self._build_ring(iterable)
+        if count:
+            self._link_ring(first, count, self.last, head=True)
 
-    def __next__(self):
-        """Returns the next item during iteration.
+    def remove_node(self, node: LinkedListItem):
+        """Removes the given node from the list in O(1).
+        
+        Args:
+            node (LinkedListItem): A node that belongs to this list.
+        """
+        self._unlink(node)
+
+    def insert_after(self, node: LinkedListItem, item) -> LinkedListItem:
+        """Inserts a new item right after the given node in O(1).
+        
+        Args:
+            node (LinkedListItem): A node that belongs to this list, 
+            or None to insert at the beginning of the list.
+            item: The data to be stored in the new item.
         
         Returns:
-            LinkedListItem: The next item in the iteration.
+            LinkedListItem: The newly created node.
+        """
+        new_item = self.node_class(item)
+        if node is None:
+            self._link_after(new_item, self.last, head=True)
+        else:
+            self._link_after(new_item, node)
+        return new_item
+
+    def move_node(self, node: LinkedListItem, after: LinkedListItem = None):
+        """Moves a node so that it follows another node, in O(1).
+        
+        Args:
+            node (LinkedListItem): The node to move.
+            after (LinkedListItem): The node after which to place `node`, 
+            or None to make `node` the first item.
+        """
+        if after is node:
+            return
+        self._unlink(node)
+        if after is None:
+            self._link_after(node, self.last, head=True)
+        else:
+            self._link_after(node, after)
+
+    def splice(self, other, after_node: LinkedListItem = None):
+        """Moves all items of another list into this one.
+        
+        The rings are relinked in O(1); only the hash index, if this 
+        list keeps one, and the listeners of the other list need a pass 
+        over the moved items. Those listeners get a 'remove' for every 
+        moved node, from the last to the first, as if the other list was 
+        emptied from its end. The other list is left empty.
+        
+        Args:
+            other (LinkedList): The list whose items are moved.
+            after_node (LinkedListItem): The node after which to place 
+            the items, or None to append them at the end.
         
         Raises:
-            StopIteration: If there are no more items.
+            ValueError: If `other` is this very list.
+        """
+        if other is self:
+            raise ValueError("Cannot splice a list into itself")
+        if other._size == 0:
+            return
+
+        first, count = other.first_node, other._size
+        if other._listeners:
+            node = first._prev
+            for _ in range(count):
+                other._notify('remove', node)
+                node = node._prev
+        if after_node is None:
+            after_node = self.last
+        self._link_ring(first, count, after_node)
+
+        other.first_node = None
+        other._size = 0
+        other._finger = None
+        if other._index is not None:
+            other._index = {}
+
+    def relink_nodes(self, nodes, after: LinkedListItem = None):
+        """Links nodes removed from this list back in, keeping their order.
+        
+        The nodes are chained into a ring and linked in one step, so
+        listeners get a single 'insert' for the whole run. This is how
+        removals are undone without allocating new nodes, which keeps
+        every handle held by views and indexes valid.
+        
+        Args:
+            nodes: A sequence of nodes that are not in the list.
+            after (LinkedListItem): The node after which to place the
+            nodes, or None to make the first of them the first item.
         """
-        if self._cnt >= len(self):
-            raise StopIteration
+        if not nodes:
+            return
+        previous = nodes[-1]
+        for node in nodes:
+            node._prev = previous
+            previous._next = node
+            previous = node
+        if after is None:
+            self._link_ring(nodes[0], len(nodes), self.last, head=True)
+        else:
+            self._link_ring(nodes[0], len(nodes), after)
 
-        self._cnt += 1
-        cur_item = self._cur
-        self._cur = self._cur.next
-        return cur_item
+    def __len__(self):
+        """Returns the number of items in the list.
+        
+        Returns:
+            int: The length of the list.
+        """
+        return self._size
 
     def __iter__(self):
-        """Initializes the iterator and returns itself.
+        """Iterates over the nodes of the list.
+        
+        Every call returns an independent generator, so nested loops 
+        and several simultaneous walks do not interfere. The list must 
+        not be modified while it is being iterated.
+        
+        Yields:
+            LinkedListItem: The next item in the list.
+        """
+        cur = self.first_node
+        for _ in range(self._size):
+            yield cur
+            cur = cur._next
+
+    def node_at(self, index) -> LinkedListItem:
+        """Gets the node by its index.
+        
+        Walks from the closest of the head, the tail and the node 
+        visited by the previous positional access.
+        
+        Args:
+            index (int): The index of the node to retrieve.
         
         Returns:
-            DoublyLinkedList: The list itself for iteration.
+            LinkedListItem: The node at the specified index.
+        
+        Raises:
+            IndexError: If the index is out of range.
         """
-        self._cur = self.first_node
-        self._cnt = 0
-        return self
+        size = self._size
+        if index < 0:
+            index = size + index
+        if index < 0 or index >= size:
+            raise IndexError("Linked List index out of range")
+
+        if index <= size - 1 - index:
+            cur, pos = self.first_node, 0
+        else:
+            cur, pos = self.first_node._prev, size - 1
+        if self._finger is not None:
+            finger, finger_pos = self._finger
+            if abs(index - finger_pos) < abs(index - pos):
+                cur, pos = finger, finger_pos
+
+        while pos < index:
+            cur = cur._next
+            pos += 1
+        while pos > index:
+            cur = cur._prev
+            pos -= 1
+
+        self._finger = (cur, index)
+        return cur
 
     def __getitem__(self, index):
         """Gets the item by its index.
@@ -179,14 +554,7 @@ class LinkedList:
         Raises:
             IndexError: If the index is out of range.
         """
-        if index < 0:
-            index = len(self) + index
-        if index < 0 or index >= len(self):
-            raise IndexError("Linked List index out of range")
-        cur = self.first_node
-        for _ in range(index):
-            cur = cur.next
-        return cur.data
+        return self.node_at(index).data
 
     def __contains__(self, item):
         """Checks if the list contains the specified item by data.
@@ -197,32 +565,20 @@ class LinkedList:
         Returns:
             bool: True if the item is in the list, False otherwise.
         """
-        if not self.first_node:
-            return False
-
-        cur = self.first_node
-        while True:
-            if cur.data == item:
-                return True
-            cur = cur.next
-            if cur == self.first_node:
-                return False
+        if self._index is not None:
+            return item in self._index
+        return self._find_node(item) is not None
 
     def __reversed__(self):
-        """Returns the reversed list as a list of data.
+        """Lazily iterates over the data of the list in reverse order.
         
-        Returns:
-            list: A list containing the data in reverse order.
+        Yields:
+            data: The data of the next item from the end.
         """
-        if len(self) == 0:
-            return []
+        if self._size == 0:
+            return
 
-        reversed_list = []
-        last_node = self.last
-        cur = last_node
-        while True:
-            reversed_list.append(cur.data)
-            if cur == self.first_node:
-                break
-            cur = cur.prev
-        return reversed_list
+        cur = self.first_node._prev
+        for _ in range(self._size):
+            yield cur.data
+            cur = cur._prev
@@ -3,6 +3,9 @@ from typing import Self
 class LinkedListItem:
     """Class representing an item in a doubly linked list."""
 
+    # No per-instance __dict__: large rings hold millions of these
+    __slots__ = ('data', '_next', '_prev')
+
     def __init__(self, data=None):
         """Initializes a LinkedListItem with optional data.
         
@@ -1,22 +1,84 @@
+import os
 import sys
+from collections import deque
 from PyQt5.QtWidgets import ( QApplication, QMainWindow, QPushButton, 
-QListWidget, QVBoxLayout, QWidget, QFileDialog, QLabel, QHBoxLayout, 
-QInputDialog, QMessageBox
+QListWidget, QListView, QAbstractItemView, QVBoxLayout, QWidget, 
+QFileDialog, QLabel, QHBoxLayout, QInputDialog, QMessageBox, QLineEdit,
+QShortcut
 )
 from PyQt5 import QtCore
+from PyQt5.QtGui import QKeySequence
 import pygame
 from music_track import MusicTrack
 from PlayList import Playlist
+from playlist_model import PlaylistModel
+from playlist_store import PlaylistStore
+from track_metadata import MetadataCache
+from track_scanner import TrackScanner
+
+# Каталог, в котором хранятся файлы плейлистов
+PLAYLISTS_DIR = 'playlists'
+PLAYLIST_SUFFIX = '.plst'
+# Сколько результатов поиска показывать
+SEARCH_LIMIT = 200
+METADATA_CACHE = os.path.join(PLAYLISTS_DIR, 'metadata.sqlite')
+# Сколько удалённых плейлистов можно восстановить
+DELETED_PLAYLISTS_LIMIT = 10
+
+class ImportWorker(QtCore.QObject):
+    """Обход каталога с музыкой в фоновом потоке."""
+    batch_ready = QtCore.pyqtSignal(list)
+    progress = QtCore.pyqtSignal(int, int)
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self, scanner):
+        super().__init__()
+        self.scanner = scanner
+
+    def run(self):
+        """Запуск обхода, пачки треков передаются через сигналы."""
+        self.scanner.scan(self.batch_ready.emit, self.progress.emit)
+        self.finished.emit()
+
 
 class PlaylistUI(QMainWindow):
+    # Метаданные извлекаются в фоновых потоках, сигнал доставляет их в GUI
+    metadata_ready = QtCore.pyqtSignal(str, object)
+
     def __init__(self):
         super().__init__()
+        os.makedirs(PLAYLISTS_DIR, exist_ok=True)
+        self.metadata = MetadataCache(
+            METADATA_CACHE,
+            on_ready=lambda path, metadata: self.metadata_ready.emit(path, metadata)
+        )
+        # Готовые метаданные показываются не чаще раза в 200 мс
+        self.metadata_timer = QtCore.QTimer(self)
+        self.metadata_timer.setSingleShot(True)
+        self.metadata_timer.setInterval(200)
+        self.metadata_ready.connect(
+            lambda *_: self.metadata_timer.isActive() or self.metadata_timer.start()
+        )
+        # Названия из метаданных попадают в поисковые индексы в потоке GUI
+        self.metadata_ready.connect(self.index_metadata)
         self.initUI()
+        self.metadata_timer.timeout.connect(self.track_model.refresh)
         pygame.mixer.init()
 
         # Плейлисты
         self.playlists = {}
+        # Хранилища по объекту плейлиста: правки пишутся в файл того
+        # плейлиста, который редактируется, а не того, что выделен
+        self.stores = {}
+        self.deleted_playlists = deque(maxlen=DELETED_PLAYLISTS_LIMIT)
         self.current_playlist = None
+        self.shuffle = False
+        self.load_playlists()
+
+        # Фоновый импорт каталога
+        self.import_thread = None
+        self.import_worker = None
+        self.import_target = None
         
         self.timer = QtCore.QTimer(self)
         self.timer.setInterval(1000)
@@ -50,13 +112,32 @@ class PlaylistUI(QMainWindow):
         remove_playlist_btn.clicked.connect(self.delete_playlist)
         playlist_buttons_layout.addWidget(remove_playlist_btn)
 
+        restore_playlist_btn = QPushButton("Restore Playlist")
+        restore_playlist_btn.clicked.connect(self.restore_playlist)
+        playlist_buttons_layout.addWidget(restore_playlist_btn)
+
         main_layout.addLayout(playlist_buttons_layout)
 
         # Список композиций
-        self.track_list = QListWidget()
-        self.track_list.setSelectionMode(QListWidget.SingleSelection)
+        # Модель обновляет только изменённые строки, а не весь список
+        self.track_model = PlaylistModel(self, self.metadata)
+        self.track_list = QListView()
+        self.track_list.setModel(self.track_model)
+        self.track_list.setSelectionMode(QAbstractItemView.SingleSelection)
         main_layout.addWidget(self.track_list)
 
+        # Поиск по текущему плейлисту
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Поиск трека")
+        self.search_box.textChanged.connect(self.search_tracks)
+        main_layout.addWidget(self.search_box)
+
+        self.search_results = QListWidget()
+        self.search_results.setMaximumHeight(120)
+        self.search_results.itemActivated.connect(self.select_search_result)
+        main_layout.addWidget(self.search_results)
+        self.found_nodes = []
+
         # Кнопки управления композициями
         track_buttons_layout = QHBoxLayout()
 
@@ -71,6 +152,24 @@ class PlaylistUI(QMainWindow):
         move_btn = QPushButton("Move track to")
         move_btn.clicked.connect(self.move_track)
         track_buttons_layout.addWidget(move_btn)
+
+        import_btn = QPushButton("Import Folder")
+        import_btn.clicked.connect(self.import_folder)
+        track_buttons_layout.addWidget(import_btn)
+
+        cancel_import_btn = QPushButton("Cancel Import")
+        cancel_import_btn.clicked.connect(self.cancel_import)
+        track_buttons_layout.addWidget(cancel_import_btn)
+
+        undo_btn = QPushButton("Undo")
+        undo_btn.clicked.connect(self.undo_edit)
+        track_buttons_layout.addWidget(undo_btn)
+        QShortcut(QKeySequence.Undo, self, self.undo_edit)
+
+        redo_btn = QPushButton("Redo")
+        redo_btn.clicked.connect(self.redo_edit)
+        track_buttons_layout.addWidget(redo_btn)
+        QShortcut(QKeySequence.Redo, self, self.redo_edit)
         
         main_layout.addLayout(track_buttons_layout)
 
@@ -85,6 +184,15 @@ class PlaylistUI(QMainWindow):
         next_track_btn.clicked.connect(self.next_track)
         playback_buttons_layout.addWidget(next_track_btn)
 
+        shuffle_btn = QPushButton("Shuffle")
+        shuffle_btn.setCheckable(True)
+        shuffle_btn.toggled.connect(self.toggle_shuffle)
+        playback_buttons_layout.addWidget(shuffle_btn)
+
+        play_next_btn = QPushButton("Play Next")
+        play_next_btn.clicked.connect(self.play_next)
+        playback_buttons_layout.addWidget(play_next_btn)
+
         prev_track_btn = QPushButton("Previous")
         prev_track_btn.clicked.connect(self.previous_track)
         playback_buttons_layout.addWidget(prev_track_btn)
@@ -95,6 +203,30 @@ class PlaylistUI(QMainWindow):
         self.current_track_label = QLabel("Current Track: None")
         main_layout.addWidget(self.current_track_label)
 
+    def load_playlists(self):
+        """Загрузка сохранённых плейлистов с диска."""
+        os.makedirs(PLAYLISTS_DIR, exist_ok=True)
+        for file_name in sorted(os.listdir(PLAYLISTS_DIR)):
+            if not file_name.endswith(PLAYLIST_SUFFIX):
+                continue
+            name = file_name[:-len(PLAYLIST_SUFFIX)]
+            playlist = Playlist(metadata=self.metadata)
+            store = PlaylistStore(os.path.join(PLAYLISTS_DIR, file_name), playlist)
+            try:
+                store.load()
+            except ValueError as error:
+                print(f"Плейлист '{name}' не загружен: {error}")
+                continue
+            # Загрузка с диска - не правка, её нельзя отменить
+            playlist.journal.clear()
+            self.playlists[name] = playlist
+            self.stores[playlist] = store
+            self.playlist_list.addItem(name)
+
+    def current_store(self):
+        """Хранилище текущего плейлиста."""
+        return self.stores.get(self.current_playlist)
+
     def create_playlist(self):
         """Создание нового плейлиста."""
         name, ok = QInputDialog.getText(self, 'Создать плейлист', 'Введите название:')
@@ -102,10 +234,17 @@ class PlaylistUI(QMainWindow):
             if name in self.playlists:
                 self.show_error_message(f"Плейлист с именем '{name}' уже существует.")
             else:
-                new_playlist = Playlist()  # Создание нового объекта плейлиста
+                new_playlist = Playlist(metadata=self.metadata)  # Создание нового объекта плейлиста
+                new_playlist.order.shuffle = self.shuffle
                 self.playlists[name] = new_playlist  # Добавляем в словарь плейлистов
+                store = PlaylistStore(
+                    os.path.join(PLAYLISTS_DIR, name + PLAYLIST_SUFFIX), new_playlist
+                )
+                store.save()  # Создаём файл плейлиста
+                self.stores[new_playlist] = store
                 self.playlist_list.addItem(name)  # Обновляем список плейлистов в интерфейсе
-                self.current_playlist = new_playlist  # Назначаем его текущим
+                # Выделяем новый плейлист, select_playlist назначит его текущим
+                self.playlist_list.setCurrentRow(self.playlist_list.count() - 1)
                 print(f"Плейлист '{name}' создан и выбран.")
         else:
             self.show_error_message("Введите корректное название плейлиста.")
@@ -122,74 +261,187 @@ class PlaylistUI(QMainWindow):
 
             # Обновляем список треков
             self.update_track_list()
+            self.search_tracks(self.search_box.text())
         else:
             self.current_playlist = None
             print("Не удалось выбрать плейлист.")
 
+    def index_metadata(self, path, metadata):
+        """Обновление поисковых индексов плейлистов по метаданным трека."""
+        for playlist in self.playlists.values():
+            playlist.search_index.reindex_path(path, metadata)
+
     def update_track_list(self):
         """Обновление списка треков на основе текущего плейлиста."""
-        self.track_list.clear()  # Очищаем предыдущий список треков
-        if self.current_playlist:
-            for track in self.current_playlist:  
-                # Итерация по трекам в текущем плейлисте
-                self.track_list.addItem(track.data.path)
+        # Дальнейшие изменения плейлиста модель отслеживает сама
+        self.track_model.set_playlist(self.current_playlist)
+
+    def selected_row(self):
+        """Номер выбранной строки списка треков или -1."""
+        index = self.track_list.currentIndex()
+        return index.row() if index.isValid() else -1
+
+    def search_tracks(self, text):
+        """Показ треков текущего плейлиста, содержащих введённый текст."""
+        self.search_results.clear()
+        self.found_nodes = []
+        if not self.current_playlist or not text:
+            return
+        self.found_nodes = self.current_playlist.search_index.search(
+            text, SEARCH_LIMIT
+        )
+        for node in self.found_nodes:
+            self.search_results.addItem(node.data.path)
+
+    def select_search_result(self, item):
+        """Выделение найденного трека в списке треков."""
+        node = self.found_nodes[self.search_results.row(item)]
+        if node.removed:
+            print("Трек уже удалён из плейлиста.")
+            return
+        row = self.track_model.row_of(node)
+        self.track_list.setCurrentIndex(self.track_model.index(row))
 
     def delete_playlist(self):
         """Удаление выбранного плейлиста."""
         selected_playlist_name = self.playlist_list.currentItem()
         
         if selected_playlist_name:
-            del self.playlists[selected_playlist_name.text()]  
-            # Удаляем из словаря
+            playlist = self.playlists.pop(selected_playlist_name.text())
+            # Удаляем из словаря, но храним для восстановления
+            self.deleted_playlists.append((selected_playlist_name.text(), playlist))
+            store = self.stores.pop(playlist)
+            store.close()
+            os.remove(store.path)  # Удаляем файл плейлиста
             self.playlist_list.takeItem(self.playlist_list.currentRow())  
             # Удаляем из интерфейса
             self.current_playlist = None
+            self.update_track_list()
             print(f"Плейлист '{selected_playlist_name.text()}' удалён.")
         else:
             print("Плейлист для удаления не выбран.")
 
+    def restore_playlist(self):
+        """Восстановление последнего удалённого плейлиста."""
+        if not self.deleted_playlists:
+            print("Нет удалённых плейлистов.")
+            return
+        name, playlist = self.deleted_playlists[-1]
+        if name in self.playlists:
+            self.show_error_message(f"Плейлист с именем '{name}' уже существует.")
+            return
+        self.deleted_playlists.pop()
+        # Объект плейлиста сохранился целиком, файл записывается заново
+        self.playlists[name] = playlist
+        store = PlaylistStore(os.path.join(PLAYLISTS_DIR, name + PLAYLIST_SUFFIX), playlist)
+        store.save()
+        self.stores[playlist] = store
+        self.playlist_list.addItem(name)
+        print(f"Плейлист '{name}' восстановлен.")
+
+    def undo_edit(self):
+        """Отмена последней правки текущего плейлиста."""
+        if not self.replay_edit(undo=True):
+            print("Нечего отменять.")
+
+    def redo_edit(self):
+        """Повтор отменённой правки текущего плейлиста."""
+        if not self.replay_edit(undo=False):
+            print("Нечего повторять.")
+
+    def replay_edit(self, undo):
+        """Отмена или повтор правки текущего плейлиста с записью в файл."""
+        if not self.current_playlist:
+            return False
+        # Строки узлов берутся из модели, в файл дописываются только позиции
+        return self.current_store().replay(
+            self.current_playlist.journal, undo, self.track_model.row_of
+        )
+
     def add_track(self):
         """Добавление трека в текущий плейлист."""
-        selected_playlist = self.playlist_list.currentItem()
-        if selected_playlist:
+        if self.current_playlist:
             track_path, _ = QFileDialog.getOpenFileName(self, "Add Track", 
                                             "", "Music Files (*.mp3 *.wav)")
             if track_path:
                 track = MusicTrack(track_path)
                 self.current_playlist.append(track)  
-                self.track_list.addItem(track.path) 
+                self.current_store().record_append(track)
                 print(f"Трек '{track_path}' добавлен в плейлист.")
             else:
                 self.show_error_message("Не удалось загрузить трек.")
         else:
             self.show_error_message("Выберите плейлист для добавления трека.")
 
+    def import_folder(self):
+        """Импорт всех треков из каталога в текущий плейлист."""
+        if not self.current_playlist:
+            self.show_error_message("Выберите плейлист для импорта треков.")
+            return
+        if self.import_thread is not None:
+            self.show_error_message("Импорт уже выполняется.")
+            return
+
+        directory = QFileDialog.getExistingDirectory(self, "Import Folder")
+        if not directory:
+            return
+
+        # Треки попадут в этот плейлист, даже если пользователь выберет другой
+        self.import_target = (self.current_playlist, self.current_store())
+        self.import_thread = QtCore.QThread(self)
+        self.import_worker = ImportWorker(TrackScanner(directory))
+        self.import_worker.moveToThread(self.import_thread)
+        self.import_thread.started.connect(self.import_worker.run)
+        self.import_worker.batch_ready.connect(self.add_imported_tracks)
+        self.import_worker.progress.connect(self.show_import_progress)
+        self.import_worker.finished.connect(self.finish_import)
+        self.import_thread.start()
+
+    def add_imported_tracks(self, tracks):
+        """Добавление очередной пачки импортированных треков."""
+        playlist, store = self.import_target
+        if playlist not in self.playlists.values():
+            return  # Плейлист удалён во время импорта
+        playlist.extend(tracks)  # Одна вставка и одно обновление модели
+        store.record_extend(tracks)
+
+    def show_import_progress(self, directories, tracks):
+        """Отображение хода импорта."""
+        self.current_track_label.setText(
+            f"Импорт: просмотрено каталогов {directories}, найдено треков {tracks}"
+        )
+
+    def cancel_import(self):
+        """Отмена импорта."""
+        if self.import_worker is not None:
+            self.import_worker.scanner.cancel()
+
+    def finish_import(self):
+        """Завершение фонового потока импорта."""
+        self.import_thread.quit()
+        self.import_thread.wait()
+        self.import_thread = None
+        self.import_worker = None
+        self.import_target = None
+        print("Импорт завершён.")
+
     def remove_track(self):
         """Удаление трека из текущего плейлиста."""
         if not self.current_playlist:
             print("Плейлист не выбран.")
             return
 
-        selected_track = self.track_list.currentItem()
-        if selected_track:
-            track_path = selected_track.text()  
-            # Получаем текст выбранного трека
-            track_found = False  # Флаг для отслеживания, найден ли трек
-
-            # Ищем трек в текущем плейлисте
-            for node in self.current_playlist:  # Итерация по узлам
-                if node.data.path == track_path:  # Сравниваем с node.data.path
-                    self.current_playlist.remove(node.data)  
-                    # Удаляем трек из плейлиста
-                    track_found = True
-                    break
-
-            if track_found:
-                self.track_list.takeItem(self.track_list.currentRow())  
-                # Удаляем трек из интерфейса
-                print(f"Трек '{track_path}' удалён из плейлиста.")
-            else:
-                print(f"Трек '{track_path}' не найден в плейлисте.")
+        selected_row = self.selected_row()
+        if selected_row >= 0:
+            # Получаем узел выбранного трека
+            node = self.find_song_by_id(selected_row)
+            track_path = node.data.path
+
+            self.current_playlist.remove_node(node)  
+            # Удаляем узел без повторного поиска по значению,
+            # строка исчезнет из интерфейса через модель
+            self.current_store().record_remove(selected_row)
+            print(f"Трек '{track_path}' удалён из плейлиста.")
         else:
             print("Трек для удаления не выбран.")
 
@@ -200,7 +452,7 @@ class PlaylistUI(QMainWindow):
             print("Плейлист не выбран.")
             return
 
-        current_row = self.track_list.currentRow()  # Получаем текущую позицию трека
+        current_row = self.selected_row()  # Получаем текущую позицию трека
         if current_row < 0:
             self.show_error_message("Выберите композицию для смены позиции.")
             return
@@ -233,42 +485,24 @@ class PlaylistUI(QMainWindow):
 
         # Находим трек для перемещения
         track_to_move = self.find_song_by_id(current_row)
-        
-        # Удаляем трек из текущей позиции
-        self.remove_track()
 
+        # Находим узел, после которого окажется трек
         if new_position == 0:
             # Если перемещаем трек в самое начало
-            self.current_playlist.append_left(track_to_move.data)
-        elif current_row == len(self.current_playlist):
-            print("перенос последнего")
-            prev_track = self.find_song_by_id(new_position - 1)
-            self.current_playlist.insert(prev_track.data, track_to_move.data)
+            after = None
+        elif current_row < new_position:
+            after = self.find_song_by_id(new_position)
         else:
-            # Вставляем трек на нужную позицию
-            print(current_row, len(self.current_playlist) - 2)
-            
-            if current_row < new_position:
-                print(current_row, new_position)
-                prev_track = self.find_song_by_id(new_position - 1)
-            else:
-                print(current_row, new_position)
-                prev_track = self.find_song_by_id(new_position)
-
-            self.current_playlist.insert(prev_track.data, track_to_move.data)
+            after = self.find_song_by_id(new_position - 1)
 
-        # Обновляем список треков в интерфейсе
-        self.update_track_list()
+        self.current_playlist.move_node(track_to_move, after)
+        self.current_store().record_move(current_row, new_position)
 
 
         
     def find_song_by_id(self, sid):
         """Find song by id."""
-        for idx, track in enumerate(self.current_playlist):
-            if idx == sid:
-                return track
-
-        return None
+        return self.track_model.node(sid)
 
     def play_song_by_id(self, sid):
         """Play song by id."""
@@ -281,7 +515,7 @@ class PlaylistUI(QMainWindow):
             print("Плейлист не выбран или он пуст.")
             return
 
-        selected_track = self.track_list.currentRow()
+        selected_track = self.selected_row()
         if selected_track >= 0:
             self.play_song_by_id(selected_track)
 
@@ -310,6 +544,23 @@ class PlaylistUI(QMainWindow):
 
         self.current_playlist.previous_track()  # Переход на предыдущий трек
         
+    def toggle_shuffle(self, checked):
+        """Включение и выключение случайного порядка."""
+        self.shuffle = checked
+        for playlist in self.playlists.values():
+            playlist.order.shuffle = checked
+
+    def play_next(self):
+        """Постановка выбранного трека в очередь воспроизведения."""
+        if not self.current_playlist:
+            print("Плейлист не выбран.")
+            return
+
+        node = self.find_song_by_id(self.selected_row())
+        if node:
+            self.current_playlist.order.enqueue(node)
+            print(f"Трек '{node.data.path}' будет воспроизведён следующим.")
+
     def next_track_when_ended(self):
         """Play next track on current end."""
         if pygame.mixer.music.get_busy():
@@ -336,6 +587,27 @@ class PlaylistUI(QMainWindow):
         msg_box.setWindowTitle("Ошибка")
         msg_box.exec_()
 
+    def closeEvent(self, event):  # pylint: disable=C0103
+        """Остановка фоновых потоков и закрытие файлов при выходе."""
+        if self.import_thread is not None:
+            # Поток нельзя уничтожать, пока обход не завершился. Пачки,
+            # ещё стоящие в очереди, в закрываемые файлы не пишутся
+            self.import_worker.scanner.cancel()
+            self.import_worker.batch_ready.disconnect()
+            self.import_worker.finished.disconnect()
+            self.import_thread.quit()
+            self.import_thread.wait()
+            self.import_thread = None
+            self.import_worker = None
+            self.import_target = None
+        playlists = list(self.playlists.values())
+        playlists += [playlist for _, playlist in self.deleted_playlists]
+        for playlist in playlists:
+            playlist.prefetcher.close()
+        for store in self.stores.values():
+            store.close()
+        self.metadata.close(wait=False)
+        super().closeEvent(event)
 
 
 if __name__ == '__main__':
@@ -11,6 +11,20 @@ class MusicTrack:
             path (str): The file path of the music track.
         """
         self.path = path
+        # Filled lazily from the metadata cache, see track_metadata.py
+        self.metadata = None
+
+    @property
+    def title(self) -> str:
+        """Returns the title of the track, or its file path 
+        while the metadata is not known yet.
+        
+        Returns:
+            str: The title of the track.
+        """
+        if self.metadata is not None:
+            return self.metadata.title
+        return self.path
 
     def __eq__(self, other: Self) -> bool:
         """Checks if two music tracks are equal 
@@ -27,3 +41,12 @@ class MusicTrack:
         if other:
             return self.path == other.path
         return False
+
+    def __hash__(self) -> int:
+        """Returns a hash consistent with `__eq__`, 
+        so tracks can be used as dictionary keys.
+        
+        Returns:
+            int: The hash of the track's file path.
+        """
+        return hash(self.path)
@@ -0,0 +1,198 @@
+"""Playback order: up-next queue and shuffle over a playlist"""
+
+import random
+from collections import Counter, deque
+
+
+class PlayOrder:
+    """Decides which track of a playlist plays next.
+
+    Tracks put into the up-next queue always go first. After that the
+    order is either the ring order of the playlist or, in shuffle mode, a
+    random permutation drawn one track at a time: the tracks not yet
+    played in the current round sit in a pool, and each step swaps a
+    random one to the end of the pool and pops it (Fisher-Yates). Every
+    step is O(1), and the order listens to the playlist, so tracks that
+    are added or removed mid-play join or leave the pool and the queue
+    right away.
+    """
+
+    def __init__(self, playlist, seed=None, history_size: int = 100):
+        """Initializes the order and subscribes to the playlist.
+
+        Args:
+            playlist (ConcurrentLinkedList): The playlist to play.
+            seed: Optional seed for the shuffle.
+            history_size (int): How many shuffled steps `previous` can undo.
+        """
+        self._playlist = playlist
+        self._random = random.Random(seed)
+        self._shuffle = False
+        self._queue = deque()
+        self._queued = Counter()
+        self._gone = set()
+        self._pool = None
+        self._pool_pos = {}
+        self._played = {}
+        self._upcoming = None
+        self._history = deque(maxlen=history_size)
+        playlist.add_listener(self._on_change)
+
+    @property
+    def shuffle(self) -> bool:
+        """Whether the tracks are played in random order."""
+        return self._shuffle
+
+    @shuffle.setter
+    def shuffle(self, value: bool):
+        """Turns shuffle mode on or off; turning it on starts a new round."""
+        self._shuffle = value
+        self._pool = None
+        self._pool_pos = {}
+        self._played = {}
+        self._upcoming = None
+        self._history.clear()
+
+    def enqueue(self, node):
+        """Puts a track into the up-next queue.
+
+        Args:
+            node: The node of the track to play next.
+        """
+        self._queue.append(node)
+        self._queued[id(node)] += 1
+
+    def _on_change(self, event: str, node, count: int):
+        """Keeps the queue and the shuffle pool in sync with the playlist."""
+        if event == 'remove':
+            key = id(node)
+            if key in self._queued:
+                self._gone.add(key)
+            if self._pool is not None and key in self._pool_pos:
+                self._take_from_pool(self._pool_pos[key])
+            return
+
+        for _ in range(count):
+            key = id(node)
+            self._gone.discard(key)
+            if self._pool is not None and key not in self._played:
+                self._pool_pos[key] = len(self._pool)
+                self._pool.append(node)
+            node = node._next  # pylint: disable=W0212
+
+    def _take_from_pool(self, position: int):
+        """Removes the node at a position of the pool in O(1)."""
+        pool = self._pool
+        node = pool[position]
+        last = pool.pop()
+        if last is not node:
+            pool[position] = last
+            self._pool_pos[id(last)] = position
+        del self._pool_pos[id(node)]
+        return node
+
+    def _new_round(self):
+        """Starts a new shuffle round with every track in the pool."""
+        self._pool = list(self._playlist)
+        self._pool_pos = {id(node): i for i, node in enumerate(self._pool)}
+        self._played = {}
+
+    def _draw(self):
+        """Picks the next shuffled track, leaving it in the pool.
+
+        The pick is kept until it is played or leaves the pool, so `peek`
+        and `next` agree on it.
+        """
+        if self._upcoming is None or id(self._upcoming) not in self._pool_pos:
+            if not self._pool:
+                self._new_round()
+                if not self._pool:
+                    return None
+            self._upcoming = self._pool[self._random.randrange(len(self._pool))]
+        return self._upcoming
+
+    def _next_queued(self):
+        """Pops the first queued track that is still in the playlist."""
+        while self._queue:
+            node = self._queue.popleft()
+            key = id(node)
+            self._queued[key] -= 1
+            if self._queued[key] == 0:
+                del self._queued[key]
+                gone = key in self._gone
+                self._gone.discard(key)
+            else:
+                gone = key in self._gone
+            if not gone:
+                return node
+        return None
+
+    def next(self, current):
+        """Returns the track to play after the current one.
+
+        Args:
+            current: The node that is playing now, or None.
+
+        Returns:
+            The node to play next, or None if the playlist is empty.
+        """
+        node = self._next_queued()
+        if node is not None:
+            if self._pool is not None and id(node) in self._pool_pos:
+                self._take_from_pool(self._pool_pos[id(node)])
+                self._played[id(node)] = node
+            self._history.append(current)
+            return node
+
+        if not self._shuffle:
+            if current is None:
+                return self._playlist.first_node
+            return self._playlist.successor(current)
+
+        node = self._draw()
+        if node is None:
+            return None
+        self._upcoming = None
+        self._take_from_pool(self._pool_pos[id(node)])
+        self._played[id(node)] = node
+        self._history.append(current)
+        return node
+
+    def peek(self, current):
+        """Returns the track `next` will return, without advancing.
+
+        Args:
+            current: The node that is playing now, or None.
+
+        Returns:
+            The node to play next, or None if the playlist is empty.
+        """
+        for node in self._queue:
+            if id(node) not in self._gone:
+                return node
+
+        if not self._shuffle:
+            if current is None:
+                return self._playlist.first_node
+            return self._playlist.successor(current)
+        return self._draw()
+
+    def previous(self, current):
+        """Returns the track to go back to from the current one.
+
+        In shuffle mode this is the track played before, as long as it
+        is still in the playlist; otherwise it is the previous track in
+        the ring.
+
+        Args:
+            current: The node that is playing now.
+
+        Returns:
+            The node to play, or None if the playlist is empty.
+        """
+        if self._shuffle:
+            while self._history:
+                node = self._history.pop()
+                if node is not None and not node.removed:
+                    return node
+        return self._playlist.predecessor(current)
@@ -0,0 +1,126 @@
+"""Qt list model over a playlist"""
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class PlaylistModel(QAbstractListModel):
+    """Model that exposes the tracks of a playlist to a Qt view.
+
+    The model keeps a row array of the playlist's nodes and listens to
+    the playlist, so every insertion (of one node or of a whole run) or
+    removal turns into a single rows notification instead of a rebuild
+    of the whole view. The playlist must only be edited from the GUI
+    thread while it is shown.
+    """
+
+    def __init__(self, parent=None, metadata=None):
+        """Initializes an empty model.
+
+        Args:
+            parent: The parent Qt object.
+            metadata (MetadataCache): Optional cache to show track
+            titles and durations from.
+        """
+        super().__init__(parent)
+        self._metadata = metadata
+        self._playlist = None
+        self._rows = []
+        self._hint = 0
+
+    def set_playlist(self, playlist):
+        """Shows another playlist, or nothing if `playlist` is None.
+
+        Args:
+            playlist (LinkedList): The playlist to show.
+        """
+        self.beginResetModel()
+        if self._playlist is not None:
+            self._playlist.remove_listener(self._on_change)
+        self._playlist = playlist
+        self._rows = list(playlist) if playlist is not None else []
+        if playlist is not None:
+            playlist.add_listener(self._on_change)
+        self.endResetModel()
+
+    def node(self, row: int):
+        """Returns the node shown in a row.
+
+        Args:
+            row (int): The row number.
+
+        Returns:
+            LinkedListItem: The node, or None if the row does not exist.
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def row_of(self, node) -> int:
+        """Returns the row of a node of the playlist.
+
+        The last looked up row and both ends are checked first, which
+        covers appends and edits around the selection without a scan.
+
+        Args:
+            node (LinkedListItem): A node of the shown playlist.
+
+        Returns:
+            int: The row of the node.
+        """
+        rows = self._rows
+        for row in (self._hint, self._hint + 1, self._hint - 1, len(rows) - 1, 0):
+            if 0 <= row < len(rows) and rows[row] is node:
+                self._hint = row
+                return row
+        self._hint = rows.index(node)
+        return self._hint
+
+    def _on_change(self, event: str, node, count: int):
+        """Turns a playlist change into row notifications."""
+        if event == 'insert':
+            if node is self._playlist.first_node:
+                row = 0
+            else:
+                row = self.row_of(node._prev) + 1  # pylint: disable=W0212
+            nodes = []
+            for _ in range(count):
+                nodes.append(node)
+                node = node._next  # pylint: disable=W0212
+            self.beginInsertRows(QModelIndex(), row, row + count - 1)
+            self._rows[row:row] = nodes
+            self.endInsertRows()
+            self._hint = row
+        else:
+            row = self.row_of(node)
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            self.endRemoveRows()
+
+    def refresh(self):
+        """Tells the view that the shown texts may have changed.
+
+        Only the visible rows are repainted, so this is cheap even for
+        large playlists.
+        """
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1))
+
+    def rowCount(self, parent=QModelIndex()):  # pylint: disable=C0103
+        """Returns the number of tracks."""
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Returns the text shown in a row: the title and duration of the
+        track when its metadata is known, its path otherwise."""
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        track = self._rows[index.row()].data
+        metadata = self._metadata.lookup(track) if self._metadata else None
+        if metadata is None:
+            return track.path
+        if metadata.duration is None:
+            return metadata.title
+        minutes, seconds = divmod(int(metadata.duration), 60)
+        return f"{metadata.title} ({minutes}:{seconds:02d})"
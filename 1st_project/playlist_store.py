@@ -0,0 +1,253 @@
+"""Persistent playlist storage"""
+
+import mmap
+import os
+import struct
+
+from music_track import MusicTrack
+
+MAGIC = b'PLST\x01'
+
+# Record kinds. A snapshot is just a run of APPEND records; edits made
+# after it are appended to the same file as further records.
+APPEND = b'A'
+INSERT = b'I'
+REMOVE = b'R'
+MOVE = b'M'
+
+_UINT = struct.Struct('<I')
+_UINT_PAIR = struct.Struct('<II')
+
+
+class PlaylistStore:
+    """Append-only journal of a playlist kept in a single file.
+
+    The file starts with a snapshot of the track paths in order, followed
+    by a journal of edits recorded by position. Edits only append a few
+    bytes to the file; once the journal holds more than
+    `compact_threshold` positional records (inserts, removals and moves),
+    the file is rewritten as a fresh snapshot. Appended tracks do not
+    count, as they are just a longer snapshot.
+    """
+
+    def __init__(self, path: str, playlist, compact_threshold: int = 1000):
+        """Initializes the store.
+
+        Args:
+            path (str): The file to keep the playlist in.
+            playlist (LinkedList): The playlist of `MusicTrack`s to
+            load into and to compact from.
+            compact_threshold (int): The number of positional journal
+            records above which the file is compacted.
+        """
+        self.path = path
+        self.playlist = playlist
+        self.compact_threshold = compact_threshold
+        self._journal = None
+        self._journal_records = 0
+
+    @staticmethod
+    def _read_records(buffer):
+        """Parses the records of a playlist file.
+
+        Args:
+            buffer: The contents of the file, e.g. a memory map.
+
+        Yields:
+            tuple: The record kind followed by its arguments.
+
+        Raises:
+            ValueError: If the file is not a playlist file.
+            EOFError: If a record is cut off by the end of the file,
+            e.g. when the program stopped in the middle of writing it.
+            UnicodeDecodeError: If a path is not valid UTF-8.
+        """
+        if buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError("Not a playlist file")
+
+        offset, end = len(MAGIC), len(buffer)
+
+        def take(size):
+            """Returns the next `size` bytes of the record."""
+            nonlocal offset
+            if offset + size > end:
+                raise EOFError(f"Record cut off at offset {end}")
+            offset += size
+            return buffer[offset - size:offset]
+
+        while offset < end:
+            kind = take(1)
+            if kind == APPEND:
+                (size,) = _UINT.unpack(take(_UINT.size))
+                yield kind, str(take(size), 'utf-8')
+            elif kind == INSERT:
+                position, size = _UINT_PAIR.unpack(take(_UINT_PAIR.size))
+                yield kind, position, str(take(size), 'utf-8')
+            elif kind == REMOVE:
+                yield (kind, *_UINT.unpack(take(_UINT.size)))
+            elif kind == MOVE:
+                yield (kind, *_UINT_PAIR.unpack(take(_UINT_PAIR.size)))
+            else:
+                raise ValueError(f"Unknown record {kind!r} at offset {offset - 1}")
+
+    @staticmethod
+    def _encode_path(track: MusicTrack) -> bytes:
+        """Encodes the path of a track with its length prefix."""
+        path = track.path.encode('utf-8')
+        return _UINT.pack(len(path)) + path
+
+    def load(self):
+        """Fills the playlist from the file, if it exists.
+
+        The file is memory-mapped and parsed in a single pass. Edits are
+        replayed on a Python list of tracks, where a positional edit is a
+        memmove rather than a walk along the ring, and the ring is built
+        from it once at the end. Replay stops
+        at the first record that is cut off, is not valid UTF-8 or refers
+        to a position the playlist does not have; the playlist keeps the
+        edits before it and the file is rewritten as a snapshot of them,
+        so the damaged tail is dropped.
+
+        Raises:
+            ValueError: If the file is not a playlist file.
+        """
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return
+
+        tracks = []
+        damaged = False
+        with open(self.path, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            try:
+                for record in self._read_records(buffer):
+                    kind = record[0]
+                    if kind == APPEND:
+                        tracks.append(MusicTrack(record[1]))
+                        continue
+
+                    self._journal_records += 1
+                    if kind == INSERT:
+                        _, position, path = record
+                        self._check_position(position, len(tracks) + 1)
+                        tracks.insert(position, MusicTrack(path))
+                    elif kind == REMOVE:
+                        self._check_position(record[1], len(tracks))
+                        del tracks[record[1]]
+                    else:
+                        _, source, target = record
+                        self._check_position(source, len(tracks))
+                        self._check_position(target, len(tracks))
+                        tracks.insert(target, tracks.pop(source))
+            except (EOFError, UnicodeDecodeError, IndexError):
+                damaged = True
+        self.playlist.extend(tracks)
+        if damaged:
+            self.save()
+
+    @staticmethod
+    def _check_position(position: int, size: int):
+        """Raises IndexError unless `position` is below `size`."""
+        if position >= size:
+            raise IndexError(f"Position {position} is out of range in a list of {size}")
+
+    def save(self):
+        """Rewrites the file as a snapshot of the current playlist."""
+        self.close()
+        temporary = self.path + '.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(MAGIC)
+            for node in self.playlist:
+                file.write(APPEND + self._encode_path(node.data))
+        os.replace(temporary, self.path)
+        self._journal_records = 0
+
+    def _write(self, record: bytes, count: int = 1):
+        """Appends records to the journal and compacts it if it is too long.
+
+        Args:
+            record (bytes): The encoded records.
+            count (int): How many of them are positional.
+        """
+        if self._journal is None:
+            if not os.path.exists(self.path):
+                # The playlist already holds the edit, so a snapshot covers it
+                self.save()
+                return
+            self._journal = open(self.path, 'ab')  # pylint: disable=R1732
+        self._journal.write(record)
+        self._journal.flush()
+        self._journal_records += count
+        if self._journal_records > self.compact_threshold:
+            self.save()
+
+    def record_append(self, track: MusicTrack):
+        """Records that a track was appended to the end of the playlist."""
+        self._write(APPEND + self._encode_path(track), 0)
+
+    def record_extend(self, tracks):
+        """Records that tracks were appended to the end of the playlist."""
+        self._write(b''.join(APPEND + self._encode_path(track) for track in tracks),
+                    0)
+
+    def record_insert(self, position: int, track: MusicTrack):
+        """Records that a track was inserted so that it is at `position`."""
+        path = track.path.encode('utf-8')
+        self._write(INSERT + _UINT_PAIR.pack(position, len(path)) + path)
+
+    def record_remove(self, position: int):
+        """Records that the track at `position` was removed."""
+        self._write(REMOVE + _UINT.pack(position))
+
+    def record_move(self, source: int, target: int):
+        """Records that the track at `source` was moved to `target`."""
+        self._write(MOVE + _UINT_PAIR.pack(source, target))
+
+    def replay(self, journal, undo: bool, row_of) -> bool:
+        """Undoes or redoes an edit of the playlist and records it.
+
+        The edit is recorded by position like any other, instead of
+        rewriting the file: the rows of the nodes involved are read
+        before the nodes leave the playlist and after they enter it.
+
+        Args:
+            journal (EditJournal): The edit journal of the playlist.
+            undo (bool): Whether to undo the latest edit or redo the
+            latest undone one.
+            row_of: A function returning the row of a node of the
+            playlist, e.g. `PlaylistModel.row_of`.
+
+        Returns:
+            bool: Whether there was an edit to replay.
+        """
+        entry = journal.peek_undo() if undo else journal.peek_redo()
+        if entry is None:
+            return False
+        apply = journal.undo if undo else journal.redo
+
+        kind = entry[0]
+        if kind == 'move':
+            node = entry[1]
+            source = row_of(node)
+            apply()
+            self.record_move(source, row_of(node))
+            return True
+
+        nodes = entry[1] if kind == 'insert' else [entry[1]]
+        if (kind == 'insert') == undo:
+            # The nodes are consecutive, so they all leave from one row
+            row = row_of(nodes[0])
+            apply()
+            for _ in nodes:
+                self.record_remove(row)
+        else:
+            apply()
+            row = row_of(nodes[0])
+            for offset, node in enumerate(nodes):
+                self.record_insert(row + offset, node.data)
+        return True
+
+    def close(self):
+        """Closes the journal file, if it is open."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
@@ -0,0 +1,37 @@
+"""Тесты модуля bench_linked_list"""
+
+import unittest
+
+from bench_linked_list import IMPLEMENTATIONS, OPERATIONS, compare, run
+
+
+class TestBenchLinkedList(unittest.TestCase):
+    """Тест-кейс бенчмарка связного списка"""
+    def test_run(self):
+        """Тест замера всех операций"""
+        report = run(IMPLEMENTATIONS, [1, 10], budget=0.001)
+        for name in IMPLEMENTATIONS:
+            for size in ('1', '10'):
+                with self.subTest(name=name, size=size):
+                    values = report['results'][name][size]
+                    self.assertEqual(set(values), set(OPERATIONS) | {'peak_memory'})
+                    self.assertTrue(all(value > 0 for value in values.values()))
+
+    def test_compare(self):
+        """Тест сравнения с базовыми результатами"""
+        baseline = {'results': {'list': {'10': {
+            'append': 100.0, 'remove': 100.0, 'peak_memory': 1000,
+        }}}}
+        report = {'results': {
+            'list': {'10': {'append': 85.0, 'remove': 50.0, 'peak_memory': 1500}},
+            'indexed': {'10': {'append': 1.0}},
+        }}
+        self.assertEqual(compare(report, baseline), [
+            ('list', '10', 'remove', 100.0, 50.0),
+            ('list', '10', 'peak_memory', 1000, 1500),
+        ])
+        self.assertEqual(compare(report, baseline, threshold=0.6), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
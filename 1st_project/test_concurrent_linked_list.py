@@ -0,0 +1,117 @@
+"""Тесты модуля concurrent_linked_list"""
+
+import random
+import threading
+import time
+import unittest
+
+from concurrent_linked_list import ConcurrentLinkedList
+
+
+def run_stress(linked_list, walkers=4, mutators=2, duration=0.5, seed=0):
+    """Нагрузочный прогон: обходы кольца параллельно с его изменением
+
+    Возвращает список исключений, возникших в потоках, и число
+    выполненных шагов обхода.
+    """
+    stop = threading.Event()
+    errors = []
+    steps = [0] * walkers
+
+    def walk(number):
+        try:
+            node = linked_list.first_node
+            while not stop.is_set():
+                for _ in linked_list:
+                    steps[number] += 1
+                if node is not None:
+                    node = linked_list.successor(node)
+                    steps[number] += 1
+                else:
+                    node = linked_list.first_node
+        except Exception as error:  # pylint: disable=W0718
+            errors.append(error)
+
+    def mutate(number):
+        rnd = random.Random(seed + number)
+        try:
+            while not stop.is_set():
+                action = rnd.random()
+                try:
+                    if action < 0.3 or len(linked_list) < 2:
+                        linked_list.append(rnd.randrange(1000))
+                    elif action < 0.5:
+                        linked_list.insert_after(
+                            linked_list.node_at(rnd.randrange(len(linked_list))),
+                            rnd.randrange(1000)
+                        )
+                    elif action < 0.8:
+                        linked_list.remove_node(
+                            linked_list.node_at(rnd.randrange(len(linked_list)))
+                        )
+                    else:
+                        linked_list.move_node(
+                            linked_list.node_at(rnd.randrange(len(linked_list))),
+                            linked_list.node_at(rnd.randrange(len(linked_list)))
+                        )
+                except (ValueError, IndexError):
+                    # Узел успел исчезнуть из-за другого потока
+                    pass
+        except Exception as error:  # pylint: disable=W0718
+            errors.append(error)
+
+    threads = [threading.Thread(target=walk, args=(i,)) for i in range(walkers)]
+    threads += [threading.Thread(target=mutate, args=(i,)) for i in range(mutators)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return errors, sum(steps)
+
+
+class TestConcurrentLinkedList(unittest.TestCase):
+    """Тест-кейс класса ConcurrentLinkedList"""
+    def test_walk_removed_node(self):
+        """Тест перехода с удалённого узла"""
+        linked_list = ConcurrentLinkedList.from_iterable([1, 2, 3, 4])
+        nodes = list(linked_list)
+        linked_list.remove_node(nodes[1])
+        linked_list.remove_node(nodes[2])
+        self.assertTrue(linked_list.successor(nodes[1]) is nodes[3])
+        self.assertTrue(linked_list.predecessor(nodes[2]) is nodes[0])
+        with self.assertRaises(ValueError):
+            linked_list.remove_node(nodes[1])
+
+    def test_walk_emptied_list(self):
+        """Тест перехода с узла опустевшего списка"""
+        linked_list = ConcurrentLinkedList.from_iterable([1])
+        node = linked_list.first_node
+        linked_list.remove_node(node)
+        self.assertTrue(linked_list.successor(node) is None)
+        linked_list.append(2)
+        self.assertEqual(linked_list.successor(node).data, 2)
+
+    def test_iteration(self):
+        """Тест обхода при изменении списка"""
+        linked_list = ConcurrentLinkedList.from_iterable(range(5))
+        seen = []
+        for node in linked_list:
+            seen.append(node.data)
+            if node.data == 1:
+                linked_list.remove_node(node)
+                linked_list.remove(2)
+        self.assertEqual(seen, [0, 1, 3, 4])
+        self.assertEqual(list(reversed(linked_list)), [4, 3, 0])
+
+    def test_stress(self):
+        """Нагрузочный тест"""
+        for indexed in (False, True):
+            linked_list = ConcurrentLinkedList(indexed=indexed)
+            linked_list.extend(range(100))
+            with self.subTest(indexed=indexed):
+                errors, steps = run_stress(linked_list)
+                self.assertEqual(errors, [])
+                self.assertTrue(steps > 0)
+                linked_list.check_consistency()
@@ -0,0 +1,119 @@
+"""Тесты модуля edit_journal"""
+
+import unittest
+
+from concurrent_linked_list import ConcurrentLinkedList
+from edit_journal import EditJournal
+from linked_list import LinkedList
+
+# Правки списка из пяти элементов 0..4
+TEST_EDITS = [
+    ('append', lambda lst: lst.append(5)),
+    ('append_left', lambda lst: lst.append_left(-1)),
+    ('insert', lambda lst: lst.insert(2, 7)),
+    ('remove_first', lambda lst: lst.remove_node(lst.first_node)),
+    ('remove_last', lambda lst: lst.remove_node(lst.last)),
+    ('remove_middle', lambda lst: lst.remove(3)),
+    ('move_to_head', lambda lst: lst.move_node(lst.last)),
+    ('move_head', lambda lst: lst.move_node(lst.first_node, lst.node_at(2))),
+    ('move_middle', lambda lst: lst.move_node(lst.node_at(1), lst.node_at(3))),
+    ('extend', lambda lst: lst.extend([8, 9, 10])),
+    ('extend_left', lambda lst: lst.extend_left([11, 12])),
+]
+
+
+def snapshot(linked_list):
+    """Состояние списка: данные и сами узлы по порядку"""
+    return [(node.data, id(node)) for node in linked_list]
+
+
+class TestEditJournal(unittest.TestCase):
+    """Тест-кейс класса EditJournal"""
+    def setUp(self):
+        LinkedList.debug = True
+
+    def tearDown(self):
+        LinkedList.debug = False
+
+    def test_undo_redo(self):
+        """Тест отмены и повтора правок"""
+        for factory in (LinkedList, lambda: ConcurrentLinkedList(indexed=True)):
+            linked_list = factory()
+            linked_list.extend(range(5))
+            journal = EditJournal(linked_list)
+            states = [snapshot(linked_list)]
+            for name, edit in TEST_EDITS:
+                edit(linked_list)
+                states.append(snapshot(linked_list))
+
+            for i in range(len(states) - 1, 0, -1):
+                with self.subTest(factory=factory, undo=TEST_EDITS[i - 1][0]):
+                    self.assertTrue(journal.undo())
+                    self.assertEqual(snapshot(linked_list), states[i - 1])
+            self.assertFalse(journal.undo())
+
+            for i in range(1, len(states)):
+                with self.subTest(factory=factory, redo=TEST_EDITS[i - 1][0]):
+                    self.assertTrue(journal.redo())
+                    self.assertEqual(snapshot(linked_list), states[i])
+            self.assertFalse(journal.redo())
+
+    def test_clear(self):
+        """Тест отмены удаления всех элементов по одному"""
+        linked_list = ConcurrentLinkedList.from_iterable(range(4))
+        nodes = list(linked_list)
+        journal = EditJournal(linked_list)
+        for node in nodes:
+            linked_list.remove_node(node)
+        while journal.undo():
+            pass
+        self.assertEqual(list(linked_list), nodes)
+
+    def test_move_is_one_step(self):
+        """Тест записи перемещения одной правкой"""
+        linked_list = LinkedList.from_iterable(range(3))
+        journal = EditJournal(linked_list)
+        linked_list.move_node(linked_list.first_node, linked_list.last)
+        self.assertEqual(list(reversed(linked_list)), [0, 2, 1])
+        journal.undo()
+        self.assertEqual(list(reversed(linked_list)), [2, 1, 0])
+        self.assertFalse(journal.can_undo)
+
+    def test_new_edit_drops_redo(self):
+        """Тест сброса повтора после новой правки"""
+        linked_list = LinkedList.from_iterable(range(3))
+        journal = EditJournal(linked_list)
+        linked_list.append(3)
+        journal.undo()
+        self.assertTrue(journal.can_redo)
+        linked_list.append(4)
+        self.assertFalse(journal.can_redo)
+        self.assertFalse(journal.redo())
+
+    def test_depth(self):
+        """Тест ограничения глубины истории"""
+        linked_list = LinkedList()
+        journal = EditJournal(linked_list, depth=3)
+        for i in range(10):
+            linked_list.append(i)
+        while journal.undo():
+            pass
+        self.assertEqual(len(linked_list), 7)
+
+    def test_relink_checks(self):
+        """Тест проверок при возврате узлов в потокобезопасный список"""
+        linked_list = ConcurrentLinkedList.from_iterable(range(3))
+        node = linked_list.first_node
+        with self.assertRaises(ValueError):
+            linked_list.relink_nodes([node])
+        gone = linked_list.last
+        linked_list.remove_node(gone)
+        linked_list.remove_node(node)
+        with self.assertRaises(ValueError):
+            linked_list.relink_nodes([node], gone)
+        linked_list.relink_nodes([node, gone])
+        self.assertEqual([item.data for item in linked_list], [0, 2, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 
 import unittest
 
+from array_linked_list import ArrayLinkedList
 from linked_list import LinkedList, LinkedListItem
 
 TEST_LEN = [
@@ -49,6 +50,47 @@ TEST_GETITEM_FAILED = [
     ([1, 2, 4], -4),
 ]
 
+TEST_SIZE_TRACKING = [
+    # (начальный список, добавить слева, добавить справа, удалить)
+    ([], [1], [2], [1, 2]),
+    ([1, 2, 3], [0], [4, 5], [3, 0]),
+    ([1, 1, 1], [], [1], [1, 1, 1, 1]),
+    ([5], [6, 7], [], [5]),
+]
+
+TEST_REMOVE_ORDER = [
+    ([2, 1, 3, 1], 1, [2, 3, 1]),
+    ([1, 2, 1], 1, [2, 1]),
+    ([3, 2, 1], 1, [3, 2]),
+]
+
+TEST_MOVE_NODE = [
+    # (список, индекс узла, индекс узла-якоря или None, ожидаемый список)
+    ([1, 2, 3], 0, 2, [2, 3, 1]),
+    ([1, 2, 3], 2, None, [3, 1, 2]),
+    ([1, 2, 3], 1, 1, [1, 2, 3]),
+    ([1, 2, 3, 4], 3, 0, [1, 4, 2, 3]),
+    ([1], 0, None, [1]),
+]
+
+TEST_SPLICE = [
+    # (список, вставляемый список, индекс узла-якоря или None, ожидаемый список)
+    ([], [1, 2], None, [1, 2]),
+    ([1, 2], [], 0, [1, 2]),
+    ([1, 2], [3, 4], None, [1, 2, 3, 4]),
+    ([1, 2], [3, 4], 0, [1, 3, 4, 2]),
+    ([1, 2, 1], [1], 2, [1, 2, 1, 1]),
+]
+
+TEST_EXTEND = [
+    # (список, добавить справа, добавить слева, ожидаемый список)
+    ([], [], [], []),
+    ([], [1, 2], [], [1, 2]),
+    ([], [], [1, 2], [1, 2]),
+    ([3], [4, 5], [1, 2], [1, 2, 3, 4, 5]),
+    ([1, 1], [1], [1], [1, 1, 1, 1]),
+]
+
 TEST_INSERT = [
     # (create_linked_list([]), 0, 42),
     ([1], 0, 42),
@@ -58,7 +100,7 @@ TEST_INSERT = [
 ]
 
 
-def create_linked_list(nodes_list):
+def create_linked_list(nodes_list, indexed=False):
     """Создание связного списка"""
     first = previous = None
     for item in nodes_list:
@@ -70,7 +112,7 @@ def create_linked_list(nodes_list):
         previous = node
     if previous:
         previous.next = first
-    return LinkedList(first)
+    return LinkedList(first, indexed=indexed)
 
 
 class TestLinkedListItem(unittest.TestCase):
@@ -98,6 +140,12 @@ class TestLinkedListItem(unittest.TestCase):
 
 class TestLinkedList(unittest.TestCase):
     """Тест-кейс класса LinkedList"""
+    def setUp(self):
+        LinkedList.debug = True
+
+    def tearDown(self):
+        LinkedList.debug = False
+
     def test_len(self):
         """Тест метода len"""
         for expected_len in TEST_LEN:
@@ -276,3 +324,265 @@ class TestLinkedList(unittest.TestCase):
                     [item for item in reversed(linked_list)],
                     list(range(i - 1, -1, -1))
                 )
+
+    def test_size_tracking(self):
+        """Тест поддержки кэшированной длины при изменениях списка"""
+        for node_list, left, right, removed in TEST_SIZE_TRACKING:
+            linked_list = create_linked_list(list(node_list))
+            with self.subTest(node_list=node_list, left=left, right=right,
+                              removed=removed):
+                for item in left:
+                    linked_list.append_left(item)
+                for item in right:
+                    linked_list.append_right(item)
+                for item in removed:
+                    linked_list.remove(item)
+                expected = len(node_list) + len(left) + len(right) - len(removed)
+                self.assertEqual(len(linked_list), expected)
+                linked_list.check_consistency()
+
+    def test_indexed(self):
+        """Тест списка с хеш-индексом"""
+        for node_list, remove_item in TEST_REMOVE:
+            linked_list = create_linked_list(node_list, indexed=True)
+            with self.subTest(node_list=node_list, remove_item=remove_item):
+                linked_list.remove(remove_item)
+                self.assertEqual(len(linked_list), len(node_list) - 1)
+        for node_list, remove_item in TEST_REMOVE_FAILED:
+            linked_list = create_linked_list(node_list, indexed=True)
+            with self.subTest(node_list=node_list, remove_item=remove_item):
+                with self.assertRaises(ValueError):
+                    linked_list.remove(remove_item)
+        for node_list, item, expected in TEST_CONTAINS:
+            linked_list = create_linked_list(node_list, indexed=True)
+            with self.subTest(node_list=node_list, item=item, expected=expected):
+                self.assertTrue((item in linked_list) is expected)
+        for node_list, index, data in TEST_INSERT:
+            linked_list = create_linked_list(list(node_list), indexed=True)
+            with self.subTest(node_list=node_list, index=index, data=data):
+                linked_list.insert(linked_list[index], data)
+                expected = list(node_list)
+                expected.insert(index + 1, data)
+                self.assertEqual([i.data for i in linked_list], expected)
+
+    def test_remove_order(self):
+        """Тест удаления первого из одинаковых элементов"""
+        for indexed in (False, True):
+            for node_list, remove_item, expected in TEST_REMOVE_ORDER:
+                linked_list = create_linked_list(node_list, indexed=indexed)
+                with self.subTest(node_list=node_list, indexed=indexed):
+                    linked_list.remove(remove_item)
+                    self.assertEqual([i.data for i in linked_list], expected)
+
+    def test_node_handles(self):
+        """Тест операций над узлами"""
+        linked_list = create_linked_list([1, 2, 3], indexed=True)
+        middle = linked_list.first_node.next
+        new_node = linked_list.insert_after(middle, 42)
+        self.assertTrue(new_node.prev is middle)
+        self.assertEqual([i.data for i in linked_list], [1, 2, 42, 3])
+        head = linked_list.insert_after(None, 0)
+        self.assertTrue(linked_list.first_node is head)
+        linked_list.remove_node(middle)
+        self.assertEqual([i.data for i in linked_list], [0, 1, 42, 3])
+        self.assertFalse(2 in linked_list)
+
+    def test_move_node(self):
+        """Тест перемещения узла"""
+        for node_list, index, after, expected in TEST_MOVE_NODE:
+            linked_list = create_linked_list(node_list, indexed=True)
+            nodes = list(linked_list)
+            with self.subTest(node_list=node_list, index=index, after=after):
+                linked_list.move_node(
+                    nodes[index], None if after is None else nodes[after]
+                )
+                self.assertEqual([i.data for i in linked_list], expected)
+
+    def test_splice(self):
+        """Тест склейки двух списков"""
+        for node_list, other_list, after, expected in TEST_SPLICE:
+            linked_list = create_linked_list(node_list, indexed=True)
+            other = create_linked_list(other_list)
+            nodes = list(linked_list)
+            with self.subTest(node_list=node_list, other_list=other_list,
+                              after=after):
+                linked_list.splice(
+                    other, None if after is None else nodes[after]
+                )
+                self.assertEqual([i.data for i in linked_list], expected)
+                self.assertEqual(len(other), 0)
+                self.assertEqual(list(reversed(linked_list)), expected[::-1])
+
+
+class TestArrayLinkedList(unittest.TestCase):
+    """Тест-кейс класса ArrayLinkedList"""
+    def test_len(self):
+        """Тест метода len"""
+        for expected_len in TEST_LEN:
+            linked_list = ArrayLinkedList(range(expected_len))
+            with self.subTest(expected_len=expected_len):
+                self.assertEqual(len(linked_list), expected_len)
+
+    def test_append_left(self):
+        """Тест метода append_left"""
+        linked_list = ArrayLinkedList([1, 2])
+        linked_list.append_left(0)
+        self.assertEqual([i.data for i in linked_list], [0, 1, 2])
+        self.assertEqual(linked_list.last.next, linked_list.first_node)
+
+    def test_remove(self):
+        """Тест метода remove"""
+        for node_list, remove_item in TEST_REMOVE:
+            linked_list = ArrayLinkedList(node_list)
+            with self.subTest(node_list=node_list, remove_item=remove_item):
+                linked_list.remove(remove_item)
+                self.assertEqual(len(linked_list), len(node_list) - 1)
+        for node_list, remove_item, expected in TEST_REMOVE_ORDER:
+            linked_list = ArrayLinkedList(node_list)
+            with self.subTest(node_list=node_list, remove_item=remove_item):
+                linked_list.remove(remove_item)
+                self.assertEqual([i.data for i in linked_list], expected)
+        for node_list, remove_item in TEST_REMOVE_FAILED:
+            linked_list = ArrayLinkedList(node_list)
+            with self.subTest(node_list=node_list, remove_item=remove_item):
+                with self.assertRaises(ValueError):
+                    linked_list.remove(remove_item)
+
+    def test_insert(self):
+        """Тест метода insert"""
+        for node_list, index, data in TEST_INSERT:
+            linked_list = ArrayLinkedList(node_list)
+            with self.subTest(node_list=node_list, index=index, data=data):
+                linked_list.insert(linked_list[index], data)
+                expected = list(node_list)
+                expected.insert(index + 1, data)
+                self.assertEqual([i.data for i in linked_list], expected)
+
+    def test_move_node(self):
+        """Тест перемещения узла"""
+        for node_list, index, after, expected in TEST_MOVE_NODE:
+            linked_list = ArrayLinkedList(node_list)
+            nodes = list(linked_list)
+            with self.subTest(node_list=node_list, index=index, after=after):
+                linked_list.move_node(
+                    nodes[index], None if after is None else nodes[after]
+                )
+                self.assertEqual([i.data for i in linked_list], expected)
+
+    def test_slot_reuse(self):
+        """Тест повторного использования освобождённых ячеек"""
+        linked_list = ArrayLinkedList([1, 2, 3])
+        linked_list.remove(2)
+        linked_list.append(4)
+        self.assertEqual(len(linked_list._data), 3)  # pylint: disable=W0212
+        self.assertEqual([i.data for i in linked_list], [1, 3, 4])
+
+    def test_getitem(self):
+        """Тест индексации"""
+        for node_list, index in TEST_GETITEM:
+            linked_list = ArrayLinkedList(node_list)
+            with self.subTest(node_list=node_list, index=index):
+                self.assertEqual(linked_list[index], node_list[index])
+        for node_list, index in TEST_GETITEM_FAILED:
+            linked_list = ArrayLinkedList(node_list)
+            with self.subTest(node_list=node_list, index=index):
+                with self.assertRaises(IndexError):
+                    _ = linked_list[index]
+
+    def test_contains(self):
+        """Тест поддержки оператора in"""
+        for node_list, item, expected in TEST_CONTAINS:
+            linked_list = ArrayLinkedList(node_list)
+            with self.subTest(node_list=node_list, item=item, expected=expected):
+                self.assertTrue((item in linked_list) is expected)
+
+    def test_reversed(self):
+        """Тест поддержки функции reversed"""
+        for i in TEST_LEN:
+            linked_list = ArrayLinkedList(range(i))
+            with self.subTest(node_list=list(range(i))):
+                self.assertEqual(
+                    list(reversed(linked_list)), list(range(i - 1, -1, -1))
+                )
+
+    def test_node_at(self):
+        """Тест доступа по индексу с запоминанием позиции"""
+        node_list = list(range(20))
+        linked_list = create_linked_list(node_list)
+        for indices in (range(20), range(19, -1, -1), (5, 14, 6, 13, -1, 0, 7)):
+            with self.subTest(indices=indices):
+                for index in indices:
+                    self.assertEqual(linked_list[index], node_list[index])
+        linked_list.node_at(10)
+        linked_list.remove(3)
+        node_list.remove(3)
+        self.assertEqual(linked_list[10], node_list[10])
+        self.assertTrue(linked_list.node_at(-1) is linked_list.last)
+
+    def test_from_iterable(self):
+        """Тест создания списка из итерируемого объекта"""
+        for i in TEST_LEN:
+            for indexed in (False, True):
+                linked_list = LinkedList.from_iterable(range(i), indexed=indexed)
+                with self.subTest(size=i, indexed=indexed):
+                    self.assertEqual(len(linked_list), i)
+                    self.assertEqual([j.data for j in linked_list], list(range(i)))
+                    self.assertEqual(list(reversed(linked_list)),
+                                     list(range(i - 1, -1, -1)))
+
+    def test_extend(self):
+        """Тест методов extend и extend_left"""
+        for node_list, right, left, expected in TEST_EXTEND:
+            linked_list = create_linked_list(node_list, indexed=True)
+            with self.subTest(node_list=node_list, right=right, left=left):
+                linked_list.extend(right)
+                linked_list.extend_left(left)
+                self.assertEqual([i.data for i in linked_list], expected)
+                self.assertEqual(list(reversed(linked_list)), expected[::-1])
+
+    def test_nested_iteration(self):
+        """Тест вложенных обходов одного списка"""
+        linked_list = create_linked_list([1, 2, 3])
+        pairs = [(i.data, j.data) for i in linked_list for j in linked_list]
+        self.assertEqual(pairs, [(i, j) for i in [1, 2, 3] for j in [1, 2, 3]])
+        forward, backward = iter(linked_list), reversed(linked_list)
+        self.assertEqual(next(forward).data, 1)
+        self.assertEqual(next(backward), 3)
+        self.assertEqual(next(forward).data, 2)
+        self.assertEqual(next(backward), 2)
+
+    def test_listeners(self):
+        """Тест уведомлений об изменениях списка"""
+        linked_list = create_linked_list([1, 2, 3])
+        events = []
+        linked_list.add_listener(
+            lambda event, node, count: events.append(
+                (event, node.data, count, node is linked_list.first_node)
+            )
+        )
+        linked_list.append_left(0)
+        linked_list.remove(2)
+        linked_list.move_node(linked_list.last, None)
+        linked_list.extend([4, 5])
+        self.assertEqual(events, [
+            ('insert', 0, 1, True), ('remove', 2, 1, False),
+            ('remove', 3, 1, False), ('insert', 3, 1, True),
+            ('insert', 4, 2, False),
+        ])
+
+    def test_splice_listeners(self):
+        """Тест уведомлений обоих списков при склейке"""
+        linked_list = create_linked_list([1, 2])
+        other = create_linked_list([7, 8, 9])
+        events = []
+        for name, target in (('self', linked_list), ('other', other)):
+            target.add_listener(
+                lambda event, node, count, name=name, target=target: events.append(
+                    (name, event, node.data, count, node is target.first_node)
+                )
+            )
+        linked_list.splice(other, linked_list.first_node)
+        self.assertEqual(events, [
+            ('other', 'remove', 9, 1, False), ('other', 'remove', 8, 1, False),
+            ('other', 'remove', 7, 1, True), ('self', 'insert', 7, 3, False),
+        ])
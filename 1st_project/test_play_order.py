@@ -0,0 +1,106 @@
+"""Тесты модуля play_order"""
+
+import unittest
+
+from concurrent_linked_list import ConcurrentLinkedList
+from play_order import PlayOrder
+
+
+def play(order, current, steps):
+    """Данные треков, выбранных за несколько шагов"""
+    played = []
+    for _ in range(steps):
+        current = order.next(current)
+        played.append(current.data)
+    return played
+
+
+class TestPlayOrder(unittest.TestCase):
+    """Тест-кейс класса PlayOrder"""
+    def test_ring_order(self):
+        """Тест обычного порядка по кольцу"""
+        playlist = ConcurrentLinkedList.from_iterable(range(3))
+        order = PlayOrder(playlist)
+        self.assertEqual(play(order, None, 5), [0, 1, 2, 0, 1])
+
+    def test_shuffle(self):
+        """Тест случайного порядка"""
+        for size in (1, 2, 10):
+            playlist = ConcurrentLinkedList.from_iterable(range(size))
+            order = PlayOrder(playlist, seed=size)
+            order.shuffle = True
+            with self.subTest(size=size):
+                # Каждый круг - перестановка всех треков
+                self.assertEqual(sorted(play(order, None, size)), list(range(size)))
+                self.assertEqual(sorted(play(order, None, size)), list(range(size)))
+
+    def test_shuffle_changes(self):
+        """Тест изменения плейлиста во время случайного воспроизведения"""
+        playlist = ConcurrentLinkedList.from_iterable(range(6))
+        order = PlayOrder(playlist, seed=1)
+        order.shuffle = True
+        played = play(order, None, 2)
+        remaining = [i for i in range(6) if i not in played]
+        playlist.remove(remaining[0])
+        playlist.append(6)
+        playlist.extend([7, 8])
+        # Перемещение не возвращает сыгранный трек в текущий круг
+        playlist.move_node(playlist.node_at(0), playlist.last)
+        self.assertEqual(sorted(play(order, None, 6)),
+                         sorted(remaining[1:] + [6, 7, 8]))
+
+    def test_queue(self):
+        """Тест очереди воспроизведения"""
+        playlist = ConcurrentLinkedList.from_iterable(range(5))
+        order = PlayOrder(playlist)
+        nodes = list(playlist)
+        order.enqueue(nodes[3])
+        order.enqueue(nodes[1])
+        order.enqueue(nodes[4])
+        playlist.remove_node(nodes[1])
+        current = nodes[0]
+        self.assertEqual(play(order, current, 4), [3, 4, 0, 2])
+        # Перемещённый трек остаётся в очереди
+        order.enqueue(nodes[2])
+        playlist.move_node(nodes[2], None)
+        self.assertEqual(play(order, nodes[0], 1), [2])
+
+    def test_previous(self):
+        """Тест возврата к предыдущему треку"""
+        playlist = ConcurrentLinkedList.from_iterable(range(5))
+        order = PlayOrder(playlist, seed=3)
+        self.assertEqual(order.previous(playlist.first_node).data, 4)
+        order.shuffle = True
+        first = order.next(playlist.first_node)
+        second = order.next(first)
+        self.assertTrue(order.previous(second) is first)
+
+    def test_shuffle_off_remove(self):
+        """Тест удаления трека после выключения случайного порядка"""
+        playlist = ConcurrentLinkedList.from_iterable(range(5))
+        order = PlayOrder(playlist, seed=2)
+        order.shuffle = True
+        order.next(None)
+        order.shuffle = False
+        playlist.remove_node(playlist.node_at(2))
+        self.assertEqual(play(order, playlist.first_node, 4), [1, 3, 4, 0])
+
+    def test_peek(self):
+        """Тест просмотра следующего трека без перехода к нему"""
+        playlist = ConcurrentLinkedList.from_iterable(range(6))
+        order = PlayOrder(playlist, seed=4)
+        nodes = list(playlist)
+        self.assertTrue(order.peek(nodes[0]) is nodes[1])
+        order.enqueue(nodes[4])
+        self.assertTrue(order.peek(nodes[0]) is nodes[4])
+        self.assertTrue(order.next(nodes[0]) is nodes[4])
+        order.shuffle = True
+        current = None
+        for _ in range(12):
+            upcoming = order.peek(current)
+            current = order.next(current)
+            self.assertTrue(upcoming is current)
+        # Удалённый трек больше не выбирается
+        upcoming = order.peek(current)
+        playlist.remove_node(upcoming)
+        self.assertFalse(order.next(current) is upcoming)
@@ -0,0 +1,137 @@
+"""Тесты модуля playlist_store"""
+
+import os
+import tempfile
+import unittest
+
+from edit_journal import EditJournal
+from linked_list import LinkedList
+from music_track import MusicTrack
+from playlist_store import PlaylistStore
+
+
+def paths(playlist):
+    """Пути треков плейлиста по порядку"""
+    return [node.data.path for node in playlist]
+
+
+class TestPlaylistStore(unittest.TestCase):
+    """Тест-кейс класса PlaylistStore"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.path = os.path.join(self.directory.name, 'playlist.plst')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def load(self):
+        """Загрузка плейлиста из файла в новый список"""
+        playlist = LinkedList(indexed=True)
+        PlaylistStore(self.path, playlist).load()
+        return playlist
+
+    def test_save_load(self):
+        """Тест сохранения и загрузки снимка"""
+        for tracks in ([], ['a.mp3'], ['a.mp3', 'трек.wav', 'a.mp3']):
+            playlist = LinkedList.from_iterable(map(MusicTrack, tracks))
+            with self.subTest(tracks=tracks):
+                PlaylistStore(self.path, playlist).save()
+                self.assertEqual(paths(self.load()), tracks)
+
+    def test_journal(self):
+        """Тест журнала изменений"""
+        playlist = LinkedList.from_iterable(map(MusicTrack, ['a', 'b', 'c']))
+        store = PlaylistStore(self.path, playlist)
+        store.save()
+        size = os.path.getsize(self.path)
+
+        playlist.append(MusicTrack('d'))
+        store.record_append(MusicTrack('d'))
+        playlist.insert_after(playlist.node_at(0), MusicTrack('e'))
+        store.record_insert(1, MusicTrack('e'))
+        playlist.remove_node(playlist.node_at(2))
+        store.record_remove(2)
+        playlist.move_node(playlist.node_at(3), None)
+        store.record_move(3, 0)
+        playlist.move_node(playlist.node_at(0), playlist.node_at(2))
+        store.record_move(0, 2)
+        store.close()
+
+        self.assertTrue(os.path.getsize(self.path) > size)
+        self.assertEqual(paths(self.load()), paths(playlist))
+        self.assertEqual(paths(playlist), ['a', 'e', 'd', 'c'])
+
+    def test_compaction(self):
+        """Тест сжатия журнала"""
+        playlist = LinkedList()
+        store = PlaylistStore(self.path, playlist, compact_threshold=3)
+        for name in 'abcdef':
+            playlist.append(MusicTrack(name))
+            store.record_append(MusicTrack(name))
+        for _ in range(4):
+            playlist.move_node(playlist.node_at(0), playlist.last)
+            store.record_move(0, len(playlist) - 1)
+        store.close()
+        compacted = PlaylistStore(self.path, LinkedList())
+        compacted.load()
+        self.assertEqual(paths(compacted.playlist), paths(playlist))
+        self.assertEqual(compacted._journal_records, 0)  # pylint: disable=W0212
+
+    def test_truncated(self):
+        """Тест файла, запись в который оборвалась посередине записи"""
+        # Обрыв в заголовке записи и посередине пути
+        for cut in (10, 3):
+            playlist = LinkedList.from_iterable(map(MusicTrack, ['a', 'b']))
+            store = PlaylistStore(self.path, playlist)
+            store.save()
+            store.record_append(MusicTrack('трек'))
+            store.close()
+            with open(self.path, 'r+b') as file:
+                file.truncate(os.path.getsize(self.path) - cut)
+            with self.subTest(cut=cut):
+                self.assertEqual(paths(self.load()), ['a', 'b'])
+                # Повреждённый хвост отброшен, новые записи читаются
+                playlist = self.load()
+                store = PlaylistStore(self.path, playlist)
+                store.record_remove(0)
+                store.close()
+                self.assertEqual(paths(self.load()), ['b'])
+
+    def test_stale_position(self):
+        """Тест записи журнала с позицией за концом плейлиста"""
+        playlist = LinkedList.from_iterable(map(MusicTrack, ['a', 'b', 'c']))
+        store = PlaylistStore(self.path, playlist)
+        store.save()
+        store.record_remove(0)
+        store.record_move(5, 0)
+        store.record_remove(0)
+        store.close()
+        self.assertEqual(paths(self.load()), ['b', 'c'])
+        self.assertEqual(paths(self.load()), ['b', 'c'])
+
+    def test_replay(self):
+        """Тест записи отмены и повтора правок в журнал"""
+        playlist = LinkedList.from_iterable(map(MusicTrack, 'abcde'))
+        journal = EditJournal(playlist)
+        store = PlaylistStore(self.path, playlist)
+        store.save()
+
+        def row_of(node):
+            return next(row for row, other in enumerate(playlist) if other is node)
+
+        playlist.extend(map(MusicTrack, 'fg'))
+        store.record_extend([MusicTrack('f'), MusicTrack('g')])
+        playlist.remove_node(playlist.node_at(1))
+        store.record_remove(1)
+        playlist.move_node(playlist.node_at(0), playlist.node_at(3))
+        store.record_move(0, 3)
+        size = os.path.getsize(self.path)
+
+        for undo in (True, True, True, False, False, True, False, False):
+            with self.subTest(undo=undo):
+                self.assertTrue(store.replay(journal, undo, row_of))
+                self.assertEqual(paths(self.load()), paths(playlist))
+        self.assertFalse(store.replay(journal, False, row_of))
+        store.close()
+        # Журнал дописывался, а не переписывался
+        self.assertTrue(os.path.getsize(self.path) > size)
@@ -0,0 +1,109 @@
+"""Тесты модуля track_index"""
+
+import unittest
+
+from linked_list import LinkedList
+from music_track import MusicTrack
+from track_index import TrackSearchIndex
+from track_metadata import TrackMetadata
+
+TEST_TRACKS = [
+    '/music/Queen - Bohemian Rhapsody.mp3',
+    '/music/Queen - Radio Ga Ga.mp3',
+    '/music/Кино - Группа крови.mp3',
+    '/music/radiohead/Creep.wav',
+]
+
+TEST_SEARCH = [
+    ('queen', [0, 1]),
+    ('RADIO', [1, 3]),
+    ('группа', [2]),
+    ('ga', [1]),
+    ('q', [0, 1]),
+    ('.wav', [3]),
+    ('music/', [0, 1, 2]),
+    ('mp4', []),
+    ('queen - x', []),
+    ('', []),
+]
+
+
+class FakeMetadataCache:
+    """Кэш метаданных, которые уже известны, без фоновых потоков"""
+    def __init__(self, known):
+        self.known = known
+        self.queued = []
+
+    def lookup(self, track):
+        """Метаданные из памяти или постановка трека в очередь"""
+        if track.metadata is None:
+            track.metadata = self.known.get(track.path)
+            if track.metadata is None:
+                self.queued.append(track.path)
+        return track.metadata
+
+
+def found(index, query):
+    """Пути найденных треков"""
+    return sorted(node.data.path for node in index.search(query))
+
+
+class TestTrackSearchIndex(unittest.TestCase):
+    """Тест-кейс класса TrackSearchIndex"""
+    def test_search(self):
+        """Тест поиска по имени файла"""
+        playlist = LinkedList.from_iterable(map(MusicTrack, TEST_TRACKS))
+        index = TrackSearchIndex(playlist)
+        for query, expected in TEST_SEARCH:
+            with self.subTest(query=query):
+                self.assertEqual(found(index, query),
+                                 sorted(TEST_TRACKS[i] for i in expected))
+
+    def test_changes(self):
+        """Тест обновления индекса при изменении плейлиста"""
+        playlist = LinkedList()
+        index = TrackSearchIndex(playlist)
+        playlist.extend(map(MusicTrack, TEST_TRACKS[:2]))
+        playlist.append(MusicTrack(TEST_TRACKS[3]))
+        self.assertEqual(found(index, 'radio'), [TEST_TRACKS[1], TEST_TRACKS[3]])
+        playlist.remove(MusicTrack(TEST_TRACKS[1]))
+        playlist.move_node(playlist.last, None)
+        self.assertEqual(found(index, 'radio'), [TEST_TRACKS[3]])
+        self.assertEqual(len(index.search('e', limit=1)), 1)
+
+    def test_metadata(self):
+        """Тест поиска по названию после получения метаданных"""
+        playlist = LinkedList.from_iterable(map(MusicTrack, TEST_TRACKS))
+        playlist.append(MusicTrack(TEST_TRACKS[3]))
+        index = TrackSearchIndex(playlist)
+        self.assertEqual(found(index, 'acoustic'), [])
+        index.reindex_path(TEST_TRACKS[3], TrackMetadata('Creep (Acoustic)', 239.0, 1, 0.0))
+        self.assertEqual(found(index, 'acoustic'), [TEST_TRACKS[3]] * 2)
+        index.reindex_path('/music/missing.mp3', TrackMetadata('Acoustic', None, 0, 0.0))
+        self.assertEqual(len(index.search('acoustic')), 2)
+
+    def test_splice(self):
+        """Тест индексов обоих плейлистов после склейки"""
+        playlist = LinkedList.from_iterable(map(MusicTrack, TEST_TRACKS[:2]), indexed=True)
+        other = LinkedList.from_iterable(map(MusicTrack, TEST_TRACKS[2:]), indexed=True)
+        index, other_index = TrackSearchIndex(playlist), TrackSearchIndex(other)
+        playlist.splice(other)
+        self.assertEqual(found(index, 'creep'), [TEST_TRACKS[3]])
+        self.assertEqual(found(other_index, 'creep'), [])
+        playlist.remove(MusicTrack(TEST_TRACKS[3]))
+        self.assertEqual(found(index, 'creep'), [])
+        self.assertEqual(found(other_index, 'creep'), [])
+
+    def test_metadata_cache(self):
+        """Тест запроса метаданных для добавленных треков"""
+        cache = FakeMetadataCache({
+            TEST_TRACKS[3]: TrackMetadata('Creep (Acoustic)', 239.0, 1, 0.0),
+        })
+        playlist = LinkedList.from_iterable(map(MusicTrack, TEST_TRACKS[:1]))
+        index = TrackSearchIndex(playlist, cache)
+        playlist.append(MusicTrack(TEST_TRACKS[3]))
+        # Название из памяти попадает в индекс сразу
+        self.assertEqual(found(index, 'acoustic'), [TEST_TRACKS[3]])
+        self.assertEqual(cache.queued, [TEST_TRACKS[0]])
+        index.reindex_path(TEST_TRACKS[0], TrackMetadata('Bohemian Live', None, 1, 0.0))
+        self.assertEqual(found(index, 'live'), [TEST_TRACKS[0]])
@@ -0,0 +1,115 @@
+"""Тесты модуля track_metadata"""
+
+import os
+import tempfile
+import threading
+import unittest
+import wave
+
+from music_track import MusicTrack
+from track_metadata import MetadataCache, extract_metadata
+
+
+class TestTrackMetadata(unittest.TestCase):
+    """Тест-кейс кэша метаданных"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        self.track = os.path.join(self.directory.name, 'Песня.wav')
+        with wave.open(self.track, 'wb') as audio:
+            audio.setnchannels(1)
+            audio.setsampwidth(2)
+            audio.setframerate(8000)
+            audio.writeframes(b'\0\0' * 16000)
+        self.db_path = os.path.join(self.directory.name, 'metadata.sqlite')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_extract(self):
+        """Тест извлечения метаданных"""
+        metadata = extract_metadata(self.track)
+        self.assertEqual(metadata.title, 'Песня')
+        self.assertAlmostEqual(metadata.duration, 2.0)
+        self.assertEqual(metadata.size, os.path.getsize(self.track))
+
+    def test_cache(self):
+        """Тест фонового заполнения и сохранения кэша"""
+        calls = []
+        ready = threading.Event()
+
+        def extractor(path):
+            calls.append(path)
+            return extract_metadata(path)
+
+        cache = MetadataCache(self.db_path, on_ready=lambda *_: ready.set(),
+                              extractor=extractor)
+        track = MusicTrack(self.track)
+        self.assertIsNone(cache.lookup(track))
+        self.assertTrue(ready.wait(5))
+        self.assertEqual(cache.lookup(track).title, 'Песня')
+        self.assertEqual(track.title, 'Песня')
+        cache.close()
+
+        # Повторный запуск берёт метаданные из файла кэша
+        ready.clear()
+        cache = MetadataCache(self.db_path, on_ready=lambda *_: ready.set(),
+                              extractor=extractor)
+        cache.get(self.track)
+        self.assertTrue(ready.wait(5))
+        self.assertAlmostEqual(cache.get(self.track).duration, 2.0)
+        self.assertEqual(calls, [self.track])
+        cache.close()
+
+    def test_failure(self):
+        """Тест файла, метаданные которого не читаются"""
+        calls = []
+        ready = threading.Event()
+
+        def extractor(path):
+            calls.append(path)
+            raise ZeroDivisionError
+
+        cache = MetadataCache(self.db_path, on_ready=lambda *_: ready.set(),
+                              extractor=extractor)
+        missing = os.path.join(self.directory.name, 'Нет файла.mp3')
+        for path in (self.track, missing):
+            ready.clear()
+            with self.subTest(path=path):
+                self.assertIsNone(cache.get(path))
+                self.assertTrue(ready.wait(5))
+                metadata = cache.get(path)
+                self.assertEqual(metadata.title, os.path.basename(path)[:-4])
+                self.assertIsNone(metadata.duration)
+        cache.close()
+        # Неудача запоминается, файл не ставится в очередь повторно
+        self.assertEqual(calls, [self.track])
+
+    def test_close(self):
+        """Тест закрытия кэша во время извлечения метаданных"""
+        calls = []
+        ready = []
+        started, release = threading.Event(), threading.Event()
+
+        def extractor(path):
+            calls.append(path)
+            started.set()
+            release.wait(5)
+            return extract_metadata(path)
+
+        cache = MetadataCache(self.db_path, on_ready=lambda *args: ready.append(args),
+                              extractor=extractor, workers=1)
+        cache.get(self.track)
+        cache.get(os.path.join(self.directory.name, 'other.wav'))
+        self.assertTrue(started.wait(5))
+        closer = threading.Thread(target=cache.close, kwargs={'wait': False})
+        with self.assertNoLogs('track_metadata'):
+            closer.start()
+            while not cache._closed:  # pylint: disable=W0212
+                closer.join(0.001)
+            release.set()
+            closer.join(5)
+        self.assertFalse(closer.is_alive())
+        # Запущенное извлечение дождались, стоявшее в очереди отменено
+        self.assertEqual(calls, [self.track])
+        self.assertEqual(ready, [])
+        self.assertIsNone(cache.get(self.track + '.missing'))
@@ -0,0 +1,71 @@
+"""Тесты модуля track_prefetcher"""
+
+import threading
+import unittest
+
+from concurrent_linked_list import ConcurrentLinkedList
+from music_track import MusicTrack
+from track_prefetcher import TrackPrefetcher
+
+
+class CountingLoader:
+    """Загрузчик, считающий обращения к диску"""
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, path):
+        with self.lock:
+            self.calls.append(path)
+        return path.encode()
+
+
+class TestTrackPrefetcher(unittest.TestCase):
+    """Тест-кейс класса TrackPrefetcher"""
+    def test_get(self):
+        """Тест загрузки и кэширования трека"""
+        loader = CountingLoader()
+        prefetcher = TrackPrefetcher(loader=loader)
+        self.assertEqual(prefetcher.get('a'), b'a')
+        self.assertEqual(prefetcher.get('a'), b'a')
+        self.assertEqual(loader.calls, ['a'])
+        prefetcher.close()
+
+    def test_lru(self):
+        """Тест вытеснения давно использованных треков"""
+        loader = CountingLoader()
+        prefetcher = TrackPrefetcher(capacity=2, loader=loader)
+        for path in ('a', 'b', 'a', 'c', 'a', 'b'):
+            prefetcher.get(path)
+        self.assertEqual(loader.calls, ['a', 'b', 'c', 'b'])
+        prefetcher.close()
+
+    def test_prefetch_around(self):
+        """Тест упреждающей загрузки соседних треков"""
+        loader = CountingLoader()
+        prefetcher = TrackPrefetcher(depth=2, loader=loader)
+        playlist = ConcurrentLinkedList.from_iterable(map(MusicTrack, 'abcdef'))
+        prefetcher.prefetch_around(playlist, playlist.node_at(0))
+        prefetcher.close(wait=True)
+        self.assertEqual(sorted(loader.calls), ['b', 'c', 'e', 'f'])
+        for path in 'bcef':
+            prefetcher.get(path)
+        self.assertEqual(len(loader.calls), 4)
+
+    def test_failure(self):
+        """Тест повторной загрузки трека после ошибки загрузчика"""
+        calls = []
+
+        def loader(path):
+            calls.append(path)
+            if len(calls) == 1:
+                raise RuntimeError(path)
+            return path.encode()
+
+        prefetcher = TrackPrefetcher(loader=loader)
+        prefetcher.schedule('a')
+        # Поток один, так что пустая задача завершается после загрузки
+        prefetcher._executor.submit(lambda: None).result()  # pylint: disable=W0212
+        self.assertEqual(prefetcher.get('a'), b'a')
+        self.assertEqual(calls, ['a', 'a'])
+        prefetcher.close()
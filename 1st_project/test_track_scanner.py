@@ -0,0 +1,59 @@
+"""Тесты модуля track_scanner"""
+
+import os
+import tempfile
+import unittest
+
+from track_scanner import TrackScanner
+
+TEST_TREE = [
+    'a.mp3', 'b.txt', 'C.WAV',
+    os.path.join('x', 'd.mp3'),
+    os.path.join('x', 'y', 'e.ogg'),
+    os.path.join('x', 'y', 'f.jpg'),
+    os.path.join('z', 'g.flac'),
+]
+
+
+class TestTrackScanner(unittest.TestCase):
+    """Тест-кейс класса TrackScanner"""
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=R1732
+        for name in TEST_TREE:
+            path = os.path.join(self.directory.name, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb'):
+                pass
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_scan(self):
+        """Тест поиска треков пачками"""
+        for batch_size in (1, 2, 100):
+            batches, progress = [], []
+            scanner = TrackScanner(self.directory.name, batch_size=batch_size)
+            with self.subTest(batch_size=batch_size):
+                found = scanner.scan(batches.append,
+                                     lambda *args: progress.append(args))
+                names = sorted(os.path.relpath(track.path, self.directory.name)
+                               for batch in batches for track in batch)
+                self.assertEqual(names, sorted(
+                    name for name in TEST_TREE
+                    if name.lower().endswith(('.mp3', '.wav', '.ogg', '.flac'))
+                ))
+                self.assertEqual(found, 5)
+                self.assertTrue(all(len(batch) <= batch_size for batch in batches))
+                self.assertEqual(progress[-1], (4, 5))
+
+    def test_cancel(self):
+        """Тест отмены поиска"""
+        batches = []
+        scanner = TrackScanner(self.directory.name, batch_size=1)
+
+        def on_batch(batch):
+            batches.append(batch)
+            scanner.cancel()
+
+        scanner.scan(on_batch)
+        self.assertEqual(len(batches), 1)
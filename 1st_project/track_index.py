@@ -0,0 +1,153 @@
+"""Incremental search index over the tracks of a playlist"""
+
+import os
+from collections import defaultdict
+
+
+def track_key(track) -> str:
+    """Returns the lower-cased text a track is searched by.
+
+    This is the file name with its parent directory (usually the
+    artist or the album) and, when the metadata is already known,
+    the title.
+
+    Args:
+        track (MusicTrack): The track.
+
+    Returns:
+        str: The searchable text.
+    """
+    directory, name = os.path.split(track.path)
+    key = os.path.join(os.path.basename(directory), name)
+    if track.metadata is not None and track.metadata.title not in key:
+        key += '\n' + track.metadata.title
+    return key.lower()
+
+
+def trigrams(text: str) -> set:
+    """Returns the set of three-character substrings of a text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrackSearchIndex:
+    """Trigram index mapping searchable text to playlist nodes.
+
+    Every trigram of a track's key points to the set of nodes containing
+    it. A query of three or more characters intersects the sets of its
+    trigrams, starting from the smallest, and checks only the remaining
+    candidates; shorter queries scan the stored keys. The index listens
+    to the playlist, so it follows every insertion and removal.
+
+    With a metadata cache, every inserted track is looked up in it: a
+    title already in memory goes into the key right away, and a missing
+    one is queued, to be added by `reindex_path` once it arrives.
+    """
+
+    def __init__(self, playlist, metadata=None):
+        """Builds the index and subscribes to the playlist.
+
+        Args:
+            playlist (LinkedList): The playlist of `MusicTrack`s to index.
+            metadata (MetadataCache): Optional cache to take titles from.
+        """
+        self._playlist = playlist
+        self._metadata = metadata
+        self._grams = defaultdict(set)
+        self._keys = {}
+        self._paths = defaultdict(set)
+        if len(playlist):
+            self._add_run(playlist.first_node, len(playlist))
+        playlist.add_listener(self._on_change)
+
+    def _add(self, node):
+        """Indexes one node."""
+        if self._metadata is not None:
+            self._metadata.lookup(node.data)
+        key = track_key(node.data)
+        self._keys[node] = key
+        self._paths[node.data.path].add(node)
+        for gram in trigrams(key):
+            self._grams[gram].add(node)
+
+    def _add_run(self, node, count: int):
+        """Indexes `count` consecutive nodes starting at `node`."""
+        for _ in range(count):
+            self._add(node)
+            node = node._next  # pylint: disable=W0212
+
+    def _discard(self, node):
+        """Removes one node from the index."""
+        key = self._keys.pop(node)
+        nodes = self._paths[node.data.path]
+        nodes.discard(node)
+        if not nodes:
+            del self._paths[node.data.path]
+        for gram in trigrams(key):
+            nodes = self._grams[gram]
+            nodes.discard(node)
+            if not nodes:
+                del self._grams[gram]
+
+    def _on_change(self, event: str, node, count: int):
+        """Follows a change of the playlist."""
+        if event == 'insert':
+            self._add_run(node, count)
+        elif node in self._keys:
+            self._discard(node)
+
+    def reindex(self, node):
+        """Re-reads the key of a node, e.g. after its metadata arrived.
+
+        Args:
+            node: A node of the indexed playlist.
+        """
+        if node in self._keys:
+            self._discard(node)
+            self._add(node)
+
+    def reindex_path(self, path: str, metadata=None):
+        """Re-reads the keys of every track with a path.
+
+        Args:
+            path (str): The file path of the tracks.
+            metadata (TrackMetadata): Optional metadata of the file to
+            store on the tracks first.
+        """
+        for node in tuple(self._paths.get(path, ())):
+            if metadata is not None:
+                node.data.metadata = metadata
+            self.reindex(node)
+
+    def search(self, query: str, limit: int = None) -> list:
+        """Finds the nodes whose key contains the query.
+
+        Args:
+            query (str): The text to look for, case-insensitive.
+            limit (int): Optional maximal number of results.
+
+        Returns:
+            list: The matching nodes, in no particular order.
+        """
+        query = query.lower()
+        if not query:
+            return []
+
+        if len(query) < 3:
+            candidates = self._keys
+        else:
+            postings = []
+            for gram in trigrams(query):
+                nodes = self._grams.get(gram)
+                if not nodes:
+                    return []
+                postings.append(nodes)
+            postings.sort(key=len)
+            candidates = postings[0].intersection(*postings[1:])
+
+        result = []
+        for node in candidates:
+            if query in self._keys[node]:
+                result.append(node)
+                if limit is not None and len(result) >= limit:
+                    break
+        return result
@@ -0,0 +1,205 @@
+"""Track metadata extraction and persistent caching"""
+
+import logging
+import os
+import sqlite3
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+
+try:
+    import mutagen
+except ImportError:  # pragma: no cover - optional dependency
+    mutagen = None
+
+logger = logging.getLogger(__name__)
+
+
+class TrackMetadata(NamedTuple):
+    """Metadata of an audio file."""
+    title: str
+    duration: Optional[float]
+    size: int
+    mtime: float
+
+
+def file_title(path: str) -> str:
+    """Returns the file name of a track without its extension."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def fallback_metadata(path: str) -> TrackMetadata:
+    """Returns the metadata shown for a file that cannot be read.
+
+    Args:
+        path (str): The file path of the track.
+
+    Returns:
+        TrackMetadata: The file name as the title and an unknown duration.
+    """
+    return TrackMetadata(file_title(path), None, 0, 0.0)
+
+
+def extract_metadata(path: str) -> TrackMetadata:
+    """Reads the metadata of an audio file from disk.
+
+    The duration of WAV files is read with the standard `wave` module;
+    other formats and tag titles need the optional `mutagen` package.
+    Without it the title is the file name and the duration is unknown.
+
+    Args:
+        path (str): The file path of the track.
+
+    Returns:
+        TrackMetadata: The metadata of the file.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    stat = os.stat(path)
+    title = file_title(path)
+    duration = None
+
+    if mutagen is not None:
+        try:
+            audio = mutagen.File(path, easy=True)
+        except mutagen.MutagenError:
+            audio = None
+        if audio is not None:
+            if audio.info is not None:
+                duration = audio.info.length
+            if audio.tags and audio.tags.get('title'):
+                title = audio.tags['title'][0]
+    if duration is None and path.lower().endswith('.wav'):
+        try:
+            with wave.open(path, 'rb') as audio:
+                duration = audio.getnframes() / audio.getframerate()
+        except (wave.Error, EOFError):
+            pass
+
+    return TrackMetadata(title, duration, stat.st_size, stat.st_mtime)
+
+
+class MetadataCache:
+    """Metadata of tracks kept in memory and in an SQLite file.
+
+    Lookups never touch the audio files: known entries are answered from
+    memory, unknown ones are queued for a background worker pool, which
+    reuses the on-disk entry when the file's mtime has not changed and
+    extracts the metadata otherwise. A file that cannot be read gets
+    `fallback_metadata` for the rest of the session, so it is not queued
+    again on every lookup. `on_ready` is called from a worker thread
+    whenever new metadata becomes available.
+    """
+
+    def __init__(self, db_path: str, on_ready=None, workers: int = 2,
+                 extractor=extract_metadata):
+        """Opens (or creates) the cache.
+
+        Args:
+            db_path (str): The SQLite file to keep the cache in.
+            on_ready: Optional callable taking the path and the metadata.
+            workers (int): The number of background extraction threads.
+            extractor: A function that reads the metadata of a path.
+        """
+        self.on_ready = on_ready
+        self._extractor = extractor
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS metadata ('
+            'path TEXT PRIMARY KEY, mtime REAL, size INTEGER, '
+            'title TEXT, duration REAL)'
+        )
+        self._memory = {}
+        self._pending = set()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=workers,
+                                            thread_name_prefix='metadata')
+
+    def get(self, path: str) -> Optional[TrackMetadata]:
+        """Returns the metadata of a track if it is known.
+
+        Unknown tracks are queued for the background workers.
+
+        Args:
+            path (str): The file path of the track.
+
+        Returns:
+            TrackMetadata: The metadata, or None if it is not known yet.
+        """
+        with self._lock:
+            metadata = self._memory.get(path)
+            if metadata is not None or path in self._pending or self._closed:
+                return metadata
+            self._pending.add(path)
+        self._executor.submit(self._fill, path)
+        return None
+
+    def lookup(self, track) -> Optional[TrackMetadata]:
+        """Returns the metadata of a `MusicTrack` and caches it on the track.
+
+        Args:
+            track (MusicTrack): The track.
+
+        Returns:
+            TrackMetadata: The metadata, or None if it is not known yet.
+        """
+        if track.metadata is None:
+            track.metadata = self.get(track.path)
+        return track.metadata
+
+    def _stored(self, path: str, mtime: float) -> Optional[TrackMetadata]:
+        """Reads an on-disk entry that is still valid for the mtime."""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT title, duration, size, mtime FROM metadata '
+                'WHERE path = ? AND mtime = ?', (path, mtime)
+            ).fetchone()
+        return TrackMetadata(*row) if row else None
+
+    def _fill(self, path: str):
+        """Finds or extracts the metadata of a track on a worker thread."""
+        try:
+            metadata = self._stored(path, os.stat(path).st_mtime)
+            if metadata is None:
+                metadata = self._extractor(path)
+                with self._lock:
+                    self._db.execute(
+                        'INSERT OR REPLACE INTO metadata '
+                        '(path, mtime, size, title, duration) VALUES (?, ?, ?, ?, ?)',
+                        (path, metadata.mtime, metadata.size,
+                         metadata.title, metadata.duration)
+                    )
+                    self._db.commit()
+        except Exception:  # pylint: disable=W0703
+            # Any failure would otherwise leave the path pending forever
+            logger.warning("Cannot read the metadata of %s", path, exc_info=True)
+            metadata = fallback_metadata(path)
+
+        with self._lock:
+            self._memory[path] = metadata
+            self._pending.discard(path)
+            if self._closed:
+                # Whoever listens may already be gone
+                return
+        if self.on_ready:
+            self.on_ready(path, metadata)
+
+    def close(self, wait: bool = True):
+        """Stops the workers and closes the database.
+
+        Extractions that are already running are always waited for, so
+        none of them touches the closed database. Once the cache is
+        closed, `on_ready` is no longer called and lookups queue nothing.
+
+        Args:
+            wait (bool): Whether to finish the queued extractions first
+            instead of cancelling them.
+        """
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=not wait)
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,123 @@
+"""Background prefetching of music tracks"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+def read_track(path: str) -> bytes:
+    """Reads the whole audio file into memory.
+
+    Args:
+        path (str): The file path of the track.
+
+    Returns:
+        bytes: The contents of the file.
+    """
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+class TrackPrefetcher:
+    """Loads upcoming tracks on a background thread into an LRU cache.
+
+    Once a track starts playing, the tracks around it in the playlist are
+    read ahead, so switching to the next or previous one does not touch
+    the disk on the UI thread.
+    """
+
+    def __init__(self, depth: int = 2, capacity: int = 8, loader=read_track):
+        """Initializes the prefetcher.
+
+        Args:
+            depth (int): How many tracks to read ahead in each direction.
+            capacity (int): The maximal number of tracks kept in memory.
+            loader: A function that loads a track by its path.
+        """
+        self.depth = depth
+        self.capacity = capacity
+        self._loader = loader
+        self._cache = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1,
+                                            thread_name_prefix='prefetch')
+
+    def _store(self, path: str, data: bytes):
+        """Puts a loaded track into the cache, evicting the oldest ones."""
+        with self._lock:
+            self._pending.pop(path, None)
+            self._cache[path] = data
+            self._cache.move_to_end(path)
+            while len(self._cache) > self.capacity:
+                self._cache.popitem(last=False)
+
+    def _load(self, path: str) -> bytes:
+        """Loads a track on the background thread."""
+        try:
+            data = self._loader(path)
+            self._store(path, data)
+            return data
+        finally:
+            # A failed load must not stay pending, or get() re-raises it forever
+            with self._lock:
+                self._pending.pop(path, None)
+
+    def schedule(self, path: str):
+        """Starts loading a track in the background unless it is cached.
+
+        Args:
+            path (str): The file path of the track.
+        """
+        with self._lock:
+            if path in self._cache or path in self._pending:
+                return
+            self._pending[path] = self._executor.submit(self._load, path)
+
+    def get(self, path: str) -> bytes:
+        """Returns the contents of a track, loading it if needed.
+
+        Args:
+            path (str): The file path of the track.
+
+        Returns:
+            bytes: The contents of the file.
+        """
+        with self._lock:
+            if path in self._cache:
+                self._cache.move_to_end(path)
+                return self._cache[path]
+            future = self._pending.get(path)
+        if future is not None:
+            return future.result()
+        data = self._loader(path)
+        self._store(path, data)
+        return data
+
+    def prefetch_around(self, playlist, node):
+        """Schedules the tracks around a node of the playlist.
+
+        The nearest tracks are scheduled first, alternating between the
+        next and the previous direction.
+
+        Args:
+            playlist (ConcurrentLinkedList): The playlist being played.
+            node: The node of the track that has just started.
+        """
+        forward = backward = node
+        for _ in range(self.depth):
+            forward = playlist.successor(forward)
+            backward = playlist.predecessor(backward)
+            if forward is None:
+                return
+            self.schedule(forward.data.path)
+            self.schedule(backward.data.path)
+
+    def close(self, wait: bool = False):
+        """Stops the background thread.
+
+        Args:
+            wait (bool): Whether to finish the scheduled loads first
+            instead of dropping them.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
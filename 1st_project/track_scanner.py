@@ -0,0 +1,116 @@
+"""Background discovery of music tracks in a directory tree"""
+
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from music_track import MusicTrack
+
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.ogg', '.flac'})
+
+
+def scan_directory(path: str, extensions=AUDIO_EXTENSIONS):
+    """Lists one directory without descending into it.
+
+    Args:
+        path (str): The directory to list.
+        extensions: The lower-case file extensions to keep.
+
+    Returns:
+        tuple: The sorted paths of the audio files and of the
+        subdirectories. Unreadable directories are treated as empty.
+    """
+    files, directories = [], []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in extensions:
+                        files.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    files.sort()
+    directories.sort()
+    return files, directories
+
+
+class TrackScanner:
+    """Recursively finds audio files and hands them out in batches.
+
+    Directories are listed on a thread pool, one task per directory, so
+    slow disks and network shares are read in parallel. Found tracks are
+    delivered to the caller in batches, which lets the receiver append
+    them to a playlist in bulk.
+    """
+
+    def __init__(self, root: str, extensions=AUDIO_EXTENSIONS,
+                 batch_size: int = 500, workers: int = 4):
+        """Initializes the scanner.
+
+        Args:
+            root (str): The directory to scan.
+            extensions: The lower-case file extensions to keep.
+            batch_size (int): The number of tracks per batch.
+            workers (int): The number of directories listed at once.
+        """
+        self.root = root
+        self.extensions = extensions
+        self.batch_size = batch_size
+        self.workers = workers
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Asks a running scan to stop; safe to call from any thread."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the scan has been cancelled."""
+        return self._cancelled.is_set()
+
+    def scan(self, on_batch, on_progress=None) -> int:
+        """Scans the tree, blocking until done or cancelled.
+
+        Callbacks are called from the thread that runs `scan`.
+
+        Args:
+            on_batch: Called with each list of found `MusicTrack`s.
+            on_progress: Optional, called with the number of listed
+            directories and the number of found tracks after each batch.
+
+        Returns:
+            int: The number of tracks delivered.
+        """
+        batch = []
+        found = directories_done = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = {executor.submit(scan_directory, self.root, self.extensions)}
+            while pending and not self.cancelled:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, directories = future.result()
+                    directories_done += 1
+                    for directory in directories:
+                        pending.add(
+                            executor.submit(scan_directory, directory, self.extensions)
+                        )
+                    batch.extend(MusicTrack(path) for path in files)
+                    while len(batch) >= self.batch_size and not self.cancelled:
+                        found += self.batch_size
+                        on_batch(batch[:self.batch_size])
+                        del batch[:self.batch_size]
+                        if on_progress:
+                            on_progress(directories_done, found)
+            for future in pending:
+                future.cancel()
+
+        if batch and not self.cancelled:
+            found += len(batch)
+            on_batch(batch)
+        if on_progress:
+            on_progress(directories_done, found)
+        return found
@@ -1,17 +1,48 @@
+from array import array
+from collections import deque
+from typing import Iterable, Iterator
+
+
+# Таблица символ -> столбец для str.translate. Неизвестные символы
+# попадают в столбец 0 и, в отличие от defaultdict, не добавляются в
+# таблицу: поиск не меняет автомат, и его можно делить между потоками
+class ColumnMap(dict):
+    def __missing__(self, key):
+        return 0
+
 class AhoCorasickNode:
     def __init__(self):
         self.children = {}
         self.fail = None
+        # Только подстроки, которые заканчиваются именно в этом узле
         self.output = []
+        # Ближайший по суффиксным ссылкам узел, где заканчивается подстрока
+        self.output_link = None
+
+# Сколько ячеек может занять плотная таблица переходов (4 байта на
+# ячейку). Ширина таблицы - число разных символов в подстроках, и для
+# тысяч подстрок на большом алфавите (например, иероглифы) полная
+# таблица занимала бы сотни мегабайт
+MAX_TABLE_CELLS = 1 << 22
 
 class AhoCorasick:
-    def __init__(self, patterns: list[str]):
+    def __init__(self, patterns: list[str], max_table_cells: int = MAX_TABLE_CELLS):
         self.root = AhoCorasickNode()
-        self.build_trie(patterns)
+        self.patterns = list(dict.fromkeys(patterns))
+        self.max_table_cells = max_table_cells
+        self.build_trie(self.patterns)
         self.build_failure_links()
+        if len(self.order) * (len(self.alphabet()) + 1) <= max_table_cells:
+            self.compile()
+        else:
+            self.compile_sparse()
+        # Дальше поиск идёт только по таблице, дерево больше не нужно
+        self.root = None
 
     def build_trie(self, patterns: list[str]):
         for pattern in patterns:
+            if not pattern:
+                continue
             node = self.root
             for char in pattern:
                 if char not in node.children:
@@ -20,8 +51,10 @@ class AhoCorasick:
             node.output.append(pattern)
 
     def build_failure_links(self):
-        from collections import deque
         queue = deque()
+        # Узлы в порядке обхода в ширину: ссылка каждого узла ведёт
+        # на узел, который в этом порядке стоит раньше
+        self.order = [self.root]
 
         for child in self.root.children.values():
             child.fail = self.root
@@ -29,27 +62,166 @@ class AhoCorasick:
 
         while queue:
             current_node = queue.popleft()
+            self.order.append(current_node)
             for char, child in current_node.children.items():
                 fail_state = current_node.fail
                 while fail_state is not None and char not in fail_state.children:
                     fail_state = fail_state.fail
                 child.fail = fail_state.children[char] if fail_state else self.root
-                child.output += child.fail.output
+                # Вместо копирования списка выходов храним ссылку на выход
+                if child.fail.output:
+                    child.output_link = child.fail
+                else:
+                    child.output_link = child.fail.output_link
                 queue.append(child)
 
-    def search(self, text: str) -> dict[str, tuple[int, ...]]:
-        node = self.root
-        indices = {pattern: [] for pattern in node.output}
-
-        for i, char in enumerate(text):
-            while node is not None and char not in node.children:
-                node = node.fail
-            if node is None:
-                node = self.root
+    # Компиляция дерева в плотную таблицу переходов полного автомата.
+    # Столбцы - символы подстрок (0 - любой другой символ), строки -
+    # состояния. В ячейках хранится номер следующего состояния, уже
+    # умноженный на ширину строки, так что шаг поиска - одно обращение
+    # к таблице. Состояния с выходами нумеруются последними, и проверка
+    # на совпадение - одно сравнение
+    def alphabet(self) -> list[str]:
+        return sorted({char for pattern in self.patterns for char in pattern})
+
+    def compile(self):
+        alphabet = self.alphabet()
+        width = len(alphabet) + 1
+        columns = {char: column for column, char in enumerate(alphabet, 1)}
+
+        has_output = [bool(node.output or node.output_link) for node in self.order]
+        numbered = ([node for node, out in zip(self.order, has_output) if not out]
+                    + [node for node, out in zip(self.order, has_output) if out])
+        number = {id(node): i for i, node in enumerate(numbered)}
+        pattern_index = {pattern: i for i, pattern in enumerate(self.patterns)}
+
+        # Строка корня - нули (корень получает номер 0). Переходы, которых
+        # нет в дереве, копируются из строки суффиксной ссылки, которая
+        # при обходе в ширину уже заполнена
+        typecode = 'i' if len(numbered) * width < 2 ** 31 else 'q'
+        goto = array(typecode, bytes(array(typecode).itemsize * len(numbered) * width))
+        for node in self.order:
+            start = number[id(node)] * width
+            if node.fail is not None:
+                fail_start = number[id(node.fail)] * width
+                goto[start:start + width] = goto[fail_start:fail_start + width]
+            for char, child in node.children.items():
+                goto[start + columns[char]] = number[id(child)] * width
+        self.goto = goto
+        self.match = array('i', (pattern_index[node.output[0]] if node.output else -1
+                                 for node in numbered))
+        self.next_match = array('i', (number[id(node.output_link)] if node.output_link else -1
+                                      for node in numbered))
+        self.lengths = array('i', map(len, self.patterns))
+        self.width = width
+        self.first_output = (len(numbered) - sum(has_output)) * width
+        self.columns = ColumnMap({ord(char): column for char, column in columns.items()})
+        self.children = None
+        del self.order
+
+    # Компиляция с ограничением памяти. Плотные строки получают только
+    # первые состояния в порядке обхода в ширину (корень и неглубокие
+    # узлы, через которые проходит большая часть текста), сколько
+    # помещается в max_table_cells. У остальных состояний хранятся только
+    # переходы дерева и суффиксная ссылка: при промахе поиск идёт по
+    # ссылкам, пока не попадёт в состояние с плотной строкой. Состояния
+    # нумеруются в порядке обхода, у ссылки номер всегда меньше
+    def compile_sparse(self):
+        alphabet = self.alphabet()
+        width = len(alphabet) + 1
+        columns = {char: column for column, char in enumerate(alphabet, 1)}
+        number = {id(node): i for i, node in enumerate(self.order)}
+        pattern_index = {pattern: i for i, pattern in enumerate(self.patterns)}
+        dense = max(1, self.max_table_cells // width)
+
+        # Ссылка плотного состояния тоже плотная: её номер меньше
+        goto = array('i', bytes(array('i').itemsize * min(dense, len(self.order)) * width))
+        children = []
+        for state, node in enumerate(self.order):
+            row = {columns[char]: number[id(child)] for char, child in node.children.items()}
+            if state >= dense:
+                children.append(row)
                 continue
-            node = node.children[char]
-            for pattern in node.output:
-                indices[pattern].append(i - len(pattern) + 1)
+            start = state * width
+            if node.fail is not None:
+                fail_start = number[id(node.fail)] * width
+                goto[start:start + width] = goto[fail_start:fail_start + width]
+            for column, child in row.items():
+                goto[start + column] = child
+
+        self.goto = goto
+        self.children = children
+        self.dense_states = dense
+        self.fail = array('i', (number[id(node.fail)] if node.fail else 0 for node in self.order))
+        self.match = array('i', (pattern_index[node.output[0]] if node.output else -1
+                                 for node in self.order))
+        self.next_match = array('i', (number[id(node.output_link)] if node.output_link else -1
+                                      for node in self.order))
+        self.has_output = bytes(bool(node.output or node.output_link) for node in self.order)
+        self.lengths = array('i', map(len, self.patterns))
+        self.width = width
+        self.columns = ColumnMap({ord(char): column for char, column in columns.items()})
+        del self.order
+
+    # Поиск по тексту, поданному частями: состояние автомата переносится
+    # между частями, поэтому совпадения на их границах не теряются.
+    # Совпадения выдаются сразу, с абсолютными позициями, так что память
+    # не зависит от размера текста
+    def stream(self, chunks: Iterable[str]) -> Iterator[tuple[int, str]]:
+        if self.children is not None:
+            yield from self._stream_sparse(chunks)
+            return
+        goto, match, next_match = self.goto, self.match, self.next_match
+        lengths, patterns = self.lengths, self.patterns
+        width, first_output = self.width, self.first_output
+        state = 0
+        offset = 0
+
+        for chunk in chunks:
+            # Символы переводятся в номера столбцов сразу для всей части
+            for i, column in enumerate(map(ord, chunk.translate(self.columns))):
+                state = goto[state + column]
+                if state >= first_output:
+                    found = state // width
+                    if match[found] < 0:
+                        found = next_match[found]
+                    while found >= 0:
+                        pattern = match[found]
+                        yield offset + i - lengths[pattern] + 1, patterns[pattern]
+                        found = next_match[found]
+            offset += len(chunk)
+
+    def _stream_sparse(self, chunks: Iterable[str]) -> Iterator[tuple[int, str]]:
+        goto, children, fail = self.goto, self.children, self.fail
+        match, next_match, has_output = self.match, self.next_match, self.has_output
+        lengths, patterns = self.lengths, self.patterns
+        width, dense = self.width, self.dense_states
+        state = 0
+        offset = 0
+
+        for chunk in chunks:
+            for i, column in enumerate(map(ord, chunk.translate(self.columns))):
+                while state >= dense:
+                    following = children[state - dense].get(column)
+                    if following is not None:
+                        break
+                    state = fail[state]
+                else:
+                    following = goto[state * width + column]
+                state = following
+                if has_output[state]:
+                    found = state if match[state] >= 0 else next_match[state]
+                    while found >= 0:
+                        pattern = match[found]
+                        yield offset + i - lengths[pattern] + 1, patterns[pattern]
+                        found = next_match[found]
+            offset += len(chunk)
+
+    def search(self, text: str) -> dict[str, tuple[int, ...]]:
+        indices = {pattern: [] for pattern in self.patterns}
+
+        for position, pattern in self.stream((text, )):
+            indices[pattern].append(position)
 
         return {k: tuple(v) for k, v in indices.items() if v}
 
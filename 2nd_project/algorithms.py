@@ -1,37 +1,50 @@
+from typing import Iterator
+
+# Каждый алгоритм есть в двух видах: генератор *_iter, который выдаёт
+# позиции по одной и может быть остановлен после нужного числа вхождений,
+# и функция *_search, которая собирает все позиции.
+#
+# При reverse=True генераторы идут по тексту справа налево и выдают
+# позиции по убыванию, не копируя текст: поиск ведётся в "зеркальном"
+# тексте, k-й символ которого - text[base + step * k], где base = n - 1,
+# step = -1 (при прямом поиске base = 0, step = 1), а подстрока
+# разворачивается (она короткая)
+
 # Алгоритм Кнута-Морриса-Пратта
-def kmp_search(string: str, substring: str):
+def kmp_iter(string: str, substring: str, reverse: bool = False) -> Iterator[int]:
     string_len, substring_len = len(string), len(substring)
+    if substring_len == 0 or substring_len > string_len:
+        return
+    if reverse:
+        substring = substring[::-1]
     lps = [0] * substring_len
     j = 0  # Индекс для substring[]
-    
+
     # Препроцессинг паттерна для вычисления lps[]
     compute_lps_array(substring, substring_len, lps)
 
-    indices = []
-    i = 0  # Индекс для string[]
-    while i < string_len:
-        if substring[j] == string[i]:
-            i += 1
-            j += 1
-        
-        if j == substring_len:
-            indices.append(i - j)
+    positions = range(string_len - 1, -1, -1) if reverse else range(string_len)
+    for i in positions:
+        char = string[i]
+        while j != 0 and substring[j] != char:
             j = lps[j - 1]
-        elif i < string_len and substring[j] != string[i]:
-            if j != 0:
+        if substring[j] == char:
+            j += 1
+            if j == substring_len:
+                yield i if reverse else i - substring_len + 1
                 j = lps[j - 1]
-            else:
-                i += 1
-    
+
+def kmp_search(string: str, substring: str):
+    indices = tuple(kmp_iter(string, substring))
     if len(indices) == 0:
         return None
-    return tuple(indices)
+    return indices
 
 def compute_lps_array(substring: str, m: int, lps: list[int]):
     length = 0  # длина предыдущей самой длинной префиксной суффиксной подстроки
     lps[0] = 0  # lps[0] всегда 0
     i = 1
-    
+
     while i < m:
         if substring[i] == substring[length]:
             length += 1
@@ -44,86 +57,163 @@ def compute_lps_array(substring: str, m: int, lps: list[int]):
                 lps[i] = 0
                 i += 1
 
-def boyer_moore_search(text: str, pattern: str) -> tuple[int, ...]:
+# Таблица сдвигов по правилу хорошего суффикса (сильный вариант).
+# shift[j + 1] - сдвиг при несовпадении в позиции j, shift[0] - сдвиг
+# после полного совпадения (это период паттерна)
+def compute_good_suffix_shifts(pattern: str) -> list[int]:
+    m = len(pattern)
+    shift = [0] * (m + 1)
+    border = [0] * (m + 1)  # border[i] - начало самой широкой границы pattern[i:]
+
+    i, j = m, m + 1
+    border[i] = j
+    while i > 0:
+        while j <= m and pattern[i - 1] != pattern[j - 1]:
+            if shift[j] == 0:
+                shift[j] = j - i
+            j = border[j]
+        i -= 1
+        j -= 1
+        border[i] = j
+
+    # Суффиксы, которые встречаются в паттерне только как его префиксы
+    j = border[0]
+    for i in range(m + 1):
+        if shift[i] == 0:
+            shift[i] = j
+        if i == j:
+            j = border[j]
+    return shift
+
+# Алгоритм Бойера-Мура: правило плохого символа и хорошего суффикса.
+# С galil=True после совпадения сравнивается только часть окна, которая
+# не перекрывается с предыдущим совпадением (правило Галила), и число
+# сравнений в худшем случае линейно
+def boyer_moore_iter(text: str, pattern: str, reverse: bool = False,
+                     galil: bool = False) -> Iterator[int]:
     m, n = len(pattern), len(text)
-    if m == 0 or n == 0:
-        return tuple()
+    if m == 0 or m > n:
+        return
+    if reverse:
+        pattern = pattern[::-1]
+    base, step = (n - 1, -1) if reverse else (0, 1)
+
+    # Таблица "плохих символов": последнее вхождение символа в паттерн.
+    # Словарь хранит только символы паттерна, так что подходит для любого
+    # алфавита; для остальных символов используется -1
+    bad_char_table = {char: i for i, char in enumerate(pattern)}
+    good_suffix = compute_good_suffix_shifts(pattern)
+    period = good_suffix[0]
 
-    # Таблица "плохих символов"
-    bad_char_table = [-1] * 256
-    for i in range(m):
-        bad_char_table[ord(pattern[i])] = i
-
-    indices = []
     shift = 0
+    bound = 0  # Позиции окна левее bound уже совпали (правило Галила)
 
     while shift <= n - m:
         j = m - 1
-        while j >= 0 and pattern[j] == text[shift + j]:
+        while j >= bound and pattern[j] == text[base + step * (shift + j)]:
             j -= 1
-        
-        if j < 0:
-            indices.append(shift)
-            shift += (m - bad_char_table[ord(text[shift + m])] if shift + m < n else 1)
-        else:
-            shift += max(1, j - bad_char_table[ord(text[shift + j])])
-
-    return tuple(indices)
 
-def rabin_karp_search(text: str, pattern: str, prime: int = 101) -> tuple[int, ...]:
-    m, n = len(pattern), len(text)
-    if m > n:
-        return tuple()
+        if j < bound:
+            yield n - m - shift if reverse else shift
+            shift += period
+            if galil:
+                bound = m - period
+        else:
+            bad_char = j - bad_char_table.get(text[base + step * (shift + j)], -1)
+            shift += max(good_suffix[j + 1], bad_char)
+            bound = 0
 
-    base = 256
-    h_pattern = 0  # хеш паттерна
+def boyer_moore_search(text: str, pattern: str) -> tuple[int, ...]:
+    return tuple(boyer_moore_iter(text, pattern))
+
+def boyer_moore_galil_search(text: str, pattern: str) -> tuple[int, ...]:
+    return tuple(boyer_moore_iter(text, pattern, galil=True))
+
+# Хеши Рабина-Карпа считаются по модулю простого Мерсенна 2^61 - 1: при
+# маленьком модуле почти каждое окно давало ложное совпадение хеша и
+# сравнение строк, то есть O(n * m)
+RK_PRIME = (1 << 61) - 1
+# Основание - простое число. Коды символов бывают и больше него (до
+# 0x10FFFF), на результат это не влияет: совпадение хешей всегда
+# проверяется сравнением строк
+RK_BASE = 1_000_003
+
+# Рабин-Карп сразу для нескольких паттернов одной длины: хеш окна ищется
+# в словаре хешей паттернов, так что весь набор проверяется за один
+# проход. Выдаёт пары (позиция, паттерн)
+def rabin_karp_multi_iter(text: str, patterns: list[str], reverse: bool = False,
+                          prime: int = RK_PRIME,
+                          base: int = RK_BASE) -> Iterator[tuple[int, str]]:
+    patterns = list(dict.fromkeys(patterns))
+    if not patterns:
+        return
+    m, n = len(patterns[0]), len(text)
+    if any(len(pattern) != m for pattern in patterns):
+        raise ValueError("Patterns must have equal length")
+    if m == 0 or m > n:
+        return
+    base_index, step = (n - 1, -1) if reverse else (0, 1)
+
+    # хеш -> паттерны; при обратном поиске хешируются развёрнутые паттерны
+    table = {}
+    for pattern in patterns:
+        h_pattern = 0
+        for char in (pattern[::-1] if reverse else pattern):
+            h_pattern = (base * h_pattern + ord(char)) % prime
+        table.setdefault(h_pattern, []).append(pattern)
+
+    h = pow(base, m - 1, prime)  # base^(m-1)
     h_text = 0     # хеш текущего окна в тексте
-    h = 1  # base^(m-1)
-
-    for i in range(m - 1):
-        h = (h * base) % prime
-
-    # вычисляем начальный хеш для паттерна и первого окна текста
     for i in range(m):
-        h_pattern = (base * h_pattern + ord(pattern[i])) % prime
-        h_text = (base * h_text + ord(text[i])) % prime
-
-    indices = []
+        h_text = (base * h_text + ord(text[base_index + step * i])) % prime
 
     for i in range(n - m + 1):
-        if h_pattern == h_text:
-            if text[i:i + m] == pattern:
-                indices.append(i)
+        candidates = table.get(h_text)
+        if candidates is not None:
+            # Сравниваем окно с паттерном в обычном порядке символов
+            start = n - m - i if reverse else i
+            window = text[start:start + m]
+            for pattern in candidates:
+                if pattern == window:
+                    yield start, pattern
 
         if i < n - m:
-            h_text = (base * (h_text - ord(text[i]) * h) + ord(text[i + m])) % prime
-            if h_text < 0:
-                h_text += prime
+            h_text = (base * (h_text - ord(text[base_index + step * i]) * h)
+                      + ord(text[base_index + step * (i + m)])) % prime
 
-    return tuple(indices)
+def rabin_karp_iter(text: str, pattern: str, reverse: bool = False, *,
+                    prime: int = RK_PRIME) -> Iterator[int]:
+    for position, _ in rabin_karp_multi_iter(text, [pattern], reverse, prime):
+        yield position
 
-def boyer_moore_horspool_search(text: str, pattern: str) -> tuple[int, ...]:
-    m, n = len(pattern), len(text)
-    if m > n:
-        return tuple()
+def rabin_karp_search(text: str, pattern: str, prime: int = RK_PRIME) -> tuple[int, ...]:
+    return tuple(rabin_karp_iter(text, pattern, prime=prime))
 
-    # Таблица сдвигов
-    bad_char_shift = {char: m for char in set(text)}
+def boyer_moore_horspool_iter(text: str, pattern: str,
+                              reverse: bool = False) -> Iterator[int]:
+    m, n = len(pattern), len(text)
+    if m == 0 or m > n:
+        return
+    if reverse:
+        pattern = pattern[::-1]
+    base, step = (n - 1, -1) if reverse else (0, 1)
+
+    # Таблица сдвигов: символы, которых нет в паттерне, сдвигают на m
+    bad_char_shift = {}
     for i in range(m - 1):
         bad_char_shift[pattern[i]] = m - i - 1
 
-    indices = []
     shift = 0
 
     while shift <= n - m:
         j = m - 1
-        while j >= 0 and pattern[j] == text[shift + j]:
+        while j >= 0 and pattern[j] == text[base + step * (shift + j)]:
             j -= 1
 
         if j < 0:
-            indices.append(shift)
-            shift += bad_char_shift.get(text[shift + m], m) if shift + m < n else 1
-        else:
-            shift += bad_char_shift.get(text[shift + j], m)
+            yield n - m - shift if reverse else shift
+        # Сдвиг определяется последним символом окна
+        shift += bad_char_shift.get(text[base + step * (shift + m - 1)], m)
 
-    return tuple(indices)
+def boyer_moore_horspool_search(text: str, pattern: str) -> tuple[int, ...]:
+    return tuple(boyer_moore_horspool_iter(text, pattern))
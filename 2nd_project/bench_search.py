@@ -0,0 +1,87 @@
+import argparse
+import inspect
+import random
+import time
+
+from search import ENGINES
+
+# Бенчмарк однострочных алгоритмов на естественном тексте. Для каждой
+# длины паттерна выводится скорость (МБ/с) и доля символов текста,
+# которые алгоритм прочитал: у Бойера-Мура она падает с ростом паттерна,
+# то есть поиск сублинейный
+
+# Модули стандартной библиотеки, из документации которых собирается
+# английский текст, если файл не задан
+CORPUS_MODULES = ['argparse', 'collections', 'inspect', 'random', 'typing',
+                  'itertools', 'functools', 'string', 'json', 're']
+
+# Текст, который считает обращения к своим символам
+class CountingText(str):
+    reads = 0
+
+    def __getitem__(self, index):
+        CountingText.reads += 1
+        return str.__getitem__(self, index)
+
+def build_corpus(size: int) -> str:
+    parts = []
+    for name in CORPUS_MODULES:
+        module = __import__(name)
+        for _, member in inspect.getmembers(module):
+            doc = inspect.getdoc(member)
+            if doc:
+                parts.append(doc)
+    text = '\n'.join(parts)
+    return (text * (size // len(text) + 1))[:size]
+
+# Паттерны - случайные отрывки текста, начинающиеся с начала слова
+def sample_patterns(text: str, length: int, number: int, rng: random.Random) -> list[str]:
+    starts = [i + 1 for i in range(len(text) - length - 1) if text[i] == ' ']
+    return [text[start:start + length] for start in rng.sample(starts, number)]
+
+def measure(text: str, patterns: list[str], algorithm: str) -> tuple[float, float]:
+    engine = ENGINES[algorithm]
+    start = time.perf_counter()
+    for pattern in patterns:
+        for _ in engine(text, pattern):
+            pass
+    elapsed = time.perf_counter() - start
+    speed = len(text) * len(patterns) / elapsed / 2 ** 20
+
+    counting = CountingText(text)
+    CountingText.reads = 0
+    for pattern in patterns:
+        for _ in engine(counting, pattern):
+            pass
+    inspected = CountingText.reads / (len(text) * len(patterns))
+    return speed, inspected
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Substring search benchmark.")
+    parser.add_argument('--file', type=str, help="Text to search in (default: stdlib docstrings).")
+    parser.add_argument('--size', type=int, default=1_000_000, help="Corpus size in characters.")
+    parser.add_argument('--lengths', type=int, nargs='+', default=[4, 8, 16, 32, 64],
+                        help="Pattern lengths.")
+    parser.add_argument('--patterns', type=int, default=5, help="Patterns per length.")
+    parser.add_argument('--algorithms', nargs='+', default=list(ENGINES),
+                        choices=list(ENGINES))
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.file:
+        with open(args.file, 'r') as f:
+            corpus = f.read(args.size)
+    else:
+        corpus = build_corpus(args.size)
+    rng = random.Random(args.seed)
+
+    print(f"{'length':>6} " + ' '.join(f"{name:>16}" for name in args.algorithms))
+    for length in args.lengths:
+        patterns = sample_patterns(corpus, length, args.patterns, rng)
+        cells = []
+        for name in args.algorithms:
+            speed, inspected = measure(corpus, patterns, name)
+            cells.append(f"{speed:7.1f}MB/s {inspected:5.2f}")
+        print(f"{length:>6} " + ' '.join(cells))
@@ -0,0 +1,238 @@
+import mmap
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Union, Tuple, Dict
+
+from algorithms import RK_PRIME, compute_lps_array
+
+try:
+    import numpy
+except ImportError:  # необязательная зависимость
+    numpy = None
+
+# Поиск прямо по байтам файла, отображённого в память (mmap): файл не
+# декодируется и не копируется. Регистр не учитывается через таблицу
+# свёртки, которая применяется к каждому байту при сравнении, а не через
+# копию текста в нижнем регистре. Свёртка работает только для ASCII.
+#
+# Как и в algorithms, при reverse=True поиск идёт справа налево по
+# "зеркальному" тексту: k-й байт - buffer[base + step * k]
+
+# Таблицы свёртки: байт -> байт
+IDENTITY = bytes(range(256))
+ASCII_FOLD = IDENTITY.lower()
+
+# Байты продолжения UTF-8 (10xxxxxx): с них не начинается ни один символ
+UTF8_CONTINUATION = bytes(range(0x80, 0xC0))
+
+def kmp_bytes_iter(buffer, pattern: bytes, fold: bytes = IDENTITY,
+                   reverse: bool = False) -> Iterator[int]:
+    n, m = len(buffer), len(pattern)
+    if m == 0 or m > n:
+        return
+    pattern = pattern.translate(fold)
+    if reverse:
+        pattern = pattern[::-1]
+    lps = [0] * m
+    compute_lps_array(pattern, m, lps)
+
+    j = 0
+    positions = range(n - 1, -1, -1) if reverse else range(n)
+    for i in positions:
+        byte = fold[buffer[i]]
+        while j != 0 and pattern[j] != byte:
+            j = lps[j - 1]
+        if pattern[j] == byte:
+            j += 1
+            if j == m:
+                yield i if reverse else i - m + 1
+                j = lps[j - 1]
+
+def boyer_moore_horspool_bytes_iter(buffer, pattern: bytes, fold: bytes = IDENTITY,
+                                    reverse: bool = False) -> Iterator[int]:
+    n, m = len(buffer), len(pattern)
+    if m == 0 or m > n:
+        return
+    pattern = pattern.translate(fold)
+    if reverse:
+        pattern = pattern[::-1]
+    base, step = (n - 1, -1) if reverse else (0, 1)
+
+    # Таблица сдвигов по последнему байту окна
+    bad_char_shift = [m] * 256
+    for i in range(m - 1):
+        bad_char_shift[pattern[i]] = m - i - 1
+
+    shift = 0
+    while shift <= n - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == fold[buffer[base + step * (shift + j)]]:
+            j -= 1
+        if j < 0:
+            yield n - m - shift if reverse else shift
+        shift += bad_char_shift[fold[buffer[base + step * (shift + m - 1)]]]
+
+def rabin_karp_bytes_iter(buffer, pattern: bytes, fold: bytes = IDENTITY,
+                          reverse: bool = False, *,
+                          prime: int = RK_PRIME) -> Iterator[int]:
+    n, m = len(buffer), len(pattern)
+    if m == 0 or m > n:
+        return
+    pattern = pattern.translate(fold)
+    ordered = pattern
+    if reverse:
+        pattern = pattern[::-1]
+    base_index, step = (n - 1, -1) if reverse else (0, 1)
+
+    base = 256
+    h = pow(base, m - 1, prime)  # base^(m-1)
+    h_pattern = h_text = 0
+    for i in range(m):
+        h_pattern = (base * h_pattern + pattern[i]) % prime
+        h_text = (base * h_text + fold[buffer[base_index + step * i]]) % prime
+
+    for i in range(n - m + 1):
+        if h_pattern == h_text:
+            # Проверка копирует только окно длины m
+            start = n - m - i if reverse else i
+            if buffer[start:start + m].translate(fold) == ordered:
+                yield start
+        if i < n - m:
+            h_text = (base * (h_text - fold[buffer[base_index + step * i]] * h)
+                      + fold[buffer[base_index + step * (i + m)]]) % prime
+
+# Векторизованный Рабин-Карп на numpy. Хеш окна w длины m - сумма
+# w[k] * B^k по модулю 2^64, то есть uint64 с переполнением. Для блока
+# байтов считаются префиксные суммы S[i] = sum(d[k] * B^k, k < i), и хеш
+# окна с началом i равен (S[i + m] - S[i]) * B^-i: основание B нечётное,
+# поэтому обратимо по модулю 2^64. Все окна блока хешируются несколькими
+# операциями над массивами, в Python проверяются только окна, чей хеш
+# совпал с хешем одного из паттернов
+NUMPY_BASE = 0x100000001B3
+NUMPY_MASK = (1 << 64) - 1
+
+def _numpy_powers(base: int, length: int):
+    powers = numpy.full(length, base, dtype=numpy.uint64)
+    powers[0] = 1
+    return numpy.cumprod(powers, out=powers)
+
+def rabin_karp_numpy_iter(buffer, patterns: List[bytes], fold: bytes = IDENTITY,
+                          reverse: bool = False,
+                          block_size: int = 1 << 20) -> Iterator[Tuple[int, bytes]]:
+    if numpy is None:
+        raise RuntimeError("rabin_karp_numpy_iter requires numpy")
+    patterns = list(dict.fromkeys(patterns))
+    if not patterns:
+        return
+    m, n = len(patterns[0]), len(buffer)
+    if any(len(pattern) != m for pattern in patterns):
+        raise ValueError("Patterns must have equal length")
+    if m == 0 or m > n:
+        return
+
+    # хеш свёрнутого паттерна -> (свёрнутый паттерн, исходный паттерн)
+    table = {}
+    for pattern in patterns:
+        folded = pattern.translate(fold)
+        h_pattern = sum(byte * pow(NUMPY_BASE, k, 1 << 64)
+                        for k, byte in enumerate(folded)) & NUMPY_MASK
+        table.setdefault(h_pattern, []).append((folded, pattern))
+    targets = numpy.array(list(table), dtype=numpy.uint64)
+
+    data = numpy.frombuffer(buffer, dtype=numpy.uint8)  # без копирования
+    fold_table = numpy.frombuffer(fold, dtype=numpy.uint8)
+    powers = _numpy_powers(NUMPY_BASE, block_size + m)
+    inverse_powers = _numpy_powers(pow(NUMPY_BASE, -1, 1 << 64), block_size)
+    prefix = numpy.zeros(block_size + m, dtype=numpy.uint64)
+
+    starts = range(0, n - m + 1, block_size)
+    for start in (reversed(starts) if reverse else starts):
+        windows = min(block_size, n - m + 1 - start)
+        length = windows + m - 1
+        # Копируется только блок, уже со свёрнутым регистром
+        block = fold_table[data[start:start + length]]
+        numpy.cumsum(block.astype(numpy.uint64) * powers[:length], out=prefix[1:length + 1])
+        hashes = (prefix[m:m + windows] - prefix[:windows]) * inverse_powers[:windows]
+
+        hits = numpy.flatnonzero(numpy.isin(hashes, targets))
+        for i in (hits[::-1] if reverse else hits).tolist():
+            position = start + i
+            window = bytes(buffer[position:position + m]).translate(fold)
+            for folded, pattern in table[int(hashes[i])]:
+                if folded == window:
+                    yield position, pattern
+
+def rabin_karp_numpy_bytes_iter(buffer, pattern: bytes, fold: bytes = IDENTITY,
+                                reverse: bool = False) -> Iterator[int]:
+    for position, _ in rabin_karp_numpy_iter(buffer, [pattern], fold, reverse):
+        yield position
+
+BYTES_ENGINES = {
+    'kmp': kmp_bytes_iter,
+    'rk': rabin_karp_bytes_iter,
+    'bmh': boyer_moore_horspool_bytes_iter,
+}
+if numpy is not None:
+    BYTES_ENGINES['rknp'] = rabin_karp_numpy_bytes_iter
+
+# Перевод возрастающих байтовых смещений в номера символов UTF-8.
+# Символы считаются как байты, не являющиеся байтами продолжения; буфер
+# просматривается один раз блоками, так что память не зависит от файла
+def utf8_char_offsets(buffer, offsets: Iterable[int],
+                      block_size: int = 1 << 20) -> List[int]:
+    result = []
+    chars = done = 0
+    for offset in offsets:
+        while done < offset:
+            end = min(offset, done + block_size)
+            chars += len(buffer[done:end].translate(None, UTF8_CONTINUATION))
+            done = end
+        result.append(chars)
+    return result
+
+# Поиск подстрок в буфере байтов (bytes, mmap). Возвращает то же, что
+# search.search: кортеж позиций для одной подстроки, словарь для
+# нескольких, None - если вхождений нет. char_offsets=True переводит
+# байтовые смещения в номера символов UTF-8
+def bytes_search(buffer, sub_strings: Union[str, List[str]],
+                 case_sensitivity: bool = False, method: str = 'first',
+                 count: Optional[int] = None, algorithm: str = 'bmh',
+                 char_offsets: bool = False) -> Optional[Union[Tuple[int, ...], Dict[str, Tuple[int, ...]]]]:
+    if algorithm not in BYTES_ENGINES:
+        raise ValueError(f"Unknown algorithm for bytes search: {algorithm}")
+    if method not in ('first', 'last'):
+        raise ValueError(f"Unknown method: {method}")
+    if isinstance(sub_strings, str):
+        sub_strings = [sub_strings]
+    fold = IDENTITY if case_sensitivity else ASCII_FOLD
+
+    result = {}
+    for sub_string in sub_strings:
+        engine = BYTES_ENGINES[algorithm](buffer, sub_string.encode('utf-8'), fold,
+                                          reverse=method == 'last')
+        indices = list(islice(engine, count or None))
+        if indices and char_offsets:
+            if method == 'last':
+                indices = utf8_char_offsets(buffer, indices[::-1])[::-1]
+            else:
+                indices = utf8_char_offsets(buffer, indices)
+        result[sub_string] = tuple(indices) or None
+
+    if all(indices is None for indices in result.values()):
+        return None
+    if len(sub_strings) == 1:
+        return result[sub_strings[0]]
+    return result
+
+# Поиск в файле через mmap: файл не читается в память целиком
+def mmap_search(file_path: str, sub_strings: Union[str, List[str]],
+                case_sensitivity: bool = False, method: str = 'first',
+                count: Optional[int] = None, algorithm: str = 'bmh',
+                char_offsets: bool = False):
+    with open(file_path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            # Пустой файл нельзя отобразить в память
+            return bytes_search(b'', sub_strings, case_sensitivity, method,
+                                count, algorithm, char_offsets)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return bytes_search(buffer, sub_strings, case_sensitivity, method,
+                                count, algorithm, char_offsets)
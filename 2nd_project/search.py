@@ -1,10 +1,30 @@
 import argparse
+import multiprocessing
+import os
+import sys
 import time
-from typing import Union, Optional, Tuple, Dict, List
+from functools import partial
+from itertools import islice
+from typing import Union, Optional, Tuple, Dict, List, Iterator
 from algorithms import *
+from aho_corasick_search import AhoCorasick
+from bytes_search import BYTES_ENGINES, mmap_search
 
 
-avalible_algoritms = ['kmp', 'bm','rk', 'bmh']
+avalible_algoritms = ['kmp', 'bm', 'bmg', 'rk', 'bmh', 'ac', 'auto']
+
+# Генераторы позиций для однострочных алгоритмов
+ENGINES = {
+    'kmp': kmp_iter,
+    'bm': boyer_moore_iter,
+    'bmg': partial(boyer_moore_iter, galil=True),
+    'rk': rabin_karp_iter,
+    'bmh': boyer_moore_horspool_iter,
+}
+
+# С какого числа подстрок 'auto' ищет все подстроки за один проход
+# Ахо-Корасик вместо отдельного прохода КМП для каждой
+AUTO_AC_MIN_PATTERNS = 2
 
 # Декоратор для логирования времени выполнения
 def log_time(func):
@@ -20,7 +40,7 @@ def log_time(func):
 @log_time
 def search(string: str, sub_strings: Union[str, List[str]],
            case_sensitivity: bool = False, method: str = 'first',
-           count: Optional[int] = None, algorithm: str = 'kmp') -> Optional[Union[Tuple[int, ...], Dict[str, Tuple[int, ...]]]]:
+           count: Optional[int] = None, algorithm: str = 'auto') -> Optional[Union[Tuple[int, ...], Dict[str, Tuple[int, ...]]]]:
     if algorithm not in avalible_algoritms:
         raise ValueError(f"Unknown algorithm: {algorithm}")
 
@@ -37,46 +57,41 @@ def search(string: str, sub_strings: Union[str, List[str]],
     if isinstance(sub_strings, str):
         sub_strings = [sub_strings]
 
+    if method not in ('first', 'last'):
+        raise ValueError(f"Unknown method: {method}")
+
+    if algorithm == 'auto':
+        algorithm = 'ac' if len(sub_strings) >= AUTO_AC_MIN_PATTERNS else 'kmp'
+    # Многострочные алгоритмы находят все подстроки заранее, за один проход
+    precomputed = None
+    if algorithm == 'ac':
+        precomputed = aho_corasick_indices(string, sub_strings, method, count)
+    elif algorithm == 'rk' and len(sub_strings) > 1:
+        precomputed = rabin_karp_indices(string, sub_strings, method, count)
+
     is_all_none = True
     result = {}
 
     for sub_string in sub_strings:
-        if method == 'first':
-            match algorithm:
-                case 'kmp':
-                    indices = kmp_search(string, sub_string)
-                case 'bm':
-                    indices = boyer_moore_search(string, sub_string)
-                case 'rk':
-                    indices = rabin_karp_search(string, sub_string)
-                case 'bmh':
-                    indices = boyer_moore_horspool_search(string, sub_string)
+        if precomputed is not None:
+            indices = precomputed[sub_string]
             if indices == None:
                 result[sub_string] = None
                 continue
             is_all_none = False
-        elif method == 'last':
-            match algorithm:
-                case 'kmp':
-                    indices = kmp_search(string[::-1], sub_string[::-1])
-                case 'bm':
-                    indices = boyer_moore_search(string[::-1], sub_string[::-1])
-                case 'rk':
-                    indices = rabin_karp_search(string[::-1], sub_string[::-1])
-                case 'bmh':
-                    indices = boyer_moore_horspool_search(string[::-1], sub_string[::-1])
-            if indices == None:
-                result[sub_string] = None 
+        else:
+            # Генератор останавливается после count вхождений, для 'last'
+            # текст просматривается справа налево без копирования
+            engine = ENGINES[algorithm](string, sub_string, reverse=method == 'last')
+            indices = tuple(islice(engine, count or None))
+            if not indices:
+                result[sub_string] = None
                 continue
             is_all_none = False
-            indices = tuple(len(string) - i - len(sub_string) for i in indices)
-        else:
-            raise ValueError(f"Unknown method: {method}")
-        
+
         if count:
-            if indices != None:
-                indices = indices[:count]
-        
+            indices = indices[:count]
+
         if indices:
             result[sub_string] = indices
 
@@ -88,21 +103,194 @@ def search(string: str, sub_strings: Union[str, List[str]],
 
     return result if result else None
 
-# Функция для чтения файла
+# Вхождения всех подстрок за один проход Ахо-Корасик: для 'first' по
+# возрастанию, для 'last' по убыванию позиций, None - если вхождений нет.
+# Проход останавливается, когда у каждой подстроки набрано count вхождений;
+# для 'last' автомат из развёрнутых подстрок идёт по тексту с конца
+# развёрнутыми частями, так что копия всего текста не нужна
+def aho_corasick_indices(string: str, sub_strings: List[str], method: str = 'first',
+                         count: Optional[int] = None,
+                         chunk_size: int = 1 << 16) -> Dict[str, Optional[Tuple[int, ...]]]:
+    found = {sub_string: [] for sub_string in sub_strings}
+    if method == 'last':
+        chunks = (string[max(0, end - chunk_size):end][::-1]
+                  for end in range(len(string), 0, -chunk_size))
+        reversed_subs = [sub[::-1] for sub in sub_strings]
+        for position, sub in stream_search(chunks, reversed_subs, True, count):
+            found[sub[::-1]].append(len(string) - position - len(sub))
+    else:
+        for position, sub in stream_search((string, ), sub_strings, True, count):
+            found[sub].append(position)
+    return {sub: tuple(positions) or None for sub, positions in found.items()}
+
+# Текст, общий для процессов параллельного поиска. При запуске через
+# fork процессы получают его без копирования
+_shared_text = ''
+
+def _share_text(text: str):
+    global _shared_text
+    _shared_text = text
+
+# Поиск в части текста [start, end). Часть берётся с захватом overlap
+# символов справа, чтобы найти вхождения, которые начинаются у правой
+# границы; вхождения, начинающиеся дальше end, принадлежат следующей
+# части, так что каждое вхождение находится ровно один раз
+def _search_range(task) -> Dict[str, List[int]]:
+    start, end, overlap, sub_strings, algorithm, method, count = task
+    piece = _shared_text[start:end + overlap]
+    length = end - start
+    found = {}
+    if algorithm == 'ac':
+        limit = count if method == 'first' else None
+        indices = aho_corasick_indices(piece, sub_strings, method, limit)
+        for sub_string, positions in indices.items():
+            own = [start + i for i in positions or () if i < length]
+            found[sub_string] = own[:count] if count else own
+        return found
+    for sub_string in sub_strings:
+        engine = ENGINES[algorithm](piece, sub_string, reverse=method == 'last')
+        own = (start + i for i in engine if i < length)
+        found[sub_string] = list(islice(own, count or None))
+    return found
+
+# Параллельный поиск: текст делится на части, которые обрабатываются
+# выбранным алгоритмом в пуле из jobs процессов. Результаты частей
+# собираются по порядку (для 'last' - с конца текста), поэтому позиции
+# упорядочены без сортировки; как только у всех подстрок набрано count
+# вхождений, оставшиеся части не ждём. Результат - как у search
+@log_time
+def parallel_search(string: str, sub_strings: Union[str, List[str]],
+                    case_sensitivity: bool = False, method: str = 'first',
+                    count: Optional[int] = None, algorithm: str = 'auto',
+                    jobs: Optional[int] = None,
+                    chunk_size: Optional[int] = None) -> Optional[Union[Tuple[int, ...], Dict[str, Tuple[int, ...]]]]:
+    if algorithm not in avalible_algoritms:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if method not in ('first', 'last'):
+        raise ValueError(f"Unknown method: {method}")
+
+    if isinstance(sub_strings, str):
+        sub_strings = [sub_strings]
+    if not case_sensitivity:
+        string = string.lower()
+        sub_strings = [sub.lower() for sub in sub_strings]
+    if algorithm == 'auto':
+        algorithm = 'ac' if len(sub_strings) >= AUTO_AC_MIN_PATTERNS else 'kmp'
+
+    jobs = jobs or os.cpu_count() or 1
+    # По несколько частей на процесс, чтобы загрузка была ровной
+    chunk_size = chunk_size or max(1 << 20, -(-len(string) // (jobs * 4)))
+    overlap = max(max(map(len, sub_strings)) - 1, 0)
+    ranges = [(start, min(start + chunk_size, len(string)))
+              for start in range(0, len(string), chunk_size)]
+    if method == 'last':
+        ranges.reverse()
+    unique = list(dict.fromkeys(sub_strings))
+    tasks = ((start, end, overlap, unique, algorithm, method, count)
+             for start, end in ranges)
+
+    found = {sub_string: [] for sub_string in unique}
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+    else:
+        context = multiprocessing.get_context()
+    with context.Pool(jobs, initializer=_share_text, initargs=(string, )) as pool:
+        for part in pool.imap(_search_range, tasks):
+            for sub_string, positions in part.items():
+                found[sub_string].extend(positions)
+            if count and all(len(positions) >= count for positions in found.values()):
+                break
+
+    result = {}
+    for sub_string in sub_strings:
+        positions = found[sub_string][:count] if count else found[sub_string]
+        result[sub_string] = tuple(positions) or None
+    if all(indices is None for indices in result.values()):
+        return None
+    if len(sub_strings) == 1:
+        return result[sub_strings[0]]
+    return result
+
+# Вхождения всех подстрок через Рабина-Карпа: подстроки одной длины
+# проверяются за один проход по множеству хешей, так что проходов столько,
+# сколько разных длин. Формат - как у aho_corasick_indices
+def rabin_karp_indices(string: str, sub_strings: List[str], method: str = 'first',
+                       count: Optional[int] = None) -> Dict[str, Optional[Tuple[int, ...]]]:
+    groups = {}
+    for sub_string in dict.fromkeys(sub_strings):
+        groups.setdefault(len(sub_string), []).append(sub_string)
+
+    found = {}
+    for group in groups.values():
+        positions = {sub_string: [] for sub_string in group}
+        remaining = len(group)
+        for position, sub_string in rabin_karp_multi_iter(string, group,
+                                                          reverse=method == 'last'):
+            if count and len(positions[sub_string]) >= count:
+                continue
+            positions[sub_string].append(position)
+            if count and len(positions[sub_string]) == count:
+                remaining -= 1
+                if remaining == 0:
+                    break
+        found.update(positions)
+    return {sub: tuple(positions) or None for sub, positions in found.items()}
+
+# Функция для чтения файла целиком, '-' означает stdin
 def read_file(file_path: str) -> str:
+    if file_path == '-':
+        return sys.stdin.read()
     with open(file_path, 'r') as f:
         return f.read()
 
+# Чтение файла частями по chunk_size символов, '-' означает stdin
+def read_chunks(file_path: str, chunk_size: int = 1 << 20) -> Iterator[str]:
+    if file_path == '-':
+        yield from iter(lambda: sys.stdin.read(chunk_size), '')
+        return
+    with open(file_path, 'r') as f:
+        yield from iter(lambda: f.read(chunk_size), '')
+
+# Потоковый поиск всех подстрок сразу (Ахо-Корасик) по тексту из частей.
+# Выдаёт пары (позиция, подстрока) по мере нахождения; count ограничивает
+# число вхождений каждой подстроки
+def stream_search(chunks, sub_strings: Union[str, List[str]],
+                  case_sensitivity: bool = False,
+                  count: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+    if isinstance(sub_strings, str):
+        sub_strings = [sub_strings]
+    if not case_sensitivity:
+        sub_strings = [sub.lower() for sub in sub_strings]
+        chunks = (chunk.lower() for chunk in chunks)
+
+    found = dict.fromkeys(sub_strings, 0)
+    remaining = len(found)
+    for position, sub_string in AhoCorasick(sub_strings).stream(chunks):
+        if count:
+            if found[sub_string] >= count:
+                continue
+            found[sub_string] += 1
+            if found[sub_string] == count:
+                remaining -= 1
+        yield position, sub_string
+        if count and remaining == 0:
+            return
+
 # Парсер аргументов командной строки
 def parse_args():
     parser = argparse.ArgumentParser(description="Substring search utility.")
     parser.add_argument('--string', type=str, help="String to search in.")
-    parser.add_argument('--file', type=str, help="Path to the file to search in.")
+    parser.add_argument('--file', type=str, help="Path to the file to search in, '-' for stdin.")
     parser.add_argument('--substring', type=str, nargs='+', required=True, help="Substring(s) to search for.")
     parser.add_argument('--case-sensitive', action='store_true', help="Enable case-sensitive search.")
     parser.add_argument('--method', type=str, choices=['first', 'last'], default='first', help="Search method: 'first' (default) or 'last'.")
     parser.add_argument('--count', type=int, help="Find the first k occurrences.")
-    parser.add_argument('--algorithm', type=str, default='kmp', help=f"Algorithm to use. One of {avalible_algoritms}")
+    parser.add_argument('--algorithm', type=str, default='auto', help=f"Algorithm to use. One of {avalible_algoritms}")
+    parser.add_argument('--stream', action='store_true', help="Read --file in chunks and print matches as they are found (Aho-Corasick).")
+    parser.add_argument('--chunk-size', type=int, default=1 << 20, help="Chunk size in characters for --stream.")
+    parser.add_argument('--mmap', action='store_true', help=f"Search the bytes of --file through mmap, without decoding it. Algorithms: {list(BYTES_ENGINES)}.")
+    parser.add_argument('--char-offsets', action='store_true', help="With --mmap, report UTF-8 character positions instead of byte offsets.")
+    parser.add_argument('--jobs', type=int, default=1, help="Number of processes for a parallel search, 0 for all cores.")
     
     return parser.parse_args()
 
@@ -110,18 +298,47 @@ def parse_args():
 if __name__ == "__main__":
     args = parse_args()
 
-    # Чтение строки либо из аргумента, либо из файла
-    if args.file:
-        string = read_file(args.file)
-    elif args.string:
-        string = args.string
+    # Потоковый режим: файл не загружается в память целиком
+    if args.stream:
+        if not args.file:
+            raise ValueError("--stream requires --file.")
+        if args.method != 'first':
+            raise ValueError("--stream only supports --method first.")
+        for position, sub in stream_search(read_chunks(args.file, args.chunk_size),
+                                           args.substring, args.case_sensitive,
+                                           args.count):
+            print(f"{position}\t{sub}")
+        sys.exit(0)
+
+    # Поиск по байтам файла без декодирования и копирования
+    if args.mmap:
+        if not args.file or args.file == '-':
+            raise ValueError("--mmap requires --file with a path.")
+        algorithm = 'bmh' if args.algorithm == 'auto' else args.algorithm
+        result = mmap_search(args.file, args.substring, args.case_sensitive,
+                             args.method, args.count, algorithm, args.char_offsets)
     else:
-        raise ValueError("Either --string or --file must be provided.")
+        # Чтение строки либо из аргумента, либо из файла
+        if args.file:
+            string = read_file(args.file)
+        elif args.string:
+            string = args.string
+        else:
+            raise ValueError("Either --string or --file must be provided.")
+
+        # Выполнение поиска
+        if args.jobs != 1:
+            result = parallel_search(string, args.substring, case_sensitivity=args.case_sensitive,
+                                     method=args.method, count=args.count,
+                                     algorithm=args.algorithm, jobs=args.jobs or None)
+        else:
+            result = search(string, args.substring, case_sensitivity=args.case_sensitive,
+                            method=args.method, count=args.count, algorithm=args.algorithm)
+
+    # Для одной подстроки поиск возвращает кортеж позиций
+    if isinstance(result, tuple):
+        result = {args.substring[0]: result}
 
-    # Выполнение поиска
-    result = search(string, args.substring, case_sensitivity=args.case_sensitive,
-                    method=args.method, count=args.count, algorithm=args.algorithm)
-    
     # Вывод результата
     if result:
         print("Found occurrences:")
@@ -0,0 +1,98 @@
+"""Тесты для модуля aho_corasick_search"""
+
+import random
+import unittest
+
+from aho_corasick_search import AhoCorasick, aho_corasick_search  # pylint: disable=E0401
+import search  # pylint: disable=E0401
+
+
+TEST_AHO_CORASICK = [
+    ('', ['a'], {}),
+    ('a', ['a', 'abc'], {'a': (0, )}),
+    ('ushers', ['he', 'she', 'his', 'hers'], {'he': (2, ), 'she': (1, ), 'hers': (2, )}),
+    ('ababbababa', ['aba', 'bba'], {'aba': (0, 5, 7), 'bba': (3, )}),
+    ('aaaa', ['a', 'aa', 'aa'], {'a': (0, 1, 2, 3), 'aa': (0, 1, 2)}),
+    ('привет, мир', ['мир', 'ир', ''], {'мир': (8, ), 'ир': (9, )}),
+]
+
+
+def split(text, size):
+    """Разбиение текста на части заданного размера"""
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class TestAhoCorasick(unittest.TestCase):
+    """Тест-кейс модуля aho_corasick_search"""
+    def test_search(self):
+        """Тест поиска по всему тексту"""
+        for text, patterns, expected in TEST_AHO_CORASICK:
+            with self.subTest(text=text, patterns=patterns):
+                self.assertEqual(aho_corasick_search(text, patterns), expected)
+
+    def test_random(self):
+        """Тест на случайных строках против наивного поиска"""
+        rng = random.Random(0)
+        for _ in range(50):
+            text = ''.join(rng.choice('abc') for _ in range(rng.randrange(60)))
+            patterns = [''.join(rng.choice('abcd') for _ in range(rng.randrange(1, 5)))
+                        for _ in range(rng.randrange(1, 8))]
+            expected = {}
+            for pattern in patterns:
+                positions = tuple(i for i in range(len(text))
+                                  if text.startswith(pattern, i))
+                if positions:
+                    expected[pattern] = positions
+            with self.subTest(text=text, patterns=patterns):
+                self.assertEqual(aho_corasick_search(text, patterns), expected)
+
+    def test_stream(self):
+        """Тест поиска по тексту из частей любого размера"""
+        for text, patterns, expected in TEST_AHO_CORASICK:
+            automaton = AhoCorasick(patterns)
+            for size in range(1, len(text) + 1):
+                with self.subTest(text=text, size=size):
+                    found = {}
+                    for position, pattern in automaton.stream(split(text, size)):
+                        found.setdefault(pattern, []).append(position)
+                    self.assertEqual(
+                        {k: tuple(v) for k, v in found.items()}, expected
+                    )
+
+    def test_stream_search(self):
+        """Тест потокового поиска с учётом регистра и числа вхождений"""
+        chunks = split('AbaBBabAba', 3)
+        self.assertEqual(
+            list(search.stream_search(chunks, ['aba', 'bba'])),
+            [(0, 'aba'), (3, 'bba'), (5, 'aba'), (7, 'aba')],
+        )
+        self.assertEqual(
+            list(search.stream_search(chunks, ['aba', 'bba'], count=1)),
+            [(0, 'aba'), (3, 'bba')],
+        )
+        self.assertEqual(
+            list(search.stream_search(chunks, 'Aba', case_sensitivity=True)),
+            [(0, 'Aba'), (7, 'Aba')],
+        )
+
+    def test_columns_unchanged(self):
+        """Тест того, что поиск не добавляет символы в таблицу столбцов"""
+        automaton = AhoCorasick(['ab', 'b'])
+        columns = dict(automaton.columns)
+        self.assertEqual(automaton.search('xyzab ёжb'), {'ab': (3, ), 'b': (4, 8)})
+        self.assertEqual(automaton.columns, columns)
+
+    def test_sparse(self):
+        """Тест таблицы, которая не помещается в ограничение памяти"""
+        rng = random.Random(1)
+        for cells in (1, 10, 40):
+            for _ in range(30):
+                text = ''.join(rng.choice('abce') for _ in range(rng.randrange(60)))
+                patterns = [''.join(rng.choice('abcd') for _ in range(rng.randrange(1, 5)))
+                            for _ in range(rng.randrange(1, 8))]
+                automaton = AhoCorasick(patterns, max_table_cells=cells)
+                with self.subTest(cells=cells, text=text, patterns=patterns):
+                    self.assertTrue(len(automaton.goto) <= max(cells, automaton.width))
+                    self.assertEqual(automaton.search(text), aho_corasick_search(text, patterns))
+                    self.assertEqual(list(automaton.stream(split(text, 7))),
+                                     list(AhoCorasick(patterns).stream((text, ))))
@@ -0,0 +1,76 @@
+"""Тесты для модуля algorithms"""
+
+import random
+import unittest
+from functools import partial
+
+import algorithms  # pylint: disable=E0401
+
+ENGINES = [
+    algorithms.kmp_iter,
+    algorithms.boyer_moore_iter,
+    partial(algorithms.boyer_moore_iter, galil=True),
+    algorithms.rabin_karp_iter,
+    algorithms.boyer_moore_horspool_iter,
+]
+
+
+class TestAlgorithms(unittest.TestCase):
+    """Тест-кейс генераторов поиска подстроки"""
+    def test_random(self):
+        """Тест прямого и обратного поиска против наивного"""
+        rng = random.Random(0)
+        for _ in range(300):
+            text = ''.join(rng.choice('abc') for _ in range(rng.randrange(30)))
+            pattern = ''.join(rng.choice('abc') for _ in range(rng.randrange(1, 5)))
+            expected = [i for i in range(len(text)) if text.startswith(pattern, i)]
+            for engine in ENGINES:
+                with self.subTest(engine=getattr(engine, '__name__', engine), text=text, pattern=pattern):
+                    self.assertEqual(list(engine(text, pattern)), expected)
+                    self.assertEqual(list(engine(text, pattern, reverse=True)),
+                                     expected[::-1])
+
+    def test_unicode(self):
+        """Тест поиска в кириллическом тексте"""
+        text = 'мама мыла раму, мама'
+        for engine in ENGINES:
+            with self.subTest(engine=getattr(engine, '__name__', engine)):
+                self.assertEqual(list(engine(text, 'мама')), [0, 16])
+
+    def test_good_suffix(self):
+        """Тест таблицы хорошего суффикса"""
+        for pattern, expected in (('a', [1, 1]), ('abab', [2, 2, 2, 4, 1]),
+                                  ('abbabab', [5, 5, 5, 5, 2, 5, 4, 1])):
+            with self.subTest(pattern=pattern):
+                self.assertEqual(algorithms.compute_good_suffix_shifts(pattern), expected)
+
+    def test_lazy(self):
+        """Тест остановки генератора на первом вхождении"""
+        text = 'ab' + 'c' * 100000 + 'ab'
+        for engine in ENGINES:
+            with self.subTest(engine=getattr(engine, '__name__', engine)):
+                self.assertEqual(next(engine(text, 'ab')), 0)
+                self.assertEqual(next(engine(text, 'ab', reverse=True)), len(text) - 2)
+
+    def test_rabin_karp_multi(self):
+        """Тест Рабина-Карпа для нескольких подстрок одной длины"""
+        rng = random.Random(1)
+        for _ in range(200):
+            text = ''.join(rng.choice('abc') for _ in range(rng.randrange(30)))
+            patterns = [''.join(rng.choice('abc') for _ in range(3)) for _ in range(3)]
+            expected = sorted({(i, pattern) for pattern in patterns
+                               for i in range(len(text)) if text.startswith(pattern, i)})
+            with self.subTest(text=text, patterns=patterns):
+                found = list(algorithms.rabin_karp_multi_iter(text, patterns))
+                self.assertEqual(sorted(found), expected)
+                self.assertEqual([i for i, _ in found], sorted(i for i, _ in found))
+                found = list(algorithms.rabin_karp_multi_iter(text, patterns, reverse=True))
+                self.assertEqual(sorted(found), expected)
+                self.assertEqual([i for i, _ in found], sorted((i for i, _ in found), reverse=True))
+        with self.assertRaises(ValueError):
+            list(algorithms.rabin_karp_multi_iter('abc', ['a', 'ab']))
+
+    def test_rabin_karp_arguments(self):
+        """Тест позиционного reverse и модуля только по имени"""
+        self.assertEqual(list(algorithms.rabin_karp_iter('abab', 'ab', True)), [2, 0])
+        self.assertEqual(list(algorithms.rabin_karp_iter('abab', 'ab', prime=101)), [0, 2])
@@ -0,0 +1,75 @@
+"""Тесты для модуля bytes_search"""
+
+import os
+import random
+import tempfile
+import unittest
+
+import bytes_search  # pylint: disable=E0401
+
+
+class TestBytesSearch(unittest.TestCase):
+    """Тест-кейс поиска по байтам"""
+    def test_random(self):
+        """Тест всех алгоритмов с учётом и без учёта регистра против наивного"""
+        rng = random.Random(0)
+        for _ in range(200):
+            text = ''.join(rng.choice('abAB') for _ in range(rng.randrange(30)))
+            pattern = ''.join(rng.choice('abAB') for _ in range(rng.randrange(1, 5)))
+            for case_sensitivity in (True, False):
+                haystack = text if case_sensitivity else text.lower()
+                needle = pattern if case_sensitivity else pattern.lower()
+                expected = tuple(i for i in range(len(text))
+                                 if haystack.startswith(needle, i)) or None
+                for algorithm in bytes_search.BYTES_ENGINES:
+                    with self.subTest(text=text, pattern=pattern, algorithm=algorithm,
+                                      case_sensitivity=case_sensitivity):
+                        self.assertEqual(bytes_search.bytes_search(
+                            text.encode(), pattern, case_sensitivity, 'first', None, algorithm
+                        ), expected)
+                        self.assertEqual(bytes_search.bytes_search(
+                            text.encode(), pattern, case_sensitivity, 'last', None, algorithm
+                        ), expected[::-1] if expected else None)
+
+    def test_char_offsets(self):
+        """Тест перевода байтовых смещений в номера символов"""
+        text = 'Привет, world! Ещё world'
+        data = text.encode('utf-8')
+        self.assertEqual(bytes_search.bytes_search(data, 'world'), (14, 28))
+        self.assertEqual(bytes_search.bytes_search(data, 'world', char_offsets=True),
+                         (8, 19))
+        self.assertEqual(bytes_search.bytes_search(data, ['WORLD', 'ещё'], method='last',
+                                                   count=1, char_offsets=True),
+                         {'WORLD': (19, ), 'ещё': None})
+        self.assertEqual(bytes_search.utf8_char_offsets(data, [0, 2, 14, 28], block_size=3),
+                         [0, 1, 8, 19])
+
+    def test_mmap(self):
+        """Тест поиска в файле через mmap"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'text.txt')
+            with open(path, 'wb') as f:
+                f.write(b'abc ABC abc')
+            self.assertEqual(bytes_search.mmap_search(path, 'abc', count=2), (0, 4))
+            self.assertEqual(bytes_search.mmap_search(path, 'abc', True, 'last'), (8, 0))
+            open(path, 'wb').close()  # pylint: disable=R1732
+            self.assertIsNone(bytes_search.mmap_search(path, 'abc'))
+
+    @unittest.skipIf(bytes_search.numpy is None, "numpy is not installed")
+    def test_rabin_karp_numpy(self):
+        """Тест векторизованного Рабина-Карпа на границах блоков"""
+        rng = random.Random(1)
+        for _ in range(200):
+            text = bytes(rng.choice(b'abAB') for _ in range(rng.randrange(40)))
+            patterns = [bytes(rng.choice(b'abAB') for _ in range(3)) for _ in range(3)]
+            for fold in (bytes_search.IDENTITY, bytes_search.ASCII_FOLD):
+                expected = sorted({(i, pattern) for pattern in patterns for i in range(len(text))
+                                   if text[i:i + 3].translate(fold) == pattern.translate(fold)})
+                for reverse in (False, True):
+                    with self.subTest(text=text, patterns=patterns, reverse=reverse):
+                        found = list(bytes_search.rabin_karp_numpy_iter(
+                            text, patterns, fold, reverse, block_size=7
+                        ))
+                        self.assertEqual(sorted(found), expected)
+                        self.assertEqual([i for i, _ in found],
+                                         sorted((i for i, _ in found), reverse=reverse))
@@ -1,5 +1,6 @@
 """Тесты для модуля search"""
 
+import random
 import unittest
 
 import search  # pylint: disable=E0401
@@ -125,4 +126,51 @@ class TestSearch(unittest.TestCase):
                     ),
                     expected
                 )
-                
\ No newline at end of file
+                
+    def test_aho_corasick(self):
+        """Тест поиска всех подстрок за один проход Ахо-Корасик"""
+        for algorithm in ('ac', 'auto'):
+            for table in (TEST_SEARCH_ONE_SYMBOL, TEST_SEARCH_MANY_SYMBOL, TEST_SEARCH_FEW_SUBSTR):
+                for string, sub_string, case_sensitivity, method, count, expected in table:
+                    with self.subTest(algorithm=algorithm, string=string, sub_string=sub_string):
+                        self.assertEqual(
+                            search.search(
+                                string, sub_string, case_sensitivity, method, count, algorithm
+                            ),
+                            expected
+                        )
+
+    def test_rabin_karp(self):
+        """Тест Рабина-Карпа по группам подстрок одной длины"""
+        for table in (TEST_SEARCH_ONE_SYMBOL, TEST_SEARCH_MANY_SYMBOL, TEST_SEARCH_FEW_SUBSTR):
+            for string, sub_string, case_sensitivity, method, count, expected in table:
+                with self.subTest(string=string, sub_string=sub_string):
+                    self.assertEqual(
+                        search.search(
+                            string, sub_string, case_sensitivity, method, count, 'rk'
+                        ),
+                        expected
+                    )
+
+    def test_unknown(self):
+        """Тест неизвестных алгоритма и метода"""
+        with self.assertRaises(ValueError):
+            search.search('abc', 'a', algorithm='zz')
+        with self.assertRaises(ValueError):
+            search.search('abc', ['a', 'b'], method='middle', algorithm='ac')
+
+    def test_parallel_search(self):
+        """Тест параллельного поиска по частям текста"""
+        rng = random.Random(0)
+        text = ''.join(rng.choice('abAB') for _ in range(500))
+        for algorithm in ('kmp', 'bm', 'rk', 'bmh', 'ac'):
+            for sub_strings in ('ab', ('aba', 'bb', 'abab')):
+                for method, count in (('first', None), ('last', None), ('first', 3), ('last', 2)):
+                    with self.subTest(algorithm=algorithm, sub_strings=sub_strings,
+                                      method=method, count=count):
+                        self.assertEqual(
+                            search.parallel_search(text, sub_strings, False, method, count,
+                                                   algorithm, jobs=2, chunk_size=37),
+                            search.search(text, sub_strings, False, method, count, algorithm)
+                        )
+        self.assertIsNone(search.parallel_search('', 'a', jobs=2))